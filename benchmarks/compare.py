@@ -0,0 +1,98 @@
+"""
+Compare two benchmark result files, e.g. from a base commit and a branch.
+
+Usage::
+
+    python benchmarks/compare.py base.json head.json --threshold 1.2
+
+Exits with status 1 when any case got slower or grew its memory use (the
+RSS increase over the interpreter's baseline) by more than ``threshold``
+times the base run, when a case that succeeded in the base run errors or
+times out, or when a case of the base run is missing.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+
+def _load(path: Path) -> Tuple[dict, Dict[Tuple[str, int], dict]]:
+    report = json.loads(path.read_text())
+    results = {(r["case"], r["rows"]): r for r in report["results"]}
+    return report["metadata"], results
+
+
+# Memory increases below this are treated as equal, being allocator noise
+MEMORY_FLOOR_BYTES = 1024**2
+
+
+def _ratio(head: float, base: float) -> float:
+    if not base:
+        return float("inf") if head else 1.0
+    return head / base
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="Ratio of head to base above which a case counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    base_meta, base = _load(args.base)
+    head_meta, head = _load(args.head)
+    base_name = base_meta.get("commit") or args.base
+    head_name = head_meta.get("commit") or args.head
+    print(f"base {base_name}  head {head_name}")
+    print(
+        f"{'case':<24} {'rows':>11}  {'base s':>9} {'head s':>9} {'time':>6}  {'memory':>6}"
+    )
+
+    regressions = []
+    for key in sorted(base.keys() & head.keys(), key=lambda k: (k[1], k[0])):
+        case, rows = key
+        b, h = base[key], head[key]
+        if b["status"] != "ok" or h["status"] != "ok":
+            flag = ""
+            if b["status"] == "ok":
+                regressions.append(key)
+                flag = "  REGRESSION"
+            print(f"{case:<24} {rows:>11,}  {b['status']:>9} {h['status']:>9}{flag}")
+            continue
+
+        time_ratio = _ratio(h["seconds"], b["seconds"])
+        memory_ratio = _ratio(
+            max(h["rss_increase_bytes"], MEMORY_FLOOR_BYTES),
+            max(b["rss_increase_bytes"], MEMORY_FLOOR_BYTES),
+        )
+        flag = ""
+        if time_ratio > args.threshold or memory_ratio > args.threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(
+            f"{case:<24} {rows:>11,}  {b['seconds']:>9.4f} {h['seconds']:>9.4f} "
+            f"{time_ratio:>5.2f}x  {memory_ratio:>5.2f}x{flag}"
+        )
+
+    for key in sorted(base.keys() ^ head.keys()):
+        if key in base:
+            # A case that disappeared can no longer be compared
+            regressions.append(key)
+            print(f"{key[0]:<24} {key[1]:>11,}  only in base  REGRESSION")
+        else:
+            print(f"{key[0]:<24} {key[1]:>11,}  only in head")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) at threshold {args.threshold:.2f}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Seeded synthetic data generators for the benchmark suite.
+
+All randomness comes from hashing a row index with a seed inside Polars, so
+frames of up to 10^8 rows are generated in parallel without numpy and are
+identical across runs and machines for the same Polars version.
+"""
+import polars as pl
+
+def _random_u64(n_rows: int, seed: int) -> pl.Expr:
+    return pl.int_range(n_rows, dtype=pl.UInt64).hash(seed)
+
+
+def uniform(n_rows: int, seed: int) -> pl.Expr:
+    """Uniform floats in [0, 1)."""
+    return (_random_u64(n_rows, seed) // (1 << 11)).cast(pl.Float64) / float(1 << 53)
+
+
+def wide_frame(n_rows: int, n_cols: int = 50, seed: int = 0) -> pl.DataFrame:
+    """Many integer, float and short string columns of moderate cardinality."""
+    columns = {}
+    for i in range(n_cols):
+        values = _random_u64(n_rows, seed + i)
+        if i % 3 == 0:
+            columns[f"int_{i}"] = (values % 10_000).cast(pl.Int64)
+        elif i % 3 == 1:
+            columns[f"float_{i}"] = uniform(n_rows, seed + i) * 1000
+        else:
+            columns[f"str_{i}"] = pl.format("v{}", values % 1000)
+    return pl.select(**columns)
+
+
+def high_cardinality_keys(n_rows: int, seed: int = 0) -> pl.DataFrame:
+    """Nearly unique integer and string keys with a payload column."""
+    key = _random_u64(n_rows, seed) % (n_rows * 4)
+    return pl.select(
+        **{
+            "key": key.cast(pl.Int64),
+            "key_str": pl.format("K{}", key),
+            "value": uniform(n_rows, seed + 1),
+        }
+    )
+
+
+def skewed_keys(n_rows: int, n_keys: int = 10_000, seed: int = 0) -> pl.DataFrame:
+    """
+    Keys with a heavy-tailed frequency distribution.
+
+    ``n_keys ** u`` for uniform ``u`` makes small keys far more common than
+    large ones, like customer or product ids in fact tables.
+    """
+    key = (pl.lit(float(n_keys)).pow(uniform(n_rows, seed))).floor().cast(pl.Int64)
+    return pl.select(
+        **{
+            "key": key,
+            "key_str": pl.format("K{}", key),
+            "value": uniform(n_rows, seed + 1),
+        }
+    )
+
+
+def long_strings(
+    n_rows: int,
+    n_words: int = 40,
+    email_fraction: float = 0.01,
+    pool_size: int = 65_536,
+    seed: int = 0,
+) -> pl.DataFrame:
+    """
+    Free text of ``n_words`` words per row with occasional email addresses.
+
+    Rows are drawn from a pool of ``pool_size`` distinct texts; building
+    every row from scratch costs far more than the APIs being measured.
+    """
+    pool_rows = min(n_rows, pool_size)
+    words = [
+        (_random_u64(pool_rows, seed + i) % 5000).cast(pl.Utf8) for i in range(n_words)
+    ]
+    is_email = uniform(pool_rows, seed + n_words) < email_fraction
+    user = _random_u64(pool_rows, seed + n_words + 1) % 100_000
+    text = pl.concat_str(words, separator=" ")
+    pool = pl.select(
+        pl.when(is_email)
+        .then(pl.format("{} user{}@example.com", text, user))
+        .otherwise(text)
+    ).to_series()
+
+    rows = pl.select(_random_u64(n_rows, seed + n_words + 2) % pool_rows).to_series()
+    return pl.DataFrame(
+        {
+            "text": pool.gather(rows),
+            "code": pl.select(
+                pl.format("AB-{}", _random_u64(n_rows, seed + n_words + 3) % 1_000_000)
+            ).to_series(),
+            "amount": pl.select(uniform(n_rows, seed + n_words + 4) * 100).to_series(),
+        }
+    )
+
+
+GENERATORS = {
+    "wide": wide_frame,
+    "high_cardinality": high_cardinality_keys,
+    "skewed": skewed_keys,
+    "long_strings": long_strings,
+}
@@ -0,0 +1,262 @@
+"""
+Run the polars-utils benchmark suite and write the results as JSON.
+
+Every case runs in a fresh subprocess, so no case warms caches for another.
+Peak memory is measured around the timed calls only: on Linux the peak RSS
+is reset once the input is built, so ``rss_increase_bytes`` is the timed
+calls' peak above the resident input. Elsewhere the process-wide
+``ru_maxrss`` is used, and a case peaking below its input generation
+reports no increase.
+
+Usage::
+
+    python benchmarks/run.py --sizes 1e3 1e4 1e5 --output results.json
+    python benchmarks/run.py --cases regex_search profile_wide --sizes 1e6 1e7
+"""
+import argparse
+import datetime
+import gc
+import json
+import platform
+import re
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+import polars as pl
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generators import (  # pylint: disable=wrong-import-position
+    high_cardinality_keys,
+    long_strings,
+    skewed_keys,
+    wide_frame,
+)
+
+from polars_utils import (  # pylint: disable=wrong-import-position
+    HistogramSketch,
+    QuantileSketch,
+    register_extensions,
+    search_catalog,
+)
+
+EMAIL_PATTERN = r"user\d+@example\.com"
+
+
+def _analyze_joins_skewed(n_rows: int, seed: int) -> Callable[[], object]:
+    left = skewed_keys(n_rows, seed=seed)
+    right = high_cardinality_keys(max(n_rows // 10, 1), seed=seed + 1)
+    return lambda: left.polars_utils.analyze_joins(right)
+
+
+def _analyze_joins_wide(n_rows: int, seed: int) -> Callable[[], object]:
+    left = wide_frame(n_rows, n_cols=10, seed=seed)
+    right = wide_frame(max(n_rows // 10, 1), n_cols=10, seed=seed + 100)
+    return lambda: left.polars_utils.analyze_joins(right)
+
+
+def _regex_search(n_rows: int, seed: int) -> Callable[[], object]:
+    df = long_strings(n_rows, seed=seed)
+    return lambda: df.polars_utils.regex_search(EMAIL_PATTERN)
+
+
+def _build_search_index(n_rows: int, seed: int) -> Callable[[], object]:
+    df = long_strings(n_rows, seed=seed)
+    return df.polars_utils.build_search_index
+
+
+def _regex_search_indexed(n_rows: int, seed: int) -> Callable[[], object]:
+    df = long_strings(n_rows, seed=seed)
+    index = df.polars_utils.build_search_index()
+    return lambda: df.polars_utils.regex_search(EMAIL_PATTERN, index=index)
+
+
+def _search_catalog(n_rows: int, seed: int) -> Callable[[], object]:
+    sources = {f"table_{i}": long_strings(n_rows, seed=seed + i) for i in range(4)}
+    return lambda: search_catalog(EMAIL_PATTERN, sources)
+
+
+def _create_histogram(n_rows: int, seed: int) -> Callable[[], object]:
+    df = skewed_keys(n_rows, seed=seed).with_columns(group=pl.col("key") % 100)
+    return lambda: df.group_by("group").agg(
+        pl.col("value").polars_utils.create_histogram()
+    )
+
+
+def _profile_wide(n_rows: int, seed: int) -> Callable[[], object]:
+    df = wide_frame(n_rows, seed=seed)
+    return df.polars_utils.profile
+
+
+def _profile_strings(n_rows: int, seed: int) -> Callable[[], object]:
+    df = long_strings(n_rows, seed=seed)
+    return lambda: df.polars_utils.profile(histogram=True)
+
+
+def _sketches(n_rows: int, seed: int) -> Callable[[], object]:
+    values = skewed_keys(n_rows, seed=seed)["value"]
+    return lambda: (
+        HistogramSketch.from_series(values, (0.0, 1.0)),
+        QuantileSketch.from_series(values),
+    )
+
+
+# Each case builds its input outside the timed region and returns the call to time
+CASES: Dict[str, Callable[[int, int], Callable[[], object]]] = {
+    "analyze_joins_skewed": _analyze_joins_skewed,
+    "analyze_joins_wide": _analyze_joins_wide,
+    "regex_search": _regex_search,
+    "build_search_index": _build_search_index,
+    "regex_search_indexed": _regex_search_indexed,
+    "search_catalog": _search_catalog,
+    "create_histogram": _create_histogram,
+    "profile_wide": _profile_wide,
+    "profile_strings": _profile_strings,
+    "sketches": _sketches,
+}
+
+
+def _max_rss_bytes() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _proc_status_bytes(field: str) -> int:
+    status = Path("/proc/self/status").read_text(encoding="utf-8")
+    return int(re.search(rf"^{field}:\s+(\d+) kB", status, re.MULTILINE).group(1)) * 1024
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the peak RSS to the current RSS, where the OS allows it (Linux)."""
+    try:
+        Path("/proc/self/clear_refs").write_text("5", encoding="utf-8")
+    except OSError:
+        return False
+    return True
+
+
+def run_case(case: str, n_rows: int, seed: int, repeat: int) -> dict:
+    """Time one case in the current process."""
+    register_extensions()
+    call = CASES[case](n_rows, seed)
+    gc.collect()
+    # Without a reset, the generator's peak can hide the timed calls' peak
+    peak_was_reset = _reset_peak_rss()
+    baseline_rss = _proc_status_bytes("VmRSS") if peak_was_reset else _max_rss_bytes()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+
+    peak_rss = _proc_status_bytes("VmHWM") if peak_was_reset else _max_rss_bytes()
+    return {
+        "seconds": min(timings),
+        "seconds_all": timings,
+        "peak_rss_bytes": peak_rss,
+        "rss_increase_bytes": peak_rss - baseline_rss,
+    }
+
+
+def _run_in_subprocess(
+    case: str, n_rows: int, seed: int, repeat: int, timeout: float
+) -> dict:
+    command = [
+        sys.executable,
+        __file__,
+        "--worker",
+        case,
+        str(n_rows),
+        "--seed",
+        str(seed),
+        "--repeat",
+        str(repeat),
+    ]
+    try:
+        completed = subprocess.run(
+            command, capture_output=True, text=True, timeout=timeout, check=False
+        )
+    except subprocess.TimeoutExpired:
+        return {"status": "timeout"}
+
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()
+        return {"status": "error", "error": error[-1] if error else ""}
+    return {"status": "ok", **json.loads(completed.stdout.strip().splitlines()[-1])}
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+            check=False,
+        ).stdout.strip()
+    except OSError:
+        return ""
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=float,
+        default=[1e3, 1e4, 1e5],
+        help="Row counts, from 1e3 up to 1e8",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=600.0, help="Seconds per case")
+    parser.add_argument("--output", type=Path, default=Path("benchmark-results.json"))
+    parser.add_argument("--worker", nargs=2, metavar=("CASE", "ROWS"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        case, n_rows = args.worker
+        print(json.dumps(run_case(case, int(n_rows), args.seed, args.repeat)))
+        return 0
+
+    results = []
+    for n_rows in sorted({int(size) for size in args.sizes}):
+        for case in args.cases:
+            result = _run_in_subprocess(case, n_rows, args.seed, args.repeat, args.timeout)
+            results.append({"case": case, "rows": n_rows, **result})
+
+            if result["status"] == "ok":
+                summary = (
+                    f"{result['seconds']:.4f}s  "
+                    f"peak {result['peak_rss_bytes'] / 1024**2:.0f} MiB"
+                )
+            else:
+                summary = result["status"]
+            print(f"{case:<24} {n_rows:>11,}  {summary}", flush=True)
+
+    report = {
+        "metadata": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "polars": pl.__version__,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
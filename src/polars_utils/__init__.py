@@ -1,3 +1,24 @@
-from .extensions import register_extensions
+from .extensions import TimeBudgetExceeded, register_extensions
+from .search_index import SearchIndex, build_search_index
+from .catalog import search_catalog
+from .cache import ResultCache
+from .sketches import HistogramSketch, QuantileSketch
+from .stats import ColumnStats, parquet_column_stats, profile_parquet
+from .keys import key_scores
+from .bloom import BloomFilter
 
-__all__ = ["register_extensions"]
+__all__ = [
+    "register_extensions",
+    "TimeBudgetExceeded",
+    "SearchIndex",
+    "build_search_index",
+    "search_catalog",
+    "ResultCache",
+    "HistogramSketch",
+    "QuantileSketch",
+    "ColumnStats",
+    "parquet_column_stats",
+    "profile_parquet",
+    "key_scores",
+    "BloomFilter",
+]
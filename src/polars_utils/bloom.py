@@ -0,0 +1,209 @@
+import math
+import operator
+import polars as pl
+from functools import reduce
+from typing import Callable, Optional, Tuple
+
+# Bits of filter per distinct key and bits set per key; about 1-2% false
+# positives for a filter built to size
+BITS_PER_KEY = 10
+N_HASHES = 7
+
+# Rows hashed at a time while building or probing, bounding intermediates
+CHUNK_ROWS = 1_000_000
+
+# Columns with fewer non-null rows are matched exactly even in approximate mode
+BLOOM_MIN_ROWS = 100_000
+
+_BLOCK_SEED = 0
+_BIT_SEED = 1
+_WORD_BITS = 64
+
+# Lookup table of single-bit masks, indexed by bit position
+_POWERS = pl.Series("powers", [1 << i for i in range(_WORD_BITS)], dtype=pl.UInt64)
+
+
+def _hashable(values: pl.Series) -> pl.Series:
+    """Drop nulls and cast dictionary-encoded values so hashes don't depend on the encoding."""
+    values = values.drop_nulls()
+    if values.dtype in (pl.Categorical, pl.Enum):
+        values = values.cast(pl.Utf8)
+    return values
+
+
+def common_dtype(left: pl.Series, right: pl.Series) -> pl.DataType:
+    """
+    Dtype both sides are cast to before hashing, since equal values of
+    different dtypes hash differently. Falls back to strings when the
+    dtypes have no common supertype.
+    """
+    frames = [
+        _hashable(values.head(0)).to_frame("values") for values in (left, right)
+    ]
+    try:
+        return pl.concat(frames, how="vertical_relaxed")["values"].dtype
+    except pl.exceptions.PolarsError:
+        return pl.Utf8
+
+
+def _block_masks(values: pl.Series, n_blocks: int, n_hashes: int) -> pl.DataFrame:
+    """
+    Hash values to a block index and a mask of up to ``n_hashes`` bits in it.
+
+    One hash picks the block; consecutive 6-bit slices of a second hash
+    pick the bit positions, whose single-bit masks are OR-ed together.
+    """
+    hashes = pl.DataFrame(
+        {"block": values.hash(_BLOCK_SEED), "bits": values.hash(_BIT_SEED)}
+    )
+    masks = [
+        pl.lit(_POWERS).gather(pl.col("bits") // _WORD_BITS**i % _WORD_BITS)
+        for i in range(n_hashes)
+    ]
+    return hashes.select(
+        block=pl.col("block") % n_blocks,
+        mask=reduce(operator.or_, masks),
+    )
+
+
+class BloomFilter:
+    """
+    Blocked Bloom filter over the values of a column.
+
+    Every key sets ``n_hashes`` bits within one 64-bit word, so a lookup
+    reads a single word. Building and probing are vectorized in Polars and
+    run in chunks of ``CHUNK_ROWS`` rows; the filter itself takes about
+    ``BITS_PER_KEY`` bits per distinct key.
+    """
+
+    def __init__(self, words: pl.Series, n_hashes: int = N_HASHES):
+        self.words = words
+        self.n_hashes = n_hashes
+
+    @classmethod
+    def from_series(
+        cls,
+        values: pl.Series,
+        n_keys: int,
+        bits_per_key: int = BITS_PER_KEY,
+        n_hashes: int = N_HASHES,
+    ) -> "BloomFilter":
+        """
+        Build a filter holding the non-null values of a column.
+
+        Parameters
+        ----------
+        values : pl.Series
+            Values to insert
+        n_keys : int
+            Expected number of distinct values, e.g. from ``approx_n_unique``
+        bits_per_key : int, default 10
+            Filter bits per expected key
+        n_hashes : int, default 7
+            Bits set per key, at most 10
+        """
+        n_blocks = max(math.ceil(n_keys * bits_per_key / _WORD_BITS), 1)
+        words = pl.zeros(n_blocks, dtype=pl.UInt64, eager=True).alias("words")
+        values = _hashable(values)
+
+        for offset in range(0, len(values), CHUNK_ROWS):
+            chunk = _block_masks(values.slice(offset, CHUNK_ROWS), n_blocks, n_hashes)
+            blocks = chunk.group_by("block").agg(pl.col("mask").bitwise_or())
+            words = words.scatter(
+                blocks["block"], words.gather(blocks["block"]) | blocks["mask"]
+            )
+        return cls(words, n_hashes)
+
+    @property
+    def n_blocks(self) -> int:
+        return len(self.words)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the filter in bytes."""
+        return self.words.estimated_size()
+
+    @property
+    def false_positive_rate(self) -> float:
+        """
+        Expected chance that an absent value is reported as present.
+
+        Computed from how full each block is, so it holds for the filter as
+        built rather than for its nominal size.
+        """
+        fill = self.words.bitwise_count_ones().cast(pl.Float64) / _WORD_BITS
+        return float((fill**self.n_hashes).mean())
+
+    def contains(self, values: pl.Series) -> pl.Series:
+        """Whether each non-null value may be in the filter; never false for members."""
+        values = _hashable(values)
+        probes = _block_masks(values, self.n_blocks, self.n_hashes)
+        return probes.select(
+            (pl.lit(self.words).gather(pl.col("block")) & pl.col("mask"))
+            == pl.col("mask")
+        ).to_series()
+
+    def count_matches(self, values: pl.Series) -> int:
+        """
+        Count non-null values that may be in the filter.
+
+        Values are probed in chunks of ``CHUNK_ROWS``. The count is an upper
+        estimate: on average ``false_positive_rate`` of the absent values
+        are counted too.
+        """
+        values = _hashable(values)
+        return sum(
+            self.contains(values.slice(offset, CHUNK_ROWS)).sum()
+            for offset in range(0, len(values), CHUNK_ROWS)
+        )
+
+
+def needs_filter(values: pl.Series) -> bool:
+    """Whether a column is large enough to be matched through a Bloom filter."""
+    return len(values) - values.null_count() >= BLOOM_MIN_ROWS
+
+
+def bloom_match_counts(
+    left: pl.Series,
+    right: pl.Series,
+    build_filter: Callable[[str, pl.Series], BloomFilter],
+) -> Tuple[int, int, Optional[float]]:
+    """
+    Count rows of each side with a match on the other side.
+
+    Both columns are first cast to their common dtype (see
+    ``common_dtype``). Large columns (see ``needs_filter``) are then
+    represented by a Bloom filter from ``build_filter(side, values)``, so
+    callers can reuse one filter across pairs by side, column and dtype;
+    the other column is probed against it. Small columns are matched
+    exactly against their distinct values.
+
+    Returns
+    -------
+    tuple
+        Left and right matched rows and the largest false-positive rate of
+        the filters used, ``None`` if no filter was needed
+    """
+    dtype = common_dtype(left, right)
+    left, right = (
+        _hashable(values).cast(dtype, strict=False) for values in (left, right)
+    )
+    rates = []
+
+    def matched(values: pl.Series, other: pl.Series, other_side: str) -> int:
+        if needs_filter(other):
+            bloom = build_filter(other_side, other)
+            rates.append(bloom.false_positive_rate)
+            return bloom.count_matches(values)
+        return int(values.is_in(other.drop_nulls().unique()).sum())
+
+    left_matched = matched(left, right, "right")
+    right_matched = matched(right, left, "left")
+    return left_matched, right_matched, max(rates) if rates else None
+
+
+def estimated_filter_bytes(n_keys: int, bits_per_key: int = BITS_PER_KEY) -> int:
+    """Bytes a filter for ``n_keys`` keys takes, plus hashing one chunk."""
+    filter_bytes = math.ceil(n_keys * bits_per_key / _WORD_BITS) * 8
+    chunk_bytes = min(n_keys, CHUNK_ROWS) * 4 * 8
+    return filter_bytes + chunk_bytes
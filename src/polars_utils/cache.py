@@ -0,0 +1,223 @@
+import copy
+import sys
+import threading
+import polars as pl
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+def _hashable_exprs(expr: pl.Expr, dtype: pl.DataType) -> List[pl.Expr]:
+    """Split a column into expressions that polars can hash directly."""
+    if isinstance(dtype, pl.List):
+        return [expr.list.len()] + _hashable_exprs(expr.list.explode(), dtype.inner)
+    if isinstance(dtype, pl.Array):
+        return [expr.is_null()] + _hashable_exprs(expr.arr.explode(), dtype.inner)
+    if isinstance(dtype, pl.Struct):
+        exprs = [expr.is_null()]
+        for field in dtype.fields:
+            exprs += _hashable_exprs(expr.struct.field(field.name), field.dtype)
+        return exprs
+    if dtype in (pl.Categorical, pl.Enum):
+        # Physical codes depend on the encoding, not on the values
+        return [expr.cast(pl.Utf8)]
+    return [expr]
+
+
+def frame_fingerprint(df: pl.DataFrame) -> Tuple:
+    """
+    Cheap fingerprint of a DataFrame's schema and contents.
+
+    Each column buffer is reduced to an order-sensitive 64-bit hash, all in
+    one fused ``select``, so fingerprinting is a single vectorized pass
+    rather than a row-wise comparison. Nested columns are hashed through
+    their lengths and child values. Two frames with the same fingerprint
+    are treated as identical.
+    """
+    schema = tuple((name, str(dtype)) for name, dtype in df.schema.items())
+    exprs = [
+        part
+        for name, dtype in df.schema.items()
+        for part in _hashable_exprs(pl.col(name), dtype)
+    ]
+    if not exprs:
+        return (schema, df.height, ())
+
+    hashes = df.select(
+        expr.hash(seed=0).implode().hash(seed=0).alias(str(i))
+        for i, expr in enumerate(exprs)
+    ).row(0)
+    return (schema, df.height, hashes)
+
+
+def estimate_size(value: Any) -> int:
+    """Rough size in bytes of a cached result."""
+    if isinstance(value, pl.DataFrame):
+        return value.estimated_size()
+    if isinstance(value, pl.Series):
+        return value.estimated_size()
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    if is_dataclass(value):
+        return sys.getsizeof(value) + sum(
+            estimate_size(getattr(value, f.name)) for f in fields(value)
+        )
+    return sys.getsizeof(value)
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    nbytes: int
+    fingerprints: Tuple
+
+
+class ResultCache:
+    """
+    In-process LRU cache for analysis results keyed by frame fingerprints.
+
+    Pass an instance as ``cache=`` to ``regex_search`` or ``analyze_joins``
+    to return previously computed results for unchanged frames. Entries are
+    evicted least-recently-used first once either ``max_entries`` or
+    ``max_bytes`` is exceeded.
+
+    Parameters
+    ----------
+    max_entries : int, default 128
+        Maximum number of cached results
+    max_bytes : int, optional
+        Maximum estimated size of all cached results. Default is 256 MiB.
+        Results larger than this are never cached.
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: Optional[int] = 256 * 1024**2):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated size of all cached results in bytes."""
+        return self._nbytes
+
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and eviction counters together with the current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self),
+            "bytes": self.nbytes,
+        }
+
+    def get_or_compute(
+        self,
+        operation: str,
+        frames: Tuple[pl.DataFrame, ...],
+        arguments: Tuple,
+        compute: Callable[[], Any],
+    ) -> Any:
+        """
+        Return the cached result of an operation or compute and store it.
+
+        Parameters
+        ----------
+        operation : str
+            Name of the cached operation
+        frames : Tuple[pl.DataFrame, ...]
+            Input frames the result depends on
+        arguments : Tuple
+            Hashable call arguments that affect the result
+        compute : Callable
+            Function producing the result on a cache miss
+        """
+        fingerprints = tuple(frame_fingerprint(df) for df in frames)
+        key = (operation, fingerprints, arguments)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._copy(entry.value)
+            self.misses += 1
+
+        value = compute()
+        nbytes = estimate_size(value)
+
+        with self._lock:
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                return value
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _CacheEntry(value, nbytes, fingerprints)
+            self._nbytes += nbytes
+            self._evict()
+
+        return self._copy(value)
+
+    def invalidate(self, df: Optional[pl.DataFrame] = None) -> int:
+        """
+        Drop cached results.
+
+        Parameters
+        ----------
+        df : pl.DataFrame, optional
+            Only drop results computed from this frame. Drops everything if
+            not given.
+
+        Returns
+        -------
+        int
+            Number of entries removed
+        """
+        with self._lock:
+            if df is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._nbytes = 0
+                return removed
+
+            fingerprint = frame_fingerprint(df)
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if fingerprint in entry.fingerprints
+            ]
+            for key in stale:
+                self._remove(key)
+            return len(stale)
+
+    def clear(self):
+        """Drop all cached results and reset the counters."""
+        self.invalidate()
+        self.hits = self.misses = self.evictions = 0
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._nbytes -= entry.nbytes
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._nbytes > self.max_bytes
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        # Hand out copies so callers can't modify the cached result
+        if isinstance(value, pl.DataFrame):
+            return value.clone()
+        return copy.deepcopy(value)
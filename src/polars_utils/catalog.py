@@ -0,0 +1,239 @@
+import polars as pl
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Mapping, Optional, Union
+
+from .search import (
+    search_result_frame,
+    search_column,
+    concat_search_results,
+    nested_search_exprs,
+    nested_search_results,
+    search_nested_column,
+)
+from .search_index import anchored_prefix
+
+CatalogSource = Union[pl.DataFrame, pl.LazyFrame, str, Path]
+
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+IPC_SUFFIXES = {".ipc", ".arrow", ".feather"}
+
+
+def _row_group_can_match(statistics, num_rows: int, prefix: Optional[str]) -> bool:
+    """Whether a row group may contain a value matching the pattern."""
+    if statistics is None:
+        return True
+
+    if statistics.has_null_count and statistics.null_count == num_rows:
+        return False
+
+    if prefix is None or not statistics.has_min_max:
+        return True
+    if not isinstance(statistics.min, str) or not isinstance(statistics.max, str):
+        return True
+
+    # Every value starting with the prefix sorts between the prefix itself
+    # and the first string greater than the prefix that doesn't start with it
+    if statistics.max < prefix:
+        return False
+    if statistics.min > prefix and not statistics.min.startswith(prefix):
+        return False
+    return True
+
+
+def parquet_row_groups(path: Union[str, Path], pattern: str) -> Optional[dict]:
+    """
+    Select the row groups of each column that may contain matches.
+
+    Uses Parquet min/max and null count statistics to skip row groups that
+    are entirely null or, for patterns anchored with a literal prefix, whose
+    string range can't contain the prefix.
+
+    Returns
+    -------
+    dict or None
+        Mapping of column name to the list of row groups to scan, or None if
+        pyarrow is not installed.
+    """
+    try:
+        import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+
+    prefix = anchored_prefix(pattern)
+    metadata = pq.ParquetFile(path).metadata
+    groups: dict = {}
+
+    for i in range(metadata.num_columns):
+        column = metadata.schema.column(i)
+        # Only top-level leaf columns map directly to a DataFrame column
+        if "." in column.path:
+            continue
+        groups[column.path] = [
+            rg
+            for rg in range(metadata.num_row_groups)
+            if _row_group_can_match(
+                metadata.row_group(rg).column(i).statistics,
+                metadata.row_group(rg).num_rows,
+                prefix,
+            )
+        ]
+
+    return groups
+
+
+def _search_lazy(
+    lf: pl.LazyFrame, pattern: str, matches_only: bool
+) -> pl.DataFrame:
+    """Search every column of a LazyFrame, collecting all columns together."""
+    schema = lf.collect_schema()
+    nested = {
+        col: nested_search_exprs(col, dtype, pattern)
+        for col, dtype in schema.items()
+        if dtype.is_nested()
+    }
+    queries = []
+    for col in schema.names():
+        if col in nested:
+            # One aggregating query per nested column, walking its leaves
+            queries.append(lf.select(e for _, *pair in nested[col] for e in pair))
+        else:
+            queries.append(
+                lf.select(pl.col(col).cast(pl.Utf8())).filter(
+                    pl.col(col).str.contains(pattern)
+                )
+            )
+    row_count, *results = pl.collect_all([lf.select(pl.len())] + queries)
+
+    dfs = []
+    for col, found in zip(schema.names(), results):
+        if col in nested:
+            leaves = nested_search_results(found, nested[col])
+        else:
+            leaves = [(col, found.get_column(col), found.height)]
+
+        for path, matches, rows_matched in leaves:
+            if len(matches) == 0:
+                if matches_only:
+                    continue
+                matches = None
+            dfs.append(
+                search_result_frame(
+                    path, matches, row_count.item(), rows_matched=rows_matched
+                )
+            )
+    return concat_search_results(dfs)
+
+
+def _search_parquet(path: Path, pattern: str, matches_only: bool) -> pl.DataFrame:
+    """Search a Parquet file, skipping row groups ruled out by statistics."""
+    groups = parquet_row_groups(path, pattern)
+    if groups is None:
+        return _search_lazy(pl.scan_parquet(path), pattern, matches_only)
+
+    import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+    parquet_file = pq.ParquetFile(path)
+    n_groups = parquet_file.metadata.num_row_groups
+    row_count = parquet_file.metadata.num_rows
+
+    lf = pl.scan_parquet(path)
+    dfs = []
+    for col, dtype in lf.collect_schema().items():
+        kept = groups.get(col)
+        if dtype.is_nested():
+            # Nested columns have no usable statistics; walk their leaves
+            leaves = search_nested_column(lf.select(col).collect(), col, pattern)
+        else:
+            if kept is None or len(kept) == n_groups:
+                series = lf.select(col).collect().get_column(col)
+            elif kept:
+                table = parquet_file.read_row_groups(kept, columns=[col])
+                series = pl.from_arrow(table).get_column(col)
+            else:
+                series = pl.Series(col, [], dtype=pl.Utf8())
+            matches = search_column(series, pattern)
+            leaves = [(col, matches, len(matches))]
+
+        for leaf, matches, rows_matched in leaves:
+            if len(matches) == 0:
+                if matches_only:
+                    continue
+                matches = None
+            dfs.append(
+                search_result_frame(leaf, matches, row_count, rows_matched=rows_matched)
+            )
+
+    return concat_search_results(dfs)
+
+
+def _search_source(
+    source: CatalogSource, pattern: str, matches_only: bool
+) -> pl.DataFrame:
+    """Search a single catalog source of any supported kind."""
+    if isinstance(source, pl.DataFrame):
+        return _search_lazy(source.lazy(), pattern, matches_only)
+    if isinstance(source, pl.LazyFrame):
+        return _search_lazy(source, pattern, matches_only)
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        suffix = path.suffix.lower()
+        if suffix in PARQUET_SUFFIXES:
+            return _search_parquet(path, pattern, matches_only)
+        if suffix in IPC_SUFFIXES:
+            return _search_lazy(
+                pl.scan_ipc(path, memory_map=True), pattern, matches_only
+            )
+        raise ValueError(f"Unsupported file type for catalog search: {path}")
+    raise TypeError(f"Unsupported catalog source type: {type(source).__name__}")
+
+
+def search_catalog(
+    pattern: str,
+    sources: Mapping[str, CatalogSource],
+    matches_only: bool = False,
+    max_workers: Optional[int] = None,
+) -> pl.DataFrame:
+    """
+    Search many DataFrames, LazyFrames or files for a regex pattern in parallel.
+
+    Parameters
+    ----------
+    pattern : str
+        Regular expression pattern to search for
+    sources : Mapping[str, DataFrame | LazyFrame | str | Path]
+        Named sources to search. Paths may point to Parquet (``.parquet``,
+        ``.pq``) or Arrow IPC (``.ipc``, ``.arrow``, ``.feather``) files.
+        Parquet row groups ruled out by their statistics are skipped when
+        pyarrow is installed.
+    matches_only : bool, default False
+        If True, only show columns with matches
+    max_workers : int, optional
+        Maximum number of sources searched concurrently. Defaults to 4.
+
+    Returns
+    -------
+    pl.DataFrame
+        Combined search results in source order, with a ``source`` column
+        followed by the columns returned by ``regex_search``
+    """
+    names = list(sources)
+    if not names:
+        return concat_search_results([]).select(
+            pl.lit(None, dtype=pl.Utf8()).alias("source"), pl.all()
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers or min(4, len(names))) as pool:
+        futures = [
+            pool.submit(_search_source, sources[name], pattern, matches_only)
+            for name in names
+        ]
+        frames: List[pl.DataFrame] = [future.result() for future in futures]
+
+    return pl.concat(
+        [
+            frame.select(pl.lit(name, dtype=pl.Utf8()).alias("source"), pl.all())
+            for name, frame in zip(names, frames)
+        ],
+        how="vertical",
+    )
@@ -0,0 +1,203 @@
+import argparse
+import sys
+import polars as pl
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .catalog import IPC_SUFFIXES, PARQUET_SUFFIXES, search_catalog
+from .extensions import filter_results, results_frame
+from .memory import parse_memory_budget
+from .stats import profile_parquet
+
+CSV_SUFFIXES = {".csv", ".tsv"}
+
+
+def scan_source(path: Path) -> pl.LazyFrame:
+    """
+    Open a data file lazily.
+
+    Arrow IPC files are memory-mapped; Parquet and CSV files are scanned,
+    so only the columns and rows a command needs are read.
+    """
+    suffix = path.suffix.lower()
+    if suffix in IPC_SUFFIXES:
+        return pl.scan_ipc(path, memory_map=True)
+    if suffix in PARQUET_SUFFIXES:
+        return pl.scan_parquet(path)
+    if suffix in CSV_SUFFIXES:
+        return pl.scan_csv(path, separator="\t" if suffix == ".tsv" else ",")
+    raise ValueError(f"Unsupported file type: {path}")
+
+
+def load_source(path: Path, sample: Optional[int], seed: int) -> pl.DataFrame:
+    """Read a data file, keeping a seeded random sample of rows if requested."""
+    df = scan_source(path).collect()
+    if sample is not None and df.height > sample:
+        df = df.sample(sample, seed=seed)
+    return df
+
+
+def write_output(df: pl.DataFrame, output: Optional[Path], output_format: str):
+    """Write a result frame as JSON (stdout by default) or Parquet."""
+    if output_format == "parquet":
+        if output is None:
+            raise ValueError("Parquet output needs --output")
+        df.write_parquet(output)
+    elif output is None:
+        sys.stdout.write(df.write_json())
+        sys.stdout.write("\n")
+    else:
+        df.write_json(output)
+
+
+def _joins(args: argparse.Namespace) -> pl.DataFrame:
+    left = load_source(args.left, args.sample, args.seed)
+    right = load_source(args.right, args.sample, args.seed)
+
+    results = left.polars_utils.analyze_joins(
+        right,
+        memory_budget=args.memory_budget,
+        max_workers=args.workers,
+        time_budget_s=args.time_budget,
+        min_key_score=args.min_key_score,
+        approximate=args.approximate,
+    )
+    if results.partial:
+        print(
+            f"Time budget ran out: {len(results.pending_pairs)} column pairs "
+            "were not evaluated",
+            file=sys.stderr,
+        )
+    return results_frame(filter_results(results, args.limit, args.min_match_pct))
+
+
+def _search(args: argparse.Namespace) -> pl.DataFrame:
+    if args.memory_budget is None and args.sample is None:
+        # Parquet and IPC paths are searched directly, skipping row groups
+        sources: Dict[str, object] = {
+            str(path): scan_source(path) if path.suffix.lower() in CSV_SUFFIXES else path
+            for path in args.sources
+        }
+        return search_catalog(args.pattern, sources, args.matches_only, args.workers)
+
+    frames = []
+    for path in args.sources:
+        df = load_source(path, args.sample, args.seed)
+        result = df.polars_utils.regex_search(
+            args.pattern, args.matches_only, memory_budget=args.memory_budget
+        )
+        frames.append(result.select(pl.lit(str(path)).alias("source"), pl.all()))
+    return pl.concat(frames, how="vertical")
+
+
+def _profile(args: argparse.Namespace) -> pl.DataFrame:
+    frames = []
+    for path in args.sources:
+        if args.metadata_only and path.suffix.lower() in PARQUET_SUFFIXES:
+            profile = profile_parquet(path)
+        elif args.sample is not None:
+            profile = load_source(path, args.sample, args.seed).polars_utils.profile(
+                args.histogram, not args.no_patterns, args.approx_distinct
+            )
+        else:
+            profile = scan_source(path).polars_utils.profile(
+                args.histogram, not args.no_patterns, args.approx_distinct
+            )
+        frames.append(profile.select(pl.lit(str(path)).alias("source"), pl.all()))
+    return pl.concat(frames, how="diagonal_relaxed")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="polars-utils",
+        description="Join discovery, regex search and profiling for data files "
+        "(Parquet, CSV, Arrow IPC).",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--output", "-o", type=Path, help="Write results here instead of stdout"
+    )
+    common.add_argument(
+        "--format", dest="output_format", choices=["json", "parquet"], default="json"
+    )
+    common.add_argument(
+        "--sample", type=int, help="Analyze a random sample of this many rows per file"
+    )
+    common.add_argument("--seed", type=int, default=0, help="Seed for --sample")
+    common.add_argument("--workers", type=int, help="Number of worker threads")
+    common.add_argument(
+        "--memory-budget",
+        type=parse_memory_budget,
+        help="Memory the analysis may allocate, e.g. 512MiB or 2GB",
+    )
+
+    joins = subparsers.add_parser(
+        "joins", parents=[common], help="Find join keys between two files"
+    )
+    joins.add_argument("left", type=Path)
+    joins.add_argument("right", type=Path)
+    joins.add_argument("--limit", type=int, help="Keep the best N column pairs")
+    joins.add_argument(
+        "--min-match-pct", type=float, help="Keep pairs matching at least this %%"
+    )
+    joins.add_argument("--time-budget", type=float, help="Stop after this many seconds")
+    joins.add_argument(
+        "--min-key-score",
+        type=float,
+        help="Skip columns that score below this as join keys (0 to 1)",
+    )
+    joins.add_argument(
+        "--approximate",
+        action="store_true",
+        help="Match large columns through Bloom filters",
+    )
+    joins.set_defaults(run=_joins)
+
+    search = subparsers.add_parser(
+        "search", parents=[common], help="Search files for a regex pattern"
+    )
+    search.add_argument("pattern")
+    search.add_argument("sources", type=Path, nargs="+")
+    search.add_argument("--matches-only", action="store_true")
+    search.set_defaults(run=_search)
+
+    profile = subparsers.add_parser(
+        "profile", parents=[common], help="Profile the columns of files"
+    )
+    profile.add_argument("sources", type=Path, nargs="+")
+    profile.add_argument("--histogram", action="store_true")
+    profile.add_argument("--no-patterns", action="store_true")
+    profile.add_argument(
+        "--approx-distinct",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Use approximate distinct counts (default: for large files)",
+    )
+    profile.add_argument(
+        "--metadata-only",
+        action="store_true",
+        help="Profile Parquet files from footer statistics",
+    )
+    profile.set_defaults(run=_profile)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the ``polars-utils`` command."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        result = args.run(args)
+        write_output(result, args.output, args.output_format)
+    except (ValueError, OSError, pl.exceptions.PolarsError) as e:
+        print(f"polars-utils: error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
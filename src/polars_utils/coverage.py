@@ -0,0 +1,73 @@
+import polars as pl
+from typing import Optional, Union
+
+from .histogram import keep_name
+
+MatchTarget = Union[pl.Series, pl.DataFrame, pl.LazyFrame]
+
+
+def key_counts(other: MatchTarget, column: Optional[str] = None) -> pl.DataFrame:
+    """
+    Count the rows of each non-null key of the other side.
+
+    A LazyFrame is collected here, reading only ``column`` grouped by value,
+    so the result holds one row per distinct key rather than the frame.
+    """
+    if isinstance(other, pl.Series):
+        values = other.alias("key").to_frame().lazy()
+    else:
+        if column is None:
+            raise ValueError("column is required when matching against a frame")
+        values = other.lazy().select(pl.col(column).alias("key"))
+    return (
+        values.drop_nulls()
+        .group_by("key")
+        .agg(pl.len().cast(pl.Int64).alias("rows"))
+        .collect()
+    )
+
+
+def _rate(matched: pl.Expr, rows: pl.Expr) -> pl.Expr:
+    return pl.when(rows > 0).then(matched / rows).otherwise(0.0)
+
+
+def match_rate_expr(
+    expr: pl.Expr, other: MatchTarget, column: Optional[str] = None
+) -> pl.Expr:
+    """
+    Measure how well a key column matches the keys of another table.
+
+    The other side is reduced once to its distinct keys and their row
+    counts, which are embedded as literals, so the expression itself runs
+    inside a lazy query (including ``group_by``) without another pass.
+    Nulls never match and aren't counted as rows.
+
+    Returns a struct with ``left_rows``, ``left_matched``,
+    ``left_match_rate`` and ``left_orphans`` for this column and the same
+    ``right_*`` fields for the other side.
+    """
+    counts = key_counts(other, column)
+    keys, key_rows = counts["key"], counts["rows"]
+
+    values = expr.drop_nulls()
+    left_rows = values.count().cast(pl.Int64)
+    left_matched = values.is_in(keys).sum().cast(pl.Int64)
+    right_rows = pl.lit(key_rows.sum(), dtype=pl.Int64)
+    # Rows of the other side whose key occurs here
+    right_matched = (
+        values.unique()
+        .replace_strict(keys, key_rows, default=0, return_dtype=pl.Int64)
+        .sum()
+    )
+
+    rates = pl.struct(
+        left_rows.alias("left_rows"),
+        left_matched.alias("left_matched"),
+        _rate(left_matched, left_rows).alias("left_match_rate"),
+        (left_rows - left_matched).alias("left_orphans"),
+        right_rows.alias("right_rows"),
+        right_matched.alias("right_matched"),
+        _rate(right_matched, right_rows).alias("right_match_rate"),
+        (right_rows - right_matched).alias("right_orphans"),
+    )
+    return keep_name(rates, expr)
@@ -1,11 +1,37 @@
+import time
 import polars as pl
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from itertools import product
-from typing import List, Dict, Optional
-from dataclasses import dataclass
-from rich.console import Console
-from rich.table import Table
-from rich import box
-from rich.progress import track
+from pathlib import Path
+from typing import AsyncIterator, List, Dict, Optional, Tuple, Union
+from dataclasses import astuple, dataclass
+from functools import partial
+
+from .search import (
+    search_result_frame,
+    search_column,
+    search_column_within_budget,
+    search_nested_column,
+    search_nested_column_within_budget,
+    concat_search_results,
+)
+from .search_index import SearchIndex, build_search_index
+from .cache import ResultCache
+from .histogram import DEFAULT_CHARS, histogram_expr
+from .coverage import match_rate_expr
+from .profiling import profile_frame
+from .stats import ColumnStats, frame_column_stats
+from .presentation import progress
+from .keys import key_scores, name_similarity, pair_score
+from .bloom import BloomFilter, bloom_match_counts, needs_filter
+from .memory import (
+    MemoryBudget,
+    MemoryTracker,
+    approximate_unique,
+    join_strategy,
+    sampled_match_counts,
+)
 
 
 @dataclass
@@ -27,6 +53,9 @@ class JoinResult:
     right_sample_values: List[str]
     coercion_applied: Optional[str] = None
     error: Optional[str] = None
+    # "bloom", "sample" and "count_only" are estimates; "failed" pairs set error
+    strategy: str = "exact"
+    false_positive_rate: Optional[float] = None  # Bound for "bloom" match counts
 
     @property
     def has_type_mismatch(self) -> bool:
@@ -53,6 +82,49 @@ class JoinResult:
         return (self.right_matched_rows / self.right_total_rows) * 100
 
 
+class JoinResults(list):
+    """
+    List of join results with accounting of the analysis.
+
+    ``peak_memory_bytes`` (estimated, see ``MemoryTracker``) and
+    ``memory_budget_bytes`` are set when the analysis ran with a memory
+    budget. ``pending_pairs`` lists the ``(left, right)`` column pairs a time
+    budget left unevaluated.
+    """
+
+    def __init__(
+        self,
+        results=(),
+        peak_memory_bytes: Optional[int] = None,
+        memory_budget_bytes: Optional[int] = None,
+        pending_pairs: Optional[List[Tuple[str, str]]] = None,
+    ):
+        super().__init__(results)
+        self.peak_memory_bytes = peak_memory_bytes
+        self.memory_budget_bytes = memory_budget_bytes
+        self.pending_pairs = pending_pairs or []
+
+    @property
+    def partial(self) -> bool:
+        """Whether some column pairs weren't evaluated before the deadline."""
+        return bool(self.pending_pairs)
+
+
+class TimeBudgetExceeded(TimeoutError):
+    """
+    Raised by ``analyze_joins_async`` when its time budget runs out.
+
+    The results yielded before it are complete; ``pending_pairs`` lists the
+    ``(left, right)`` column pairs that weren't evaluated.
+    """
+
+    def __init__(self, pending_pairs: List[Tuple[str, str]]):
+        super().__init__(
+            f"Time budget ran out: {len(pending_pairs)} column pairs were not evaluated"
+        )
+        self.pending_pairs = pending_pairs
+
+
 def coerce_for_join(
     df: pl.DataFrame, column: str, target_type: pl.DataType
 ) -> pl.DataFrame:
@@ -116,46 +188,102 @@ def format_column_name(name: str, max_length: int = 25) -> str:
     return truncate_with_ellipsis(name, max_length)
 
 
-def display_results(results: List[JoinResult]):
-    """Display join analysis results in a formatted table."""
-    table = Table(title="Join Analysis Results", box=box.DOUBLE)
-
-    # Add columns
-    table.add_column("Left Column")
-    table.add_column("Right Column")
-    table.add_column("Types")
-    table.add_column("Left Match %")
-    table.add_column("Right Match %")
-    table.add_column("Matched Rows")
-    table.add_column("Coercion Applied")
-
-    # Add rows
-    for result in results:
-        left_match_pct = (
-            f"{result.left_match_percentage:.1f}%"
-            if result.left_match_percentage > 0
-            else "-"
-        )
-        right_match_pct = (
-            f"{result.right_match_percentage:.1f}%"
-            if result.right_match_percentage > 0
-            else "-"
-        )
+def filter_results(
+    results: List[JoinResult],
+    limit: Optional[int] = None,
+    min_match_pct: Optional[float] = None,
+) -> List[JoinResult]:
+    """
+    Keep the join results worth showing, preserving their order.
 
-        table.add_row(
-            result.left_column,
-            result.right_column,
-            result.type_mismatch_desc
-            if result.has_type_mismatch
-            else str(result.left_dtype),
-            left_match_pct,
-            right_match_pct,
-            str(result.matched_rows) if result.matched_rows > 0 else "-",
-            result.coercion_applied or "-",
-        )
+    A result passes ``min_match_pct`` when either side matches at least
+    that percentage of its rows. ``limit`` is applied after filtering.
+    """
+    if min_match_pct is not None:
+        results = [
+            r
+            for r in results
+            if max(r.left_match_percentage, r.right_match_percentage) >= min_match_pct
+        ]
+    if limit is not None:
+        results = results[:limit]
+    return results
+
+
+def results_frame(results: List[JoinResult]) -> pl.DataFrame:
+    """Convert join results to a columnar DataFrame, one row per column pair."""
+    return pl.DataFrame(
+        {
+            "left_column": [r.left_column for r in results],
+            "right_column": [r.right_column for r in results],
+            "left_dtype": [str(r.left_dtype) for r in results],
+            "right_dtype": [str(r.right_dtype) for r in results],
+            "left_unique_values": [r.left_unique_values for r in results],
+            "right_unique_values": [r.right_unique_values for r in results],
+            "left_null_count": [r.left_null_count for r in results],
+            "right_null_count": [r.right_null_count for r in results],
+            "left_total_rows": [r.left_total_rows for r in results],
+            "right_total_rows": [r.right_total_rows for r in results],
+            "left_matched_rows": [r.left_matched_rows for r in results],
+            "right_matched_rows": [r.right_matched_rows for r in results],
+            "matched_rows": [r.matched_rows for r in results],
+            "left_match_pct": [r.left_match_percentage for r in results],
+            "right_match_pct": [r.right_match_percentage for r in results],
+            "left_sample_values": [r.left_sample_values for r in results],
+            "right_sample_values": [r.right_sample_values for r in results],
+            "coercion_applied": [r.coercion_applied for r in results],
+            "error": [r.error for r in results],
+            "strategy": [r.strategy for r in results],
+            "false_positive_rate": [r.false_positive_rate for r in results],
+        },
+        schema_overrides={
+            "left_column": pl.Utf8(),
+            "right_column": pl.Utf8(),
+            "left_dtype": pl.Utf8(),
+            "right_dtype": pl.Utf8(),
+            "left_unique_values": pl.Int64(),
+            "right_unique_values": pl.Int64(),
+            "left_null_count": pl.Int64(),
+            "right_null_count": pl.Int64(),
+            "left_total_rows": pl.Int64(),
+            "right_total_rows": pl.Int64(),
+            "left_matched_rows": pl.Int64(),
+            "right_matched_rows": pl.Int64(),
+            "matched_rows": pl.Int64(),
+            "left_match_pct": pl.Float64(),
+            "right_match_pct": pl.Float64(),
+            "left_sample_values": pl.List(pl.Utf8()),
+            "right_sample_values": pl.List(pl.Utf8()),
+            "coercion_applied": pl.Utf8(),
+            "error": pl.Utf8(),
+            "strategy": pl.Utf8(),
+            "false_positive_rate": pl.Float64(),
+        },
+    )
+
+
+def export_results(results: List[JoinResult], path: Union[str, Path]) -> None:
+    """
+    Write join results to a Parquet, CSV or JSON file based on its suffix.
 
-    console = Console()
-    console.print(table)
+    CSV has no list type, so sample values are joined with ", ".
+    """
+    path = Path(path)
+    df = results_frame(results)
+    suffix = path.suffix.lower()
+
+    if suffix in (".parquet", ".pq"):
+        df.write_parquet(path)
+    elif suffix == ".csv":
+        df.with_columns(
+            pl.col("left_sample_values", "right_sample_values").list.join(", ")
+        ).write_csv(path)
+    elif suffix == ".json":
+        df.write_json(path)
+    elif suffix in (".ndjson", ".jsonl"):
+        df.write_ndjson(path)
+    else:
+        raise ValueError(f"Unsupported export file type: {path}")
 
 
 def format_error(error: str) -> str:
@@ -173,8 +301,20 @@ class PolarsUtils:
         self._df = df
 
     def analyze_joins(
-        self, other_df: pl.DataFrame, exclude_dtypes: Optional[List[type]] = None
-    ) -> List[JoinResult]:
+        self,
+        other_df: pl.DataFrame,
+        exclude_dtypes: Optional[List[type]] = None,
+        *,
+        cache: Optional[ResultCache] = None,
+        column_stats: Optional[
+            Tuple[Dict[str, ColumnStats], Dict[str, ColumnStats]]
+        ] = None,
+        memory_budget: Optional[MemoryBudget] = None,
+        max_workers: Optional[int] = None,
+        time_budget_s: Optional[float] = None,
+        min_key_score: Optional[float] = None,
+        approximate: bool = False,
+    ) -> JoinResults:
         """
         Analyze potential join relationships between two DataFrames and return results.
 
@@ -184,56 +324,440 @@ class PolarsUtils:
             The DataFrame to analyze joins with
         exclude_dtypes : List[type], optional
             List of dtypes to exclude from analysis
+        cache : ResultCache, optional
+            Cache to reuse results of identical calls on unchanged frames.
+            Not used when ``time_budget_s`` is given.
+        column_stats : tuple of dict, optional
+            Precomputed ``(left, right)`` column statistics, e.g. from
+            ``parquet_column_stats`` on the files the frames were read from.
+            By default they are computed with one scan per frame. Null and
+            row counts are taken from them, and pairs of same-typed columns
+            whose value ranges don't overlap are reported as non-matching
+            without comparing values.
+        memory_budget : int or str, optional
+            Bytes (or a size such as ``"512MiB"``) the analysis may allocate.
+            Column pairs whose exact matching wouldn't fit are estimated from
+            samples, or only counted, as recorded in ``JoinResult.strategy``.
+            Usage is estimated from the size of the data each strategy
+            materialises, so ``JoinResults.peak_memory_bytes`` is an estimate
+            of the analysis' allocations, not of process memory.
+        max_workers : int, optional
+            Evaluate column pairs in a pool of this many threads
+        time_budget_s : float, optional
+            Evaluate the most promising pairs first and stop once this many
+            seconds have passed since the call, including the scans for
+            column statistics and key scores. Pairs not evaluated in time are
+            listed in ``JoinResults.pending_pairs`` and
+            ``JoinResults.partial`` is set. The budget is checked between
+            pairs: a pair already running is finished, so the call can
+            overrun the budget by about one pair per worker. The cache is
+            bypassed, since results may be incomplete.
+        min_key_score : float, optional
+            Skip columns whose key-likeness score (see ``key_scores``) is
+            below this value, so measures such as ``value`` or ``score`` and
+            free-text columns are never paired. Pairs are also evaluated in
+            order of their combined score.
+        approximate : bool, default False
+            Match pairs involving a large column (``BLOOM_MIN_ROWS`` non-null
+            rows or more) through a Bloom filter of that column, built once
+            and reused for every pair it appears in, instead of holding its
+            unique values. Match counts of the other side are then upper
+            estimates, off by at most about ``JoinResult.false_positive_rate``.
 
         Returns
         -------
-        List[JoinResult]
-            List of join analysis results
+        JoinResults
+            List of join analysis results, with the peak memory used when a
+            budget was given and the pairs left when the time budget ran out
         """
+        if cache is not None and time_budget_s is None:
+            return cache.get_or_compute(
+                "analyze_joins",
+                (self._df, other_df),
+                (
+                    frozenset(exclude_dtypes or []),
+                    memory_budget,
+                    min_key_score,
+                    approximate,
+                    # Supplied stats decide null counts and disjoint ranges
+                    column_stats
+                    and tuple(
+                        tuple((name, astuple(stats)) for name, stats in side.items())
+                        for side in column_stats
+                    ),
+                ),
+                lambda: self.analyze_joins(
+                    other_df,
+                    exclude_dtypes,
+                    column_stats=column_stats,
+                    memory_budget=memory_budget,
+                    max_workers=max_workers,
+                    min_key_score=min_key_score,
+                    approximate=approximate,
+                ),
+            )
+
+        # The setup scans below count against the time budget too
+        deadline = None if time_budget_s is None else time.monotonic() + time_budget_s
+        tracker = MemoryTracker(memory_budget) if memory_budget is not None else None
+        left_stats, right_stats = column_stats or (
+            frame_column_stats(self._df),
+            frame_column_stats(other_df),
+        )
+        column_pairs = self._join_pairs(
+            other_df,
+            exclude_dtypes or [],
+            left_stats,
+            right_stats,
+            promising_first=time_budget_s is not None or min_key_score is not None,
+            min_key_score=min_key_score,
+        )
+        bloom_filters = {} if approximate else None
+
+        def analyze(pair: Tuple[str, str]) -> JoinResult:
+            return self._analyze_pair(
+                other_df,
+                pair[0],
+                pair[1],
+                left_stats,
+                right_stats,
+                tracker=tracker,
+                bloom_filters=bloom_filters,
+            )
+
         results = []
-        exclude_dtypes = exclude_dtypes or []
+        pending = []
+        executor = ThreadPoolExecutor(max_workers) if max_workers is not None else None
+
+        if executor is None:
+            pairs = progress(column_pairs, description="Analyzing joins...")
+        else:
+            futures = {executor.submit(analyze, pair): pair for pair in column_pairs}
+            remaining = (
+                None if deadline is None else max(deadline - time.monotonic(), 0)
+            )
+            pairs = progress(
+                as_completed(futures, timeout=remaining),
+                description="Analyzing joins...",
+                total=len(futures),
+            )
+
+        if executor is None:
+            for pair in pairs:
+                if deadline is not None and time.monotonic() >= deadline:
+                    pending = column_pairs[len(results) :]
+                    break
+                results.append(analyze(pair))
+        else:
+            try:
+                # Wait for every pair, or the deadline, while showing progress
+                for _ in pairs:
+                    pass
+            except FuturesTimeoutError:
+                pass
+            finally:
+                # Pairs not started are cancelled; running ones are waited
+                # for, so none outlives the call
+                executor.shutdown(wait=True, cancel_futures=True)
+
+            for future, pair in futures.items():
+                if future.done() and not future.cancelled():
+                    results.append(future.result())
+                else:
+                    pending.append(pair)
+
+        return JoinResults(
+            sorted(
+                results,
+                key=lambda x: (x.left_match_percentage + x.right_match_percentage) / 2,
+                reverse=True,
+            ),
+            peak_memory_bytes=tracker.peak_bytes if tracker is not None else None,
+            memory_budget_bytes=tracker.budget_bytes if tracker is not None else None,
+            pending_pairs=pending,
+        )
 
-        # Get all column combinations
-        column_pairs = list(product(self._df.columns, other_df.columns))
+    async def analyze_joins_async(
+        self,
+        other_df: pl.DataFrame,
+        exclude_dtypes: Optional[List[type]] = None,
+        *,
+        column_stats: Optional[
+            Tuple[Dict[str, ColumnStats], Dict[str, ColumnStats]]
+        ] = None,
+        max_workers: Optional[int] = None,
+        time_budget_s: Optional[float] = None,
+        min_key_score: Optional[float] = None,
+        approximate: bool = False,
+    ) -> AsyncIterator[JoinResult]:
+        """
+        Analyze join relationships without blocking the event loop.
 
-        for left_col, right_col in track(
-            column_pairs, description="Analyzing joins..."
-        ):
-            # Skip excluded dtypes
-            left_dtype = self._df[left_col].dtype
-            right_dtype = other_df[right_col].dtype
+        Column pairs are evaluated in a thread pool, most promising pairs
+        first, and each ``JoinResult`` is yielded as soon as it finishes.
+        Cancelling the consuming task or closing the iterator cancels the
+        pairs that haven't started.
 
-            if (
-                type(left_dtype) in exclude_dtypes
-                or type(right_dtype) in exclude_dtypes
-            ):
-                continue
+        Parameters
+        ----------
+        other_df : pl.DataFrame
+            The DataFrame to analyze joins with
+        exclude_dtypes : List[type], optional
+            List of dtypes to exclude from analysis
+        column_stats : tuple of dict, optional
+            Precomputed ``(left, right)`` column statistics
+        max_workers : int, optional
+            Number of worker threads, by default the executor's default
+        time_budget_s : float, optional
+            Stop once this many seconds have passed since the call, including
+            the setup scans: pairs not yet started are cancelled and
+            ``TimeBudgetExceeded`` is raised, listing the pairs not yielded
+            in its ``pending_pairs``. The budget can't interrupt a running
+            scan or pair; pairs running at the deadline finish in the
+            background and their results are dropped.
+        min_key_score : float, optional
+            Skip columns whose key-likeness score is below this value
+        approximate : bool, default False
+            Match large columns through Bloom filters, as in ``analyze_joins``
+
+        Yields
+        ------
+        JoinResult
+            Results in completion order
+
+        Raises
+        ------
+        TimeBudgetExceeded
+            After the last result yielded in time, if the time budget ran out
+        """
+        # Imported here to keep asyncio out of import polars_utils
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers)
+        deadline = None if time_budget_s is None else loop.time() + time_budget_s
+        bloom_filters = {} if approximate else None
+        futures = []
+
+        try:
+            if column_stats is None:
+                column_stats = await loop.run_in_executor(
+                    executor,
+                    lambda: (frame_column_stats(self._df), frame_column_stats(other_df)),
+                )
+            left_stats, right_stats = column_stats
+            column_pairs = await loop.run_in_executor(
+                executor,
+                lambda: self._join_pairs(
+                    other_df,
+                    exclude_dtypes or [],
+                    left_stats,
+                    right_stats,
+                    promising_first=True,
+                    min_key_score=min_key_score,
+                ),
+            )
+            futures = [
+                loop.run_in_executor(
+                    executor,
+                    partial(
+                        self._analyze_pair,
+                        other_df,
+                        left_col,
+                        right_col,
+                        left_stats,
+                        right_stats,
+                        bloom_filters=bloom_filters,
+                    ),
+                )
+                for left_col, right_col in column_pairs
+            ]
+            remaining = None if deadline is None else max(deadline - loop.time(), 0)
+            evaluated = set()
+            for next_result in asyncio.as_completed(futures, timeout=remaining):
+                try:
+                    result = await next_result
+                except asyncio.TimeoutError:
+                    raise TimeBudgetExceeded(
+                        [pair for pair in column_pairs if pair not in evaluated]
+                    ) from None
+                evaluated.add((result.left_column, result.right_column))
+                yield result
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _join_pairs(
+        self,
+        other_df: pl.DataFrame,
+        exclude_dtypes: List[type],
+        left_stats: Dict[str, ColumnStats],
+        right_stats: Dict[str, ColumnStats],
+        *,
+        promising_first: bool = False,
+        min_key_score: Optional[float] = None,
+    ) -> List[Tuple[str, str]]:
+        """
+        List the column pairs to analyze, skipping excluded dtypes.
 
-            try:
-                # Try coercing types if they don't match
-                left_df = self._df
-                right_df = other_df
-                coercion_note = None
+        With ``promising_first``, pairs likely to join come first: pairs
+        with overlapping ranges, ordered by their combined key-likeness and
+        name similarity. With ``min_key_score``, columns scoring below it
+        are skipped.
+        """
+        pairs = [
+            (left_col, right_col)
+            for left_col, right_col in product(self._df.columns, other_df.columns)
+            if type(self._df.schema[left_col]) not in exclude_dtypes
+            and type(other_df.schema[right_col]) not in exclude_dtypes
+        ]
+        if not promising_first and min_key_score is None:
+            return pairs
+
+        left_scores = dict(key_scores(self._df).select("column", "key_score").iter_rows())
+        right_scores = dict(key_scores(other_df).select("column", "key_score").iter_rows())
+        if min_key_score is not None:
+            pairs = [
+                (left_col, right_col)
+                for left_col, right_col in pairs
+                if left_scores[left_col] >= min_key_score
+                and right_scores[right_col] >= min_key_score
+            ]
+        if not promising_first:
+            return pairs
+
+        def promise(pair: Tuple[str, str]) -> Tuple[bool, float]:
+            left, right = left_stats[pair[0]], right_stats[pair[1]]
+            return (
+                left.ranges_overlap(right),
+                pair_score(
+                    left_scores[pair[0]],
+                    right_scores[pair[1]],
+                    name_similarity(pair[0], pair[1]),
+                ),
+            )
+
+        return sorted(pairs, key=promise, reverse=True)
 
-                if left_dtype != right_dtype:
-                    # Try coercing right to left type first
+    def _analyze_pair(
+        self,
+        other_df: pl.DataFrame,
+        left_col: str,
+        right_col: str,
+        left_stats: Dict[str, ColumnStats],
+        right_stats: Dict[str, ColumnStats],
+        *,
+        tracker: Optional[MemoryTracker] = None,
+        bloom_filters: Optional[Dict[Tuple[str, str, str], BloomFilter]] = None,
+    ) -> JoinResult:
+        """
+        Evaluate how well one pair of columns joins.
+
+        Passing ``bloom_filters`` enables approximate matching of large
+        columns; filters are stored there by side, column and dtype.
+        """
+        left_dtype = self._df[left_col].dtype
+        right_dtype = other_df[right_col].dtype
+        held_bytes = 0
+
+        try:
+            # Try coercing types if they don't match
+            left_df = self._df
+            right_df = other_df
+            coercion_note = None
+
+            if left_dtype != right_dtype:
+                # Try coercing right to left type first
+                try:
+                    right_df = coerce_for_join(other_df, right_col, left_dtype)
+                    coercion_note = f"R → {left_dtype}"
+                except:
+                    # If that fails, try coercing left to right type
                     try:
-                        right_df = coerce_for_join(other_df, right_col, left_dtype)
-                        coercion_note = f"R → {left_dtype}"
+                        left_df = coerce_for_join(self._df, left_col, right_dtype)
+                        coercion_note = f"L → {right_dtype}"
                     except:
-                        # If that fails, try coercing left to right type
-                        try:
-                            left_df = coerce_for_join(self._df, left_col, right_dtype)
-                            coercion_note = f"L → {right_dtype}"
-                        except:
-                            pass
+                        pass
 
-                # Get unique values from both columns
-                left_unique = set(left_df[left_col].unique().drop_nulls())
-                right_unique = set(right_df[right_col].unique().drop_nulls())
+            approximate = bloom_filters is not None
+            if approximate and (
+                needs_filter(left_df[left_col]) or needs_filter(right_df[right_col])
+            ):
+                strategy = "bloom"
+            else:
+                strategy = "exact"
+            if tracker is not None:
+                # Coerced columns are new Polars buffers held for this pair
+                coerced_bytes = sum(
+                    df[col].estimated_size()
+                    for df, original, col in (
+                        (left_df, self._df, left_col),
+                        (right_df, other_df, right_col),
+                    )
+                    if df is not original
+                )
+                strategy, held_bytes = join_strategy(
+                    tracker,
+                    left_df[left_col],
+                    right_df[right_col],
+                    coerced_bytes,
+                    approximate,
+                )
+                # Held until the pair is done, so parallel pairs share the budget
+                tracker.retain(held_bytes)
+
+            false_positive_rate = None
+            if strategy != "exact":
+                left_unique_count = approximate_unique(left_df[left_col])
+                right_unique_count = approximate_unique(right_df[right_col])
+                if strategy == "bloom":
+
+                    def build_filter(side: str, values: pl.Series) -> BloomFilter:
+                        column, n_keys = (
+                            (left_col, left_unique_count)
+                            if side == "left"
+                            else (right_col, right_unique_count)
+                        )
+                        key = (side, column, str(values.dtype))
+                        if key not in bloom_filters:
+                            bloom_filters[key] = BloomFilter.from_series(values, n_keys)
+                            if tracker is not None:
+                                tracker.retain(bloom_filters[key].nbytes)
+                        return bloom_filters[key]
+
+                    (
+                        left_matched_rows,
+                        right_matched_rows,
+                        false_positive_rate,
+                    ) = bloom_match_counts(
+                        left_df[left_col], right_df[right_col], build_filter
+                    )
+                elif strategy == "sample":
+                    left_matched_rows, right_matched_rows = sampled_match_counts(
+                        left_df[left_col], right_df[right_col]
+                    )
+                else:
+                    left_matched_rows = right_matched_rows = 0
+                matched_rows = max(left_matched_rows, right_matched_rows)
+            else:
+                disjoint = not left_stats[left_col].ranges_overlap(
+                    right_stats[right_col]
+                )
+                if coercion_note is None and disjoint:
+                    # Disjoint value ranges can't share a value
+                    left_unique_count = left_df[left_col].drop_nulls().n_unique()
+                    right_unique_count = right_df[right_col].drop_nulls().n_unique()
+                    matched_values = set()
+                else:
+                    # Get unique values from both columns
+                    left_unique = set(left_df[left_col].unique().drop_nulls())
+                    right_unique = set(right_df[right_col].unique().drop_nulls())
+                    left_unique_count = len(left_unique)
+                    right_unique_count = len(right_unique)
 
-                # Find matching values
-                matched_values = left_unique & right_unique
+                    # Find matching values
+                    matched_values = left_unique & right_unique
 
                 if matched_values:
                     # Count matching rows for both sides
@@ -249,80 +773,88 @@ class PolarsUtils:
                 else:
                     left_matched_rows = right_matched_rows = matched_rows = 0
 
-                result = JoinResult(
-                    left_column=left_col,
-                    right_column=right_col,
-                    left_unique_values=len(left_unique),
-                    right_unique_values=len(right_unique),
-                    left_dtype=left_dtype,
-                    right_dtype=right_dtype,
-                    left_null_count=self._df[left_col].null_count(),
-                    right_null_count=other_df[right_col].null_count(),
-                    left_total_rows=len(self._df),
-                    right_total_rows=len(other_df),
-                    left_matched_rows=left_matched_rows,
-                    right_matched_rows=right_matched_rows,
-                    matched_rows=matched_rows,
-                    left_sample_values=[
-                        str(x)
-                        for x in self._df[left_col].drop_nulls().head(3).to_list()
-                    ],
-                    right_sample_values=[
-                        str(x)
-                        for x in other_df[right_col].drop_nulls().head(3).to_list()
-                    ],
-                    coercion_applied=coercion_note,
-                )
+            result = JoinResult(
+                left_column=left_col,
+                right_column=right_col,
+                left_unique_values=left_unique_count,
+                right_unique_values=right_unique_count,
+                left_dtype=left_dtype,
+                right_dtype=right_dtype,
+                left_null_count=left_stats[left_col].null_count,
+                right_null_count=right_stats[right_col].null_count,
+                left_total_rows=left_stats[left_col].total_rows,
+                right_total_rows=right_stats[right_col].total_rows,
+                left_matched_rows=left_matched_rows,
+                right_matched_rows=right_matched_rows,
+                matched_rows=matched_rows,
+                left_sample_values=[
+                    str(x)
+                    for x in self._df[left_col].drop_nulls().head(3).to_list()
+                ],
+                right_sample_values=[
+                    str(x)
+                    for x in other_df[right_col].drop_nulls().head(3).to_list()
+                ],
+                coercion_applied=coercion_note,
+                strategy=strategy,
+                false_positive_rate=false_positive_rate,
+            )
 
-            except Exception as e:
-                # Even if join fails, try to get diagnostics
-                try:
-                    left_dtype = str(self._df.select(left_col).schema[left_col])
-                    right_dtype = str(other_df.select(right_col).schema[right_col])
-                    left_null_count = self._df[left_col].null_count()
-                    right_null_count = other_df[right_col].null_count()
-                    left_sample = self._df[left_col].drop_nulls().head(3).to_list()
-                    right_sample = other_df[right_col].drop_nulls().head(3).to_list()
-                    left_sample_values = [str(x) for x in left_sample]
-                    right_sample_values = [str(x) for x in right_sample]
-                except Exception:
-                    left_dtype = "unknown"
-                    right_dtype = "unknown"
-                    left_null_count = -1
-                    right_null_count = -1
-                    left_sample_values = []
-                    right_sample_values = []
-
-                result = JoinResult(
-                    left_column=left_col,
-                    right_column=right_col,
-                    left_unique_values=self._df[left_col].n_unique(),
-                    right_unique_values=other_df[right_col].n_unique(),
-                    left_dtype=left_dtype,
-                    right_dtype=right_dtype,
-                    left_null_count=left_null_count,
-                    right_null_count=right_null_count,
-                    left_total_rows=len(self._df),
-                    right_total_rows=len(other_df),
-                    left_matched_rows=0,
-                    right_matched_rows=0,
-                    matched_rows=0,
-                    left_sample_values=left_sample_values,
-                    right_sample_values=right_sample_values,
-                    coercion_applied=None,
-                    error=str(e),
-                )
+        except Exception as e:
+            # Even if join fails, try to get diagnostics
+            try:
+                left_dtype = str(self._df.select(left_col).schema[left_col])
+                right_dtype = str(other_df.select(right_col).schema[right_col])
+                left_null_count = self._df[left_col].null_count()
+                right_null_count = other_df[right_col].null_count()
+                left_sample = self._df[left_col].drop_nulls().head(3).to_list()
+                right_sample = other_df[right_col].drop_nulls().head(3).to_list()
+                left_sample_values = [str(x) for x in left_sample]
+                right_sample_values = [str(x) for x in right_sample]
+            except Exception:
+                left_dtype = "unknown"
+                right_dtype = "unknown"
+                left_null_count = -1
+                right_null_count = -1
+                left_sample_values = []
+                right_sample_values = []
+
+            result = JoinResult(
+                left_column=left_col,
+                right_column=right_col,
+                left_unique_values=self._df[left_col].n_unique(),
+                right_unique_values=other_df[right_col].n_unique(),
+                left_dtype=left_dtype,
+                right_dtype=right_dtype,
+                left_null_count=left_null_count,
+                right_null_count=right_null_count,
+                left_total_rows=len(self._df),
+                right_total_rows=len(other_df),
+                left_matched_rows=0,
+                right_matched_rows=0,
+                matched_rows=0,
+                left_sample_values=left_sample_values,
+                right_sample_values=right_sample_values,
+                coercion_applied=None,
+                error=str(e),
+                strategy="failed",
+            )
 
-            results.append(result)
+        finally:
+            if tracker is not None:
+                tracker.release(held_bytes)
 
-        return sorted(
-            results,
-            key=lambda x: (x.left_match_percentage + x.right_match_percentage) / 2,
-            reverse=True,
-        )
+        return result
 
     def join_analysis(
-        self, other_df: pl.DataFrame, exclude_dtypes: Optional[List[type]] = None
+        self,
+        other_df: pl.DataFrame,
+        exclude_dtypes: Optional[List[type]] = None,
+        *,
+        limit: Optional[int] = None,
+        min_match_pct: Optional[float] = None,
+        page_size: Optional[int] = None,
+        export: Optional[Union[str, Path]] = None,
     ):
         """
         Display join analysis results in a formatted table.
@@ -333,77 +865,238 @@ class PolarsUtils:
             The DataFrame to analyze joins with
         exclude_dtypes : List[type], optional
             List of dtypes to exclude from analysis
+        limit : int, optional
+            Show at most this many of the best matching column pairs
+        min_match_pct : float, optional
+            Only show pairs where either side matches at least this
+            percentage of its rows
+        page_size : int, optional
+            Render the table this many rows at a time
+        export : str or Path, optional
+            Write the filtered results to a Parquet, CSV or JSON file
+            instead of displaying them
+        """
+        results = filter_results(
+            self.analyze_joins(other_df, exclude_dtypes), limit, min_match_pct
+        )
+        if export is not None:
+            export_results(results, export)
+            return
+
+        from .presentation import display_results  # pylint: disable=import-outside-toplevel
+
+        display_results(results, page_size)
+
+    def profile(
+        self,
+        histogram: bool = False,
+        patterns: bool = True,
+        approx_distinct: Optional[bool] = None,
+    ) -> pl.DataFrame:
+        """
+        Profile data quality of every column in one fused, parallel scan.
+
+        Parameters
+        ----------
+        histogram : bool, default False
+            If True, add a sparkline of each numeric and temporal column
+        patterns : bool, default True
+            If True, report the most common value shape of string columns
+        approx_distinct : bool, optional
+            Use approximate distinct counts. By default they are used for
+            frames with at least 1,000,000 rows.
+
+        Returns
+        -------
+        pl.DataFrame
+            One row per column with its dtype, null counts, cardinality,
+            range, mean, string lengths and value patterns
+        """
+        return profile_frame(self._df, histogram, patterns, approx_distinct)
+
+    def build_search_index(self, columns: Optional[List[str]] = None) -> SearchIndex:
+        """
+        Build a trigram index to speed up repeated regex searches.
+
+        Parameters
+        ----------
+        columns : List[str], optional
+            Columns to index. Defaults to all non-nested columns.
+
+        Returns
+        -------
+        SearchIndex
+            Index to pass to ``regex_search(..., index=...)``. Its build time
+            and memory footprint are available as ``build_seconds`` and
+            ``nbytes``.
         """
-        results = self.analyze_joins(other_df, exclude_dtypes)
-        display_results(results)
+        return build_search_index(self._df, columns)
 
-    def regex_search(self, pattern: str, matches_only: bool = False) -> pl.DataFrame:
+    def regex_search(
+        self,
+        pattern: str,
+        matches_only: bool = False,
+        index: Optional[SearchIndex] = None,
+        cache: Optional[ResultCache] = None,
+        memory_budget: Optional[MemoryBudget] = None,
+    ) -> pl.DataFrame:
         """
         Search all columns for values matching a regex pattern.
 
+        Struct, List and Array columns are searched leaf by leaf, walking
+        struct fields and list elements without formatting nested values as
+        strings or exploding the frame.
+
         Parameters
         ----------
         pattern : str
             Regular expression pattern to search for
         matches_only : bool, default False
             If True, only show columns with matches
+        index : SearchIndex, optional
+            Index built with ``build_search_index`` for this DataFrame, used
+            to narrow candidate rows before running the regex
+        cache : ResultCache, optional
+            Cache to reuse results of identical calls on unchanged frames
+        memory_budget : int or str, optional
+            Bytes (or a size such as ``"512MiB"``) the search may allocate.
+            Match lists that wouldn't fit are truncated or left empty while
+            ``n`` and ``percent`` stay exact. Not supported with ``index``.
 
         Returns
         -------
         pl.DataFrame
             DataFrame containing search results with columns:
-            - column_name: Name of the column
+            - column_name: Name of the column, or the field path of a nested
+              leaf such as ``payload.user.email`` (``[]`` marks list elements)
             - matches: List of matching values
             - n: Number of matches
             - percent: Percentage of rows with matches
+            With a memory budget, also:
+            - strategy: "exact", "truncated" or "count_only"
+            - peak_memory_bytes: Peak memory used by the search
         """
+        if cache is not None:
+            return cache.get_or_compute(
+                "regex_search",
+                (self._df,),
+                (pattern, matches_only, memory_budget),
+                lambda: self.regex_search(
+                    pattern, matches_only, index, memory_budget=memory_budget
+                ),
+            )
+
+        if index is not None and memory_budget is not None:
+            raise ValueError("memory_budget is not supported with a search index")
+
+        if index is not None:
+            if not index.is_valid_for(self._df):
+                raise ValueError("Search index was built for a different DataFrame")
+            return index.regex_search(pattern, matches_only)
+
+        if memory_budget is not None:
+            return self._regex_search_within_budget(pattern, matches_only, memory_budget)
+
         dfs = []
         row_count = self._df.shape[0]
 
-        for col in self._df.columns:
-            row_df = (
-                self._df.select(pl.col(col).cast(pl.Utf8()))
-                .filter(pl.col(col).str.contains(pattern))
-                .group_by(pl.lit(col).alias("column_name"))
-                .agg(pl.col(col).alias("matches"), pl.col(col).len().alias("n"))
-            )
+        for col, dtype in self._df.schema.items():
+            if dtype.is_nested():
+                leaves = search_nested_column(self._df, col, pattern)
+            else:
+                matches = search_column(self._df.get_column(col), pattern)
+                leaves = [(col, matches, len(matches))]
+
+            for path, matches, rows_matched in leaves:
+                # Create an empty row if there are no matches
+                if len(matches) == 0:
+                    if matches_only:
+                        continue
+                    matches = None
+
+                dfs.append(
+                    search_result_frame(
+                        path, matches, row_count, rows_matched=rows_matched
+                    )
+                )
 
-            # Create an empty row if there are no matches
-            if (len(row_df) == 0) and (not matches_only):
-                row_df = pl.DataFrame(
-                    {
-                        "column_name": col,
-                        "matches": pl.Series("empty lists", [[]], dtype=pl.List),
-                        "n": 0,
-                    }
+        return concat_search_results(dfs)
+
+    def _regex_search_within_budget(
+        self, pattern: str, matches_only: bool, memory_budget: MemoryBudget
+    ) -> pl.DataFrame:
+        """Search all columns, degrading match lists to stay within a budget."""
+        dfs = []
+        strategies = []
+        row_count = self._df.shape[0]
+
+        tracker = MemoryTracker(memory_budget)
+        for col, dtype in self._df.schema.items():
+            if dtype.is_nested():
+                leaves = search_nested_column_within_budget(
+                    self._df, col, pattern, tracker
+                )
+            else:
+                matches, n, strategy = search_column_within_budget(
+                    self._df.get_column(col), pattern, tracker
                 )
+                leaves = [(col, matches, n, n, strategy)]
 
-            # Append the row with casted types
-            dfs.append(
-                row_df.select(
-                    pl.col("column_name").cast(pl.Utf8()),
-                    pl.col("matches").cast(pl.List(pl.Utf8())),
-                    pl.col("n").cast(pl.UInt32()),
-                    (pl.col("n") / pl.lit(row_count)).cast(pl.Float64).alias("percent"),
+            for path, matches, n, rows_matched, strategy in leaves:
+                if n == 0 and matches_only:
+                    continue
+
+                dfs.append(
+                    search_result_frame(path, matches, row_count, n, rows_matched)
                 )
-            )
+                tracker.retain(dfs[-1].estimated_size())
+                strategies.append(strategy)
+
+        return concat_search_results(dfs).with_columns(
+            strategy=pl.Series(strategies, dtype=pl.Utf8()),
+            peak_memory_bytes=pl.lit(tracker.peak_bytes, dtype=pl.Int64()),
+        )
+
+
+@pl.api.register_lazyframe_namespace("polars_utils")
+class LazyPolarsUtils:
+    def __init__(self, lf: pl.LazyFrame):
+        self._lf = lf
+
+    def profile(
+        self,
+        histogram: bool = False,
+        patterns: bool = True,
+        approx_distinct: Optional[bool] = None,
+    ) -> pl.DataFrame:
+        """
+        Profile data quality of every column in one fused, parallel scan.
 
-        return pl.concat(dfs, how="vertical")
+        See ``DataFrame.polars_utils.profile`` for the parameters. Only the
+        profile aggregates are materialized, never the full frame.
+        """
+        return profile_frame(self._lf, histogram, patterns, approx_distinct)
 
 
 @pl.api.register_expr_namespace("polars_utils")
-class HistogramExpr:
+class PolarsUtilsExpr:
     def __init__(self, expr: pl.Expr):
         self._expr = expr
 
     def create_histogram(
         self,
         max_width: Optional[int] = 20,
-        chars: str = "▁▂▃▄▅▆▇█",
+        chars: str = DEFAULT_CHARS,
         show_stats: bool = True,
+        bin_range: Optional[Tuple[float, float]] = None,
+        kind: str = "numeric",
     ) -> pl.Expr:
         """
-        Create a single-line ASCII histogram for numeric data.
+        Create a single-line ASCII histogram for numeric, temporal or text data.
+
+        The histogram is composed entirely of native Polars expressions, so it
+        runs in parallel across groups in ``group_by``/``over`` and in lazy
+        queries without calling back into Python.
 
         Parameters
         ----------
@@ -414,63 +1107,70 @@ class HistogramExpr:
             Should have 8 characters. Default is Unicode blocks.
         show_stats : bool, optional
             Whether to show min/max values. Default is True.
+        bin_range : Tuple[float, float], optional
+            Fixed (lower, upper) bin edges shared by every group, so groups
+            are drawn on the same scale. Values outside are clamped into the
+            edge bins. Default is each group's own min/max. Only for
+            ``"numeric"`` and ``"length"`` histograms.
+        kind : str, optional
+            What to chart. ``"numeric"`` (default) bins numbers;
+            ``"temporal"`` bins Date, Datetime, Duration or Time values into equal
+            time buckets with ISO-formatted edges; ``"length"`` bins string
+            lengths; ``"categorical"`` draws one bar per value for the
+            ``max_width`` most frequent values, labelled with the most and
+            least frequent value shown.
 
         Returns
         -------
         pl.Expr
             Expression that creates histogram strings
         """
+        n_bins = max_width if max_width else 20
+        return histogram_expr(self._expr, n_bins, chars, show_stats, bin_range, kind=kind)
 
-        def _create_histogram(series_list: List[pl.Series]) -> str:
-            values = series_list[0]
-
-            # Handle list type by exploding into a Series
-            if isinstance(values.dtype, pl.List):
-                values = pl.Series(values.explode())
-
-            if len(values) == 0:
-                return ""
+    def match_rate(
+        self,
+        other: Union[pl.Series, pl.DataFrame, pl.LazyFrame],
+        column: Optional[str] = None,
+    ) -> pl.Expr:
+        """
+        Measure how well this key column matches the keys of another table.
 
-            # Calculate bins manually to avoid None values
-            n_bins = max_width if max_width else 20
-            min_val = values.min()
-            max_val = values.max()
+        Meant for monitoring one known join key as part of an existing
+        (lazy) query instead of rerunning ``analyze_joins``. The other side
+        is reduced to its distinct keys once, when the expression is built;
+        this column is evaluated with the rest of the query, also per group
+        in ``group_by``.
 
-            if min_val == max_val:
-                hist = chars[-1] * n_bins
-            else:
-                bin_width = (max_val - min_val) / n_bins
-                counts = pl.Series(range(n_bins)).map_elements(
-                    lambda i: values.filter(
-                        (values >= min_val + i * bin_width)
-                        & (values < min_val + (i + 1) * bin_width)
-                    ).len()
-                )
+        Parameters
+        ----------
+        other : pl.Series, pl.DataFrame or pl.LazyFrame
+            The other side's keys, or a frame holding them in ``column``
+        column : str, optional
+            Key column of ``other`` when it is a frame
 
-                # Scale to character levels
-                max_count = counts.max()
-                if max_count > 0:
-                    scaled = (counts * (len(chars) - 1) / max_count).cast(pl.Int64)
-                else:
-                    scaled = pl.Series([0] * n_bins)
+        Returns
+        -------
+        pl.Expr
+            Struct with ``left_rows``, ``left_matched``, ``left_match_rate``
+            and ``left_orphans`` for this column and the same ``right_*``
+            fields for the other side. Rates are fractions of non-null rows;
+            orphans are non-null rows without a match.
+        """
+        return match_rate_expr(self._expr, other, column)
 
-                # Convert to string
-                hist = "".join(
-                    chars[min(max(val, 0), len(chars) - 1)] for val in scaled
-                )
 
-            # Ensure histogram has exact width by padding with spaces
-            hist = f"{hist:<{n_bins}}"
+# Former name of the expression namespace, from when it only drew histograms
+HistogramExpr = PolarsUtilsExpr
 
-            # Add min/max values if requested
-            if show_stats:
-                return f"{hist}  [{min_val:.2f}, {max_val:.2f}]"
 
-            return hist
+def __getattr__(name: str):
+    # Rendering helpers moved to the lazily imported presentation module
+    if name == "display_results":
+        from . import presentation  # pylint: disable=import-outside-toplevel
 
-        return pl.map_groups(
-            exprs=[self._expr], function=_create_histogram, return_dtype=pl.Utf8
-        )
+        return presentation.display_results
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def register_extensions():
@@ -0,0 +1,235 @@
+import polars as pl
+from typing import Optional, Tuple, Union
+
+DEFAULT_CHARS = "▁▂▃▄▅▆▇█"
+
+# What a histogram bins: numbers, dates/times/durations, the most frequent
+# values, or string lengths
+HISTOGRAM_KINDS = ("numeric", "temporal", "categorical", "length")
+
+
+def keep_name(result: pl.Expr, source: pl.Expr) -> pl.Expr:
+    """Name a derived expression after its source column, when known."""
+    name = source.meta.output_name(raise_if_undetermined=False)
+    return result.alias(name) if name is not None else result
+
+
+# Floats at or beyond this magnitude are integers and exceed the exact path
+_EXACT_LIMIT = 2.0**53
+
+
+def format_fixed(expr: pl.Expr, decimals: int = 2) -> pl.Expr:
+    """
+    Format a numeric expression with a fixed number of decimals.
+
+    Expression equivalent of ``f"{value:.2f}"``. Like Python, ties are
+    resolved against the exact binary value: when the scaled value rounds
+    to exactly half-way, the rounding error of the multiplication (computed
+    with Dekker's split) decides the direction, and true ties go to even.
+    Values beyond 2**53 are whole numbers and are printed through a
+    decimal cast (or Polars' own formatting past 1e38); NaN and infinities
+    are printed as Python does.
+    """
+    scale = 10**decimals
+    signed = expr.cast(pl.Float64)
+    value = signed.abs()
+
+    split = value * 134217729.0  # 2**27 + 1
+    value_hi = split - (split - value)
+    value_lo = value - value_hi
+    shifted = value * scale
+    error = (value_hi * scale - shifted) + value_lo * scale
+
+    floored = shifted.floor()
+    tie = shifted - floored == 0.5
+    rounded = (
+        pl.when(tie & (error > 0))
+        .then(floored + 1)
+        .when(tie & (error < 0))
+        .then(floored)
+        .when(tie)
+        .then(floored + floored % 2)
+        .otherwise(shifted.round(0))
+        .cast(pl.Int64, strict=False)
+    )
+
+    sign = pl.when(signed < 0).then(pl.lit("-")).otherwise(pl.lit(""))
+    parts = [sign, (rounded // scale).cast(pl.Utf8)]
+    if decimals > 0:
+        parts += [pl.lit("."), (rounded % scale).cast(pl.Utf8).str.zfill(decimals)]
+    fraction = "." + "0" * decimals if decimals > 0 else ""
+
+    formatted = (
+        pl.when(signed.is_nan())
+        .then(pl.lit("nan"))
+        .when(signed.is_infinite())
+        .then(pl.when(signed > 0).then(pl.lit("inf")).otherwise(pl.lit("-inf")))
+        .when(value < _EXACT_LIMIT)
+        .then(pl.concat_str(parts))
+        .when(value < 1e38)
+        .then(
+            pl.concat_str(
+                signed.cast(pl.Decimal(38, 0), strict=False).cast(pl.Utf8),
+                pl.lit(fraction),
+            )
+        )
+        .otherwise(signed.cast(pl.Utf8))
+    )
+    return keep_name(formatted, expr)
+
+
+def bin_counts(bins: pl.Expr, n_bins: int) -> pl.Expr:
+    """
+    Count values per bin index in a single pass.
+
+    Every bin index is appended once so empty bins still appear, then the
+    counts are sorted by bin and corrected for the extra occurrence.
+    """
+    return (
+        bins.drop_nulls()
+        .append(pl.int_range(0, n_bins, dtype=pl.Int64))
+        .value_counts(name="count")
+        .sort()
+        .struct.field("count")
+        - 1
+    )
+
+
+def render_bars(counts: pl.Expr, chars: str = DEFAULT_CHARS) -> pl.Expr:
+    """Scale bin counts to character levels and join them into one string."""
+    # Integer division keeps the tallest bin exactly on the top level
+    levels = (counts.cast(pl.Int64) * (len(chars) - 1)) // counts.max().clip(1)
+    return pl.lit(chars).str.slice(levels.clip(0, len(chars) - 1), 1).str.join("")
+
+
+def bin_index(
+    values: pl.Expr, lower: Union[pl.Expr, float], upper: Union[pl.Expr, float], n_bins: int
+) -> pl.Expr:
+    """
+    Assign values to ``n_bins`` equal-width bins between ``lower`` and ``upper``.
+
+    The last bin is closed and values outside the edges are clamped into the
+    first or last bin. Scaling before dividing lets values on a bin edge land
+    exactly on it. NaN values get a null index and aren't counted.
+    """
+    lower = pl.lit(lower) if not isinstance(lower, pl.Expr) else lower
+    upper = pl.lit(upper) if not isinstance(upper, pl.Expr) else upper
+    # Compute in floats: integer dtypes overflow when scaled and unsigned
+    # ones wrap below the lower edge
+    values, lower, upper = (e.cast(pl.Float64) for e in (values, lower, upper))
+    # Empty ranges are rendered separately; avoid dividing by zero for them
+    value_range = pl.when(upper > lower).then(upper - lower).otherwise(1.0)
+    return (
+        ((values - lower) * n_bins // value_range)
+        .clip(0, n_bins - 1)
+        .cast(pl.Int64, strict=False)
+    )
+
+
+def frequency_histogram_expr(
+    expr: pl.Expr,
+    n_bars: int = 20,
+    chars: str = DEFAULT_CHARS,
+    show_stats: bool = True,
+) -> pl.Expr:
+    """
+    Build a single-line bar chart of the most frequent values.
+
+    One bar per value, for the ``n_bars`` most frequent values in order of
+    decreasing frequency (ties by value). The stats show the most and the
+    least frequent value charted.
+    """
+    values = expr.explode().drop_nulls().cast(pl.Utf8)
+    # Runs of sorted values count each value in a deterministic order, so
+    # the stable sort by count leaves ties ordered by value
+    runs = values.sort().rle()
+    top = runs.sort_by(
+        runs.struct.field("len"), descending=True, maintain_order=True
+    ).head(n_bars)
+
+    # Pad to the fixed width numeric histograms have when values are few
+    hist = render_bars(top.struct.field("len"), chars).str.pad_end(n_bars)
+    if show_stats:
+        hist = pl.format(
+            "{}  [{}, {}]",
+            hist,
+            top.struct.field("value").first(),
+            top.struct.field("value").last(),
+        )
+
+    hist = pl.when(values.count() == 0).then(pl.lit("")).otherwise(hist)
+    return keep_name(hist, expr)
+
+
+def histogram_expr(
+    expr: pl.Expr,
+    n_bins: int = 20,
+    chars: str = DEFAULT_CHARS,
+    show_stats: bool = True,
+    bin_range: Optional[Tuple[float, float]] = None,
+    *,
+    kind: str = "numeric",
+) -> pl.Expr:
+    """
+    Build a single-line histogram purely from Polars expressions.
+
+    Values are split into ``n_bins`` equal-width bins between their min and
+    max, with the last bin closed so the max value is counted. Because no
+    Python callback is involved, the expression runs in parallel across
+    groups and works in ``group_by``, ``over`` and lazy queries. List values
+    are flattened before binning.
+
+    With ``bin_range`` every group is binned against the same fixed edges,
+    so histograms of different groups share one scale.
+
+    ``kind`` selects what is binned: ``"temporal"`` bins Date, Datetime,
+    Duration and Time values into equal time buckets labelled in ISO format,
+    ``"length"`` bins string lengths, and ``"categorical"`` charts the most
+    frequent values (see ``frequency_histogram_expr``).
+    """
+    if kind not in HISTOGRAM_KINDS:
+        raise ValueError(f"kind must be one of {HISTOGRAM_KINDS}, got {kind!r}")
+    if bin_range is not None and kind in ("temporal", "categorical"):
+        raise ValueError(f"bin_range isn't supported for {kind} histograms")
+    if kind == "categorical":
+        return frequency_histogram_expr(expr, n_bins, chars, show_stats)
+
+    values = expr.explode().drop_nulls()
+    if kind == "temporal":
+        labels = (values.min().dt.to_string("iso"), values.max().dt.to_string("iso"))
+        # Bin the underlying integers (days, or time units since the epoch)
+        values = values.to_physical()
+    elif kind == "length":
+        values = values.cast(pl.Utf8).str.len_chars()
+        labels = (values.min().cast(pl.Utf8), values.max().cast(pl.Utf8))
+    else:
+        labels = (format_fixed(values.min()), format_fixed(values.max()))
+    min_val = values.min()
+    max_val = values.max()
+
+    if bin_range is None:
+        bars = (
+            pl.when(min_val == max_val)
+            .then(pl.lit(chars[-1] * n_bins))
+            .otherwise(
+                render_bars(bin_counts(bin_index(values, min_val, max_val, n_bins), n_bins), chars)
+            )
+        )
+    else:
+        lower, upper = validate_bin_range(bin_range)
+        bars = render_bars(bin_counts(bin_index(values, lower, upper, n_bins), n_bins), chars)
+
+    hist = bars
+    if show_stats:
+        hist = pl.format("{}  [{}, {}]", bars, *labels)
+
+    hist = pl.when(values.count() == 0).then(pl.lit("")).otherwise(hist)
+    return keep_name(hist, expr)
+
+
+def validate_bin_range(bin_range: Tuple[float, float]) -> Tuple[float, float]:
+    """Check that fixed bin edges describe a non-empty range."""
+    lower, upper = bin_range
+    if not upper > lower:
+        raise ValueError(f"bin_range upper edge must exceed lower edge, got {bin_range}")
+    return lower, upper
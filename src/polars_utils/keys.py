@@ -0,0 +1,183 @@
+import math
+import re
+import polars as pl
+from difflib import SequenceMatcher
+from functools import partial
+from typing import Dict, List, Optional, Union
+
+from .profiling import APPROX_DISTINCT_MIN_ROWS
+
+# Names that usually identify rows, and names that usually hold measurements
+KEY_NAME_PATTERN = re.compile(
+    r"(^|_)(id|key|code|uuid|guid|sku|no|num|number|ref)$|[a-z0-9]id$", re.IGNORECASE
+)
+MEASURE_NAME_PATTERN = re.compile(
+    r"(^|_)(value|score|amount|price|total|count|qty|quantity|sum|avg|mean|rate|"
+    r"pct|percent|ratio|weight|balance|cost|revenue|comment|description|note|text)s?$",
+    re.IGNORECASE,
+)
+
+# Strings longer than this on average look like free text rather than codes
+MAX_KEY_LENGTH = 32
+
+
+def _dtype_score(dtype: pl.DataType) -> float:
+    """How plausible a dtype is for a join key."""
+    if dtype.is_integer() or dtype in (pl.Utf8, pl.Categorical, pl.Enum, pl.Date):
+        return 1.0
+    if dtype.is_temporal():
+        return 0.5
+    if dtype.is_float():
+        return 0.2
+    if dtype == pl.Boolean:
+        return 0.1
+    return 0.0
+
+
+def name_score(name: str) -> float:
+    """Score a column name: key-like names 1.0, measure-like names 0.3, else 0.7."""
+    if KEY_NAME_PATTERN.search(name):
+        return 1.0
+    if MEASURE_NAME_PATTERN.search(name):
+        return 0.3
+    return 0.7
+
+
+def _normalize_name(name: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def name_similarity(left: str, right: str) -> float:
+    """Similarity of two column names in [0, 1], ignoring case and separators."""
+    left, right = _normalize_name(left), _normalize_name(right)
+    if not left or not right:
+        return 0.0
+    return SequenceMatcher(None, left, right).ratio()
+
+
+def _feature_exprs(
+    name: str, dtype: pl.DataType, approx: Optional[bool]
+) -> Dict[str, pl.Expr]:
+    # With approx=None both distinct counts are computed, see profile_frame
+    col = pl.col(name)
+    present = col.drop_nulls()
+    exprs = {"count": col.count(), "null_count": col.null_count()}
+
+    if approx is not False:
+        exprs["n_unique_estimate"] = present.to_physical().approx_n_unique()
+    if not approx:
+        exprs["n_unique"] = present.n_unique()
+
+    if dtype.is_numeric() or dtype.is_temporal():
+        diffs = present.to_physical().diff().drop_nulls()
+        exprs["monotonic"] = (diffs >= 0).all() | (diffs <= 0).all()
+
+    if dtype in (pl.Utf8, pl.Categorical, pl.Enum):
+        lengths = present.cast(pl.Utf8).str.len_chars()
+        exprs["length_mean"] = lengths.mean()
+        exprs["length_std"] = lengths.std()
+
+    return exprs
+
+
+def _feature(stats: dict, indices: Dict[str, int], name: str, key: str):
+    """One feature of a column from the fused scan, None if it wasn't computed."""
+    return stats.get(f"{indices[name]}:{key}") if name in indices else None
+
+
+def key_scores(frame: Union[pl.DataFrame, pl.LazyFrame]) -> pl.DataFrame:
+    """
+    Score how likely each column is to be a join key, in one fused scan.
+
+    The score in [0, 1] combines the dtype (integers, strings and dates
+    rank high, floats and booleans low), the distinct and null ratios, how
+    regular string lengths are, whether values are monotonic, and whether
+    the name looks like an identifier or a measurement.
+
+    Returns
+    -------
+    pl.DataFrame
+        One row per column with its features and ``key_score``
+    """
+    lf = frame.lazy()
+    schema = lf.collect_schema()
+    approx = (
+        frame.height >= APPROX_DISTINCT_MIN_ROWS
+        if isinstance(frame, pl.DataFrame)
+        else None
+    )
+
+    # Nested, Decimal and Null columns can't be keys (their dtype scores 0)
+    # and don't support every aggregation
+    scored = {
+        n: d
+        for n, d in schema.items()
+        if not (d.is_nested() or d in (pl.Decimal, pl.Null))
+    }
+    exprs = [
+        expr.alias(f"{i}:{feature}")
+        for i, (name, dtype) in enumerate(scored.items())
+        for feature, expr in _feature_exprs(name, dtype, approx).items()
+    ]
+    if approx is None:
+        # Count rows in the same scan rather than in a separate pass
+        exprs.append(pl.len().alias("len"))
+    stats = lf.select(exprs).collect().row(0, named=True) if exprs else {}
+    if approx is None:
+        approx = stats["len"] >= APPROX_DISTINCT_MIN_ROWS
+
+    indices = {name: i for i, name in enumerate(scored)}
+    rows: List[dict] = []
+    for name, dtype in schema.items():
+        row = {
+            "column": name,
+            "dtype_score": _dtype_score(dtype),
+            "name_score": name_score(name),
+        }
+        feature = partial(_feature, stats, indices, name)
+
+        count, null_count = feature("count") or 0, feature("null_count") or 0
+        total = count + null_count
+        distinct = feature("n_unique_estimate" if approx else "n_unique") or 0
+        row["distinct_ratio"] = min(distinct / count, 1.0) if count else 0.0
+        row["null_ratio"] = null_count / total if total else 1.0
+        row["monotonic"] = bool(feature("monotonic"))
+
+        length_mean = feature("length_mean")
+        if length_mean:
+            variation = (feature("length_std") or 0.0) / length_mean
+            regularity = 1 / (1 + variation)
+            if length_mean > MAX_KEY_LENGTH:
+                regularity *= 0.5
+            row["length_regularity"] = regularity
+        else:
+            row["length_regularity"] = 1.0
+
+        structure = (
+            0.4 * row["distinct_ratio"]
+            + 0.2 * (1 - row["null_ratio"])
+            + 0.2 * row["length_regularity"]
+            + 0.2 * row["monotonic"]
+        )
+        row["key_score"] = row["dtype_score"] * row["name_score"] * structure
+        rows.append(row)
+
+    return pl.DataFrame(
+        rows,
+        schema={
+            "column": pl.Utf8(),
+            "dtype_score": pl.Float64(),
+            "name_score": pl.Float64(),
+            "distinct_ratio": pl.Float64(),
+            "null_ratio": pl.Float64(),
+            "monotonic": pl.Boolean(),
+            "length_regularity": pl.Float64(),
+            "key_score": pl.Float64(),
+        },
+        orient="row",
+    )
+
+
+def pair_score(left_score: float, right_score: float, similarity: float) -> float:
+    """Combine two column key scores and their name similarity into one score."""
+    return 0.7 * math.sqrt(left_score * right_score) + 0.3 * similarity
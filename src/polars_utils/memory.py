@@ -0,0 +1,163 @@
+import re
+import threading
+import polars as pl
+from typing import Tuple, Union
+
+from .bloom import estimated_filter_bytes, needs_filter
+
+# Rough size of one boxed Python value (object header, hash slot, payload)
+PYTHON_VALUE_BYTES = 80
+
+# Fraction of the budget analyses may plan to use, leaving headroom for
+# allocations that aren't estimated up front
+BUDGET_HEADROOM = 0.8
+
+_UNITS = {
+    "": 1,
+    "b": 1,
+    "kb": 1000,
+    "mb": 1000**2,
+    "gb": 1000**3,
+    "tb": 1000**4,
+    "kib": 1024,
+    "mib": 1024**2,
+    "gib": 1024**3,
+    "tib": 1024**4,
+}
+
+MemoryBudget = Union[int, str]
+
+
+def parse_memory_budget(budget: MemoryBudget) -> int:
+    """
+    Convert a memory budget to bytes.
+
+    Accepts a number of bytes or a string such as ``"512MiB"`` or ``"2GB"``.
+    """
+    if isinstance(budget, int):
+        nbytes = budget
+    else:
+        match = re.fullmatch(r"\s*([\d.]+)\s*([a-zA-Z]*)\s*", str(budget))
+        if match is None or match.group(2).lower() not in _UNITS:
+            raise ValueError(f"Invalid memory budget: {budget!r}")
+        nbytes = int(float(match.group(1)) * _UNITS[match.group(2).lower()])
+
+    if nbytes <= 0:
+        raise ValueError(f"Memory budget must be positive, got {budget!r}")
+    return nbytes
+
+
+class MemoryTracker:
+    """
+    Track memory used by an analysis against a budget.
+
+    Usage is estimated, not measured: analyses register each Polars buffer
+    they materialise with ``retain`` using ``estimated_size()``, and Python
+    collections at ``PYTHON_VALUE_BYTES`` per value, then ``release`` what
+    they free again. ``peak_bytes`` is the largest total held at once, so
+    it covers the analysis' own allocations rather than the whole process.
+    Safe to share between threads analysing in parallel.
+    """
+
+    def __init__(self, budget: MemoryBudget):
+        self.budget_bytes = parse_memory_budget(budget)
+        self.used_bytes = 0
+        self.peak_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def available_bytes(self) -> int:
+        """Bytes that may still be planned for within the budget headroom."""
+        return max(int(self.budget_bytes * BUDGET_HEADROOM) - self.used_bytes, 0)
+
+    def fits(self, nbytes: int) -> bool:
+        """Whether allocating ``nbytes`` more stays within the budget headroom."""
+        return nbytes <= self.available_bytes
+
+    def retain(self, nbytes: int):
+        """Count ``nbytes`` as held until they are released."""
+        with self._lock:
+            self.used_bytes += nbytes
+            self.peak_bytes = max(self.peak_bytes, self.used_bytes)
+
+    def release(self, nbytes: int):
+        """Stop counting ``nbytes`` retained earlier."""
+        with self._lock:
+            self.used_bytes -= nbytes
+
+
+# Rows sampled per side when exact join matching doesn't fit the budget
+SAMPLE_ROWS = 10_000
+
+
+def _non_null(series: pl.Series) -> int:
+    return len(series) - series.null_count()
+
+
+def join_strategy(
+    tracker: MemoryTracker,
+    left: pl.Series,
+    right: pl.Series,
+    extra_bytes: int = 0,
+    approximate: bool = False,
+) -> Tuple[str, int]:
+    """
+    Pick the most exact join matching strategy that fits the budget.
+
+    With ``approximate``, pairs with a large column use Bloom filters
+    instead of exact matching when they fit.
+
+    Returns
+    -------
+    Tuple[str, int]
+        The strategy and the bytes it is estimated to hold, ``extra_bytes``
+        included. The strategy is ``"exact"`` to compare sets of unique
+        values in Python, ``"bloom"`` to probe Bloom filters of the large
+        columns, ``"sample"`` to estimate match rates from a sample of each
+        side, or ``"count_only"`` to skip matching entirely
+    """
+    if approximate and (needs_filter(left) or needs_filter(right)):
+        # Large columns become filters, small ones are hashed inside Polars
+        bloom_bytes = sum(
+            estimated_filter_bytes(_non_null(values))
+            if needs_filter(values)
+            else values.estimated_size()
+            for values in (left, right)
+        )
+        if tracker.fits(bloom_bytes + extra_bytes):
+            return "bloom", bloom_bytes + extra_bytes
+    else:
+        exact_bytes = PYTHON_VALUE_BYTES * (_non_null(left) + _non_null(right))
+        if tracker.fits(exact_bytes + extra_bytes):
+            return "exact", exact_bytes + extra_bytes
+
+    # Membership tests hash the searched column inside Polars
+    sample_bytes = left.estimated_size() + right.estimated_size()
+    if tracker.fits(sample_bytes + extra_bytes):
+        return "sample", sample_bytes + extra_bytes
+    return "count_only", extra_bytes
+
+
+def approximate_unique(series: pl.Series) -> int:
+    """Distinct non-null values estimated with HyperLogLog."""
+    return series.drop_nulls().to_physical().approx_n_unique()
+
+
+def sampled_match_counts(
+    left: pl.Series, right: pl.Series, sample_rows: int = SAMPLE_ROWS, seed: int = 0
+) -> Tuple[int, int]:
+    """
+    Estimate how many rows of each side have a match on the other side.
+
+    A seeded sample of each side is tested for membership in the full other
+    column and the match rate is scaled to the column length.
+    """
+
+    def estimate(values: pl.Series, other: pl.Series) -> int:
+        if len(values) == 0:
+            return 0
+        sample = values.sample(min(sample_rows, len(values)), seed=seed)
+        rate = sample.is_in(other.drop_nulls()).fill_null(False).mean()
+        return round(rate * len(values))
+
+    return estimate(left, right), estimate(right, left)
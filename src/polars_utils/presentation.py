@@ -0,0 +1,110 @@
+# rich is an optional dependency, imported only when something is rendered
+import importlib.util
+from typing import TYPE_CHECKING, Iterable, List, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+    from .extensions import JoinResult
+
+T = TypeVar("T")
+
+
+def rich_available() -> bool:
+    """Whether rich is installed, without importing it."""
+    return importlib.util.find_spec("rich") is not None
+
+
+def _require_rich():
+    if not rich_available():
+        raise ImportError(
+            "Displaying results requires rich: pip install 'polars-utils[rich]'"
+        )
+
+
+def progress(
+    sequence: Iterable[T], description: str, total: Optional[int] = None
+) -> Iterable[T]:
+    """
+    Iterate over a sequence with a progress bar when rich is installed.
+
+    The bar is drawn on stderr so it never mixes with results written to
+    stdout. Without rich the sequence is iterated silently. Pass ``total``
+    for iterators without a length.
+    """
+    if not rich_available():
+        return iter(sequence)
+
+    from rich.console import Console  # pylint: disable=import-outside-toplevel
+    from rich.progress import track  # pylint: disable=import-outside-toplevel
+
+    return track(
+        sequence, description=description, total=total, console=Console(stderr=True)
+    )
+
+
+def _results_table(results: List["JoinResult"], title: str) -> "Table":
+    """Build a rich table for one page of join results."""
+    from rich import box  # pylint: disable=import-outside-toplevel
+    from rich.table import Table  # pylint: disable=import-outside-toplevel
+
+    table = Table(title=title, box=box.DOUBLE)
+
+    # Add columns
+    table.add_column("Left Column")
+    table.add_column("Right Column")
+    table.add_column("Types")
+    table.add_column("Left Match %")
+    table.add_column("Right Match %")
+    table.add_column("Matched Rows")
+    table.add_column("Coercion Applied")
+
+    # Add rows
+    for result in results:
+        left_match_pct = (
+            f"{result.left_match_percentage:.1f}%"
+            if result.left_match_percentage > 0
+            else "-"
+        )
+        right_match_pct = (
+            f"{result.right_match_percentage:.1f}%"
+            if result.right_match_percentage > 0
+            else "-"
+        )
+
+        table.add_row(
+            result.left_column,
+            result.right_column,
+            result.type_mismatch_desc
+            if result.has_type_mismatch
+            else str(result.left_dtype),
+            left_match_pct,
+            right_match_pct,
+            str(result.matched_rows) if result.matched_rows > 0 else "-",
+            result.coercion_applied or "-",
+        )
+
+    return table
+
+
+def display_results(results: List["JoinResult"], page_size: Optional[int] = None):
+    """
+    Display join analysis results in a formatted table.
+
+    With ``page_size``, results are rendered and printed one page-sized
+    table at a time instead of as a single table.
+    """
+    _require_rich()
+    from rich.console import Console  # pylint: disable=import-outside-toplevel
+
+    console = Console()
+    if page_size is None or len(results) <= page_size:
+        console.print(_results_table(results, "Join Analysis Results"))
+        return
+
+    n_pages = -(-len(results) // page_size)
+    for page in range(n_pages):
+        chunk = results[page * page_size : (page + 1) * page_size]
+        console.print(
+            _results_table(chunk, f"Join Analysis Results ({page + 1}/{n_pages})")
+        )
@@ -0,0 +1,188 @@
+import polars as pl
+from typing import Dict, List, Optional, Union
+
+from .histogram import histogram_expr
+
+# Frames with at least this many rows get approximate distinct counts by default
+APPROX_DISTINCT_MIN_ROWS = 1_000_000
+
+PROFILE_SCHEMA = {
+    "column": pl.Utf8(),
+    "dtype": pl.Utf8(),
+    "count": pl.UInt32(),
+    "null_count": pl.UInt32(),
+    "null_fraction": pl.Float64(),
+    "n_unique": pl.UInt32(),
+    "n_unique_approx": pl.Boolean(),
+    "min": pl.Utf8(),
+    "max": pl.Utf8(),
+    "mean": pl.Float64(),
+    "min_length": pl.UInt32(),
+    "max_length": pl.UInt32(),
+    "numeric_like_fraction": pl.Float64(),
+    "top_pattern": pl.Utf8(),
+}
+
+
+def value_pattern(expr: pl.Expr) -> pl.Expr:
+    """Reduce string values to their shape: digits become 9, letters become A."""
+    return expr.str.replace_all(r"[0-9]", "9").str.replace_all(r"[^\W\d_]", "A")
+
+
+def _is_orderable(dtype: pl.DataType) -> bool:
+    return dtype.is_numeric() or dtype.is_temporal() or dtype in (pl.Utf8, pl.Boolean)
+
+
+def _distinct_exprs(
+    present: pl.Expr, dtype: pl.DataType, approx_distinct: Optional[bool]
+) -> Dict[str, pl.Expr]:
+    """Exact and/or approximate distinct counts of the non-null values."""
+    if dtype == pl.Null:
+        return {"n_unique": pl.lit(0, dtype=pl.UInt32)}
+    if isinstance(dtype, pl.Array):
+        present = present.arr.to_list()
+    if dtype.is_nested():
+        # The lazy engine rejects n_unique on nested dtypes
+        return {"n_unique": present.is_first_distinct().sum()}
+
+    # Physical values count the same, and Decimals support nothing else
+    values = present.to_physical()
+    exprs = {}
+    if approx_distinct is not False:
+        exprs["n_unique_estimate"] = values.approx_n_unique()
+    if not approx_distinct:
+        exprs["n_unique"] = values.n_unique()
+    return exprs
+
+
+def _column_exprs(
+    name: str,
+    dtype: pl.DataType,
+    approx_distinct: Optional[bool],
+    patterns: bool,
+    histogram: bool,
+) -> Dict[str, pl.Expr]:
+    """
+    Aggregations profiling one column, keyed by profile field.
+
+    The approximate distinct count is keyed ``n_unique_estimate``; with
+    ``approx_distinct=None`` both counts are computed, to choose from once
+    the row count is known.
+    """
+    col = pl.col(name)
+    present = col.drop_nulls()
+
+    exprs = {
+        "count": col.count(),
+        "null_count": col.null_count(),
+        **_distinct_exprs(present, dtype, approx_distinct),
+    }
+
+    if dtype == pl.Duration:
+        # Durations can't be cast to strings
+        exprs["min"] = col.min().dt.to_string("iso")
+        exprs["max"] = col.max().dt.to_string("iso")
+    elif _is_orderable(dtype):
+        exprs["min"] = col.min().cast(pl.Utf8)
+        exprs["max"] = col.max().cast(pl.Utf8)
+
+    if dtype.is_numeric() or dtype == pl.Boolean:
+        exprs["mean"] = col.mean()
+
+    if dtype in (pl.Utf8, pl.Categorical, pl.Enum):
+        text = col.cast(pl.Utf8)
+        lengths = text.str.len_chars()
+        exprs.setdefault("min", text.min())
+        exprs.setdefault("max", text.max())
+        exprs["min_length"] = lengths.min()
+        exprs["max_length"] = lengths.max()
+        exprs["numeric_like_fraction"] = text.cast(pl.Float64, strict=False).count() / (
+            text.count().clip(1)
+        )
+        if patterns:
+            exprs["top_pattern"] = value_pattern(text).drop_nulls().mode().min()
+
+    if histogram and dtype.is_numeric():
+        exprs["histogram"] = histogram_expr(col)
+    elif histogram and dtype.is_temporal():
+        exprs["histogram"] = histogram_expr(col, kind="temporal")
+
+    return exprs
+
+
+def profile_frame(
+    frame: Union[pl.DataFrame, pl.LazyFrame],
+    histogram: bool = False,
+    patterns: bool = True,
+    approx_distinct: Optional[bool] = None,
+) -> pl.DataFrame:
+    """
+    Profile every column of a DataFrame or LazyFrame in one fused scan.
+
+    All per-column statistics are built as expressions of a single
+    ``select``, which Polars evaluates in parallel across columns.
+
+    Parameters
+    ----------
+    frame : pl.DataFrame or pl.LazyFrame
+        The data to profile
+    histogram : bool, default False
+        If True, add a ``histogram`` column with a sparkline of each numeric
+        and temporal column
+    patterns : bool, default True
+        If True, report the most common value shape of string columns
+        (digits as 9, letters as A); ties go to the smallest pattern
+    approx_distinct : bool, optional
+        Use approximate (HyperLogLog) distinct counts. By default they are
+        used for frames with at least 1,000,000 rows.
+
+    Returns
+    -------
+    pl.DataFrame
+        One row per column with its dtype, counts, nulls, cardinality,
+        range, mean, string lengths and value patterns. Statistics that
+        don't apply to a dtype are null.
+    """
+    lf = frame.lazy()
+    schema = lf.collect_schema()
+
+    if approx_distinct is None and isinstance(frame, pl.DataFrame):
+        approx_distinct = frame.height >= APPROX_DISTINCT_MIN_ROWS
+
+    plan: List[Dict[str, pl.Expr]] = [
+        _column_exprs(name, dtype, approx_distinct, patterns, histogram)
+        for name, dtype in schema.items()
+    ]
+    exprs = [
+        expr.alias(f"{i}:{field}")
+        for i, column_exprs in enumerate(plan)
+        for field, expr in column_exprs.items()
+    ]
+    if approx_distinct is None:
+        # Counting rows in the same scan avoids a separate pass over the
+        # LazyFrame; both distinct counts are computed and one is kept
+        exprs.append(pl.len().alias("len"))
+    stats = lf.select(exprs).collect().row(0, named=True) if exprs else {}
+    if approx_distinct is None:
+        approx_distinct = stats["len"] >= APPROX_DISTINCT_MIN_ROWS
+
+    rows = []
+    for i, (name, dtype) in enumerate(schema.items()):
+        row = {field: stats.get(f"{i}:{field}") for field in PROFILE_SCHEMA}
+        total = row["count"] + row["null_count"]
+        row.update(
+            column=name,
+            dtype=str(dtype),
+            null_fraction=row["null_count"] / total if total else 0.0,
+            n_unique_approx=approx_distinct and f"{i}:n_unique_estimate" in stats,
+        )
+        if row["n_unique_approx"]:
+            row["n_unique"] = stats[f"{i}:n_unique_estimate"]
+        if histogram:
+            row["histogram"] = stats.get(f"{i}:histogram")
+        rows.append(row)
+
+    result_schema = dict(PROFILE_SCHEMA)
+    if histogram:
+        result_schema["histogram"] = pl.Utf8()
+    return pl.DataFrame(rows, schema=result_schema, orient="row")
@@ -0,0 +1,251 @@
+import polars as pl
+from typing import Iterator, List, Optional, Tuple
+
+from .memory import PYTHON_VALUE_BYTES, MemoryTracker
+
+
+def search_result_frame(
+    column_name: str,
+    matches: Optional[pl.Series],
+    row_count: int,
+    n: Optional[int] = None,
+    rows_matched: Optional[int] = None,
+) -> pl.DataFrame:
+    """
+    Build a single regex search result row for one column.
+
+    Parameters
+    ----------
+    column_name : str
+        Name of the searched column
+    matches : pl.Series, optional
+        Matching values, or None if the column had no matches
+    row_count : int
+        Number of rows in the searched frame, used for the percentage
+    n : int, optional
+        Number of matching values when ``matches`` holds only some of them
+    rows_matched : int, optional
+        Number of rows with a match, when rows can hold several values
+
+    Returns
+    -------
+    pl.DataFrame
+        One-row DataFrame with columns column_name, matches, n and percent
+    """
+    values = [] if matches is None else matches.cast(pl.Utf8()).to_list()
+    n = len(values) if n is None else n
+    rows_matched = n if rows_matched is None else rows_matched
+    return pl.DataFrame(
+        {
+            "column_name": [column_name],
+            "matches": pl.Series([values], dtype=pl.List(pl.Utf8())),
+            "n": pl.Series([n], dtype=pl.UInt32()),
+            "percent": pl.Series(
+                [rows_matched / row_count if row_count else 0.0], dtype=pl.Float64()
+            ),
+        }
+    )
+
+
+def search_column(series: pl.Series, pattern: str) -> pl.Series:
+    """Return the values of a column that match a regex pattern, as strings."""
+    values = series.cast(pl.Utf8())
+    return values.filter(values.str.contains(pattern))
+
+
+def _leaf_matches(
+    expr: pl.Expr, dtype: pl.DataType, path: str, pattern: str
+) -> Iterator[Tuple[str, pl.Expr, pl.Expr, bool]]:
+    """
+    Walk a nested dtype down to its leaves, matching each one.
+
+    Yields the field path of every leaf with a per-row match flag and the
+    matching values: the value or null for values outside lists, a list of
+    matches per row inside them. Lists are searched element-wise with
+    ``list.eval``, so nothing is exploded or formatted as a whole.
+    """
+    if isinstance(dtype, pl.Struct):
+        for field in dtype.fields:
+            yield from _leaf_matches(
+                expr.struct.field(field.name), field.dtype, f"{path}.{field.name}", pattern
+            )
+    elif isinstance(dtype, (pl.List, pl.Array)):
+        if isinstance(dtype, pl.Array):
+            expr = expr.arr.to_list()
+        for leaf_path, hit, values, in_list in _leaf_matches(
+            pl.element(), dtype.inner, f"{path}[]", pattern
+        ):
+            flat = values.explode() if in_list else values
+            yield (
+                leaf_path,
+                expr.list.eval(hit).list.any(),
+                expr.list.eval(flat.drop_nulls()),
+                True,
+            )
+    else:
+        text = expr.cast(pl.Utf8())
+        hit = text.str.contains(pattern)
+        yield path, hit, pl.when(hit).then(text), False
+
+
+def _nested_leaves(
+    column: str, dtype: pl.DataType, pattern: str
+) -> List[Tuple[str, pl.Expr, pl.Expr]]:
+    """Path, flat matching values and per-row match flag of every leaf."""
+    return [
+        (path, (values.explode() if in_list else values).drop_nulls(), hit)
+        for path, hit, values, in_list in _leaf_matches(
+            pl.col(column), dtype, column, pattern
+        )
+    ]
+
+
+def nested_search_exprs(
+    column: str, dtype: pl.DataType, pattern: str
+) -> List[Tuple[str, pl.Expr, pl.Expr]]:
+    """
+    Search expressions for every leaf of a Struct, List or Array column.
+
+    Leaves are reported with a field path such as ``payload.user.email``,
+    with ``[]`` marking list elements (``tags[]``).
+
+    Returns
+    -------
+    List[Tuple[str, pl.Expr, pl.Expr]]
+        For each leaf, its path, an expression aggregating the matching
+        values into one list, and one counting the rows with a match
+    """
+    return [
+        (
+            path,
+            values.implode().alias(f"{i}:matches"),
+            hit.fill_null(False).sum().alias(f"{i}:rows"),
+        )
+        for i, (path, values, hit) in enumerate(_nested_leaves(column, dtype, pattern))
+    ]
+
+
+def search_nested_column(
+    frame: pl.DataFrame, column: str, pattern: str
+) -> List[Tuple[str, pl.Series, int]]:
+    """
+    Search every leaf of a nested column in one pass.
+
+    Returns
+    -------
+    List[Tuple[str, pl.Series, int]]
+        Path, matching values and number of rows with a match of each leaf
+    """
+    exprs = nested_search_exprs(column, frame.schema[column], pattern)
+    if not exprs:
+        return []
+    return nested_search_results(
+        frame.select(expr for _, *pair in exprs for expr in pair), exprs
+    )
+
+
+def nested_search_results(
+    found: pl.DataFrame, exprs: List[Tuple[str, pl.Expr, pl.Expr]]
+) -> List[Tuple[str, pl.Series, int]]:
+    """Unpack the one-row result of ``nested_search_exprs`` into one entry per leaf."""
+    return [
+        (path, found.get_column(f"{i}:matches")[0], found.get_column(f"{i}:rows")[0])
+        for i, (path, _, _) in enumerate(exprs)
+    ]
+
+
+def budgeted_match_count(
+    n: int, value_bytes: float, tracker: MemoryTracker
+) -> Tuple[int, str]:
+    """
+    Number of matches to keep within the memory budget, and the strategy.
+
+    The strategy is ``"exact"`` if all ``n`` matches fit, ``"truncated"``
+    if only the first ones do, or ``"count_only"`` if none do.
+    """
+    kept = min(n, int(tracker.available_bytes // value_bytes))
+    if kept == n:
+        return kept, "exact"
+    if kept > 0:
+        return kept, "truncated"
+    return kept, "count_only"
+
+
+def search_column_within_budget(
+    series: pl.Series, pattern: str, tracker: MemoryTracker
+) -> Tuple[pl.Series, int, str]:
+    """
+    Search a column, keeping only as many matches as fit the memory budget.
+
+    Returns
+    -------
+    Tuple[pl.Series, int, str]
+        The kept matches, the total number of matches, and the strategy:
+        ``"exact"`` if all matches were kept, ``"truncated"`` if only the
+        first ones were, or ``"count_only"`` if none fit
+    """
+    values = series.cast(pl.Utf8())
+    is_match = values.str.contains(pattern).fill_null(False)
+    n = is_match.sum()
+    if n == 0:
+        return values.clear(), 0, "exact"
+
+    # Each kept match is held in Polars and again as a Python string
+    value_bytes = values.estimated_size() / len(values) + PYTHON_VALUE_BYTES
+    kept, strategy = budgeted_match_count(n, value_bytes, tracker)
+    return values.filter(is_match & (is_match.cum_sum() <= kept)), n, strategy
+
+
+def search_nested_column_within_budget(
+    frame: pl.DataFrame, column: str, pattern: str, tracker: MemoryTracker
+) -> List[Tuple[str, pl.Series, int, int, str]]:
+    """
+    Search every leaf of a nested column, keeping matches within the budget.
+
+    Returns
+    -------
+    List[Tuple[str, pl.Series, int, int, str]]
+        Path, kept matches, total matches, rows with a match and strategy
+        of each leaf, as in ``search_column_within_budget``
+    """
+    leaves = _nested_leaves(column, frame.schema[column], pattern)
+    if not leaves:
+        return []
+
+    # Count matches first so only the kept ones are ever materialized
+    counts = frame.select(
+        expr
+        for i, (_, values, hit) in enumerate(leaves)
+        for expr in (
+            values.len().alias(f"{i}:n"),
+            values.str.len_bytes().sum().alias(f"{i}:bytes"),
+            hit.fill_null(False).sum().alias(f"{i}:rows"),
+        )
+    ).row(0, named=True)
+
+    budgets = []
+    for i in range(len(leaves)):
+        n = counts[f"{i}:n"]
+        if n == 0:
+            budgets.append((0, 0, "exact"))
+            continue
+        # Each kept match is held in Polars and again as a Python string
+        value_bytes = counts[f"{i}:bytes"] / n + PYTHON_VALUE_BYTES
+        kept, strategy = budgeted_match_count(n, value_bytes, tracker)
+        budgets.append((n, kept, strategy))
+
+    found = frame.select(
+        values.head(kept).implode().alias(f"{i}:matches")
+        for i, ((_, values, _), (_, kept, _)) in enumerate(zip(leaves, budgets))
+    )
+    return [
+        (path, found.get_column(f"{i}:matches")[0], n, counts[f"{i}:rows"], strategy)
+        for i, ((path, _, _), (n, _, strategy)) in enumerate(zip(leaves, budgets))
+    ]
+
+
+def concat_search_results(dfs: List[pl.DataFrame]) -> pl.DataFrame:
+    """Concatenate per-column search rows, keeping the schema when empty."""
+    if not dfs:
+        return search_result_frame("", None, 0).clear()
+    return pl.concat(dfs, how="vertical")
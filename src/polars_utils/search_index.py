@@ -0,0 +1,492 @@
+import re
+import time
+import polars as pl
+from typing import Dict, List, Optional, Set, Tuple
+
+from .search import (
+    search_result_frame,
+    search_column,
+    search_nested_column,
+    concat_search_results,
+)
+
+# Parsed pattern nodes: ("literal", char), ("start",) for the start of the
+# value, ("assert",) for other zero-width assertions, ("group", branches),
+# ("repeat", min_repeat, node) and ("other",) for anything matching a class
+Node = Tuple
+
+# Trigrams extracted at once while building an index, bounding the
+# (trigram, row) pairs held in memory
+BUILD_CHUNK_TRIGRAMS = 1_000_000
+
+_LITERAL_ESCAPES = {"a": "\a", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+_HEX_DIGITS = {"x": 2, "u": 4, "U": 8}
+_FLAGS = set("imsuxRU-")
+
+
+class _PatternParser:
+    """
+    Parser for the Rust regex syntax Polars uses, detailed only as far as
+    literal extraction needs. Raises ValueError for syntax it doesn't model
+    (lookarounds, backreferences, verbose mode) or that Rust rejects.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.pos = 0
+        self.case_insensitive = False
+
+    def parse(self) -> List[Node]:
+        branches = self._alternation(multiline=False)
+        if self.pos != len(self.pattern):
+            raise ValueError("unbalanced parenthesis")
+        return branches[0] if len(branches) == 1 else [("group", branches)]
+
+    def _next(self) -> str:
+        if self.pos >= len(self.pattern):
+            raise ValueError("unexpected end of pattern")
+        self.pos += 1
+        return self.pattern[self.pos - 1]
+
+    def _peek(self, text: str) -> bool:
+        return self.pattern.startswith(text, self.pos)
+
+    def _until(self, end: str) -> str:
+        stop = self.pattern.find(end, self.pos)
+        if stop < 0:
+            raise ValueError(f"missing {end!r}")
+        text, self.pos = self.pattern[self.pos : stop], stop + len(end)
+        return text
+
+    def _alternation(self, multiline: bool) -> List[List[Node]]:
+        branches: List[List[Node]] = [[]]
+        while self.pos < len(self.pattern) and not self._peek(")"):
+            char = self._next()
+            if char == "|":
+                branches.append([])
+                continue
+            if char in "*+?{":
+                items = branches[-1]
+                if not items or items[-1][0] in ("start", "assert", "repeat"):
+                    raise ValueError("repetition without an expression")
+                items[-1] = ("repeat", self._repeat_min(char), items[-1])
+                continue
+
+            if char == "(":
+                node, multiline = self._group(multiline)
+                if node is None:
+                    continue
+            elif char == "[":
+                self._skip_class()
+                node = ("other",)
+            elif char == "\\":
+                node = self._escape()
+            elif char == ".":
+                node = ("other",)
+            elif char == "^":
+                node = ("assert",) if multiline else ("start",)
+            elif char == "$":
+                node = ("assert",)
+            else:
+                node = ("literal", char)
+            branches[-1].append(node)
+        return branches
+
+    def _repeat_min(self, char: str) -> int:
+        if char == "{":
+            lower, _, upper = self._until("}").partition(",")
+            if not (lower or upper) or not (lower + upper).isdigit():
+                raise ValueError("invalid repetition")
+            min_repeat = int(lower or 0)
+        else:
+            min_repeat = 1 if char == "+" else 0
+        if self._peek("?"):
+            # Lazy repetition requires the same minimum
+            self.pos += 1
+        return min_repeat
+
+    def _group(self, multiline: bool) -> Tuple[Optional[Node], bool]:
+        """Parse a group after its ``(``; bare flag groups return no node."""
+        inner = multiline
+        if self._peek("?"):
+            self.pos += 1
+            lookbehind = self._peek("<=") or self._peek("<!")
+            if self._peek("P<") or self._peek("<") and not lookbehind:
+                # Named group
+                self._until(">")
+            elif self._peek(":"):
+                self.pos += 1
+            else:
+                flags = re.match(r"[^:)]*", self.pattern[self.pos :]).group()
+                if not flags or not set(flags) <= _FLAGS:
+                    raise ValueError(f"unsupported group (?{flags}")
+                enabled, _, disabled = flags.partition("-")
+                if "x" in enabled:
+                    raise ValueError("verbose mode is not supported")
+                self.case_insensitive |= "i" in enabled
+                if "m" in enabled or "m" in disabled:
+                    inner = "m" in enabled
+                self.pos += len(flags)
+                if self._next() == ")":
+                    # Flags apply to the rest of the enclosing group
+                    return None, inner
+
+        branches = self._alternation(inner)
+        if self._next() != ")":
+            raise ValueError("unbalanced parenthesis")
+        return ("group", branches), multiline
+
+    def _escape(self) -> Node:
+        char = self._next()
+        if char in _LITERAL_ESCAPES:
+            return ("literal", _LITERAL_ESCAPES[char])
+        if char in _HEX_DIGITS:
+            if self._peek("{"):
+                self.pos += 1
+                digits = self._until("}")
+            else:
+                digits = self.pattern[self.pos : self.pos + _HEX_DIGITS[char]]
+                self.pos += _HEX_DIGITS[char]
+            return ("literal", chr(int(digits, 16)))
+        if char in "pP":
+            if self._peek("{"):
+                self._until("}")
+            else:
+                self._next()
+            return ("other",)
+        if char in "dDsSwW":
+            return ("other",)
+        if char == "A":
+            return ("start",)
+        if char in "bBz<>":
+            if char == "b" and self._peek("{"):
+                self._until("}")
+            return ("assert",)
+        if char.isascii() and not char.isalnum():
+            return ("literal", char)
+        raise ValueError(f"unsupported escape \\{char}")
+
+    def _skip_class(self):
+        """Skip a bracketed class after its ``[``, including nested classes."""
+        depth = 0
+        opened = True
+        while True:
+            if opened:
+                # A leading ] (after an optional ^) is a literal member
+                depth += 1
+                opened = False
+                if self._peek("^"):
+                    self.pos += 1
+                if self._peek("]"):
+                    self.pos += 1
+            char = self._next()
+            if char == "\\":
+                self._next()
+            elif char == "[" and self._peek(":"):
+                name = self.pattern[self.pos + 1 :].partition(":]")[0]
+                if name.lstrip("^").isalpha():
+                    # POSIX class such as [:alpha:]
+                    self.pos += len(name) + 3
+                else:
+                    opened = True
+            elif char == "[":
+                opened = True
+            elif char == "]":
+                depth -= 1
+                if depth == 0:
+                    return
+
+
+def _parse_pattern(pattern: str) -> Optional[List[Node]]:
+    """Parse a Rust regex, or None if it can't be analysed or ignores case."""
+    parser = _PatternParser(pattern)
+    try:
+        items = parser.parse()
+    except ValueError:
+        return None
+    return None if parser.case_insensitive else items
+
+
+def required_literals(pattern: str) -> Optional[List[str]]:
+    """
+    Extract literal substrings that every match of a regex must contain.
+
+    Patterns follow the Rust regex syntax used by Polars. Only top-level
+    concatenations are considered: alternations, character classes and
+    optional repeats end the current literal run. Returns None when the
+    pattern cannot be analysed (unsupported syntax or case-insensitive
+    matching), in which case no narrowing is possible.
+    """
+    items = _parse_pattern(pattern)
+    if items is None:
+        return None
+
+    runs: List[str] = []
+    current: List[str] = []
+
+    def flush():
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    def walk(nodes: List[Node]):
+        for node in nodes:
+            kind = node[0]
+            if kind == "literal":
+                current.append(node[1])
+            elif kind in ("start", "assert"):
+                # Anchors are zero-width and don't break a literal run
+                continue
+            elif kind == "group" and len(node[1]) == 1:
+                walk(node[1][0])
+            elif kind == "repeat":
+                _, min_repeat, sub = node
+                flush()
+                if min_repeat >= 1:
+                    walk([sub])
+                    flush()
+            else:
+                flush()
+
+    walk(items)
+    flush()
+    return runs
+
+
+def anchored_prefix(pattern: str) -> Optional[str]:
+    """
+    Literal prefix every match must start with, for patterns anchored with ``^``.
+
+    Returns None if the pattern is not anchored at the start of the value,
+    uses multiline or case-insensitive matching, or cannot be analysed.
+    """
+    items = _parse_pattern(pattern)
+    if not items or items[0][0] != "start":
+        return None
+
+    prefix = []
+    for node in items[1:]:
+        if node[0] != "literal":
+            break
+        prefix.append(node[1])
+
+    return "".join(prefix) or None
+
+
+def pattern_trigrams(pattern: str) -> Optional[Set[str]]:
+    """Trigrams required by a regex pattern, or None if it can't be narrowed."""
+    runs = required_literals(pattern)
+    if runs is None:
+        return None
+    trigrams = {run[i : i + 3] for run in runs for i in range(len(run) - 2)}
+    return trigrams or None
+
+
+def _column_postings(df: pl.DataFrame, column: str) -> Tuple[pl.DataFrame, int]:
+    """
+    Build the trigram -> sorted row index posting lists for one column.
+
+    Rows are indexed in chunks of about ``BUILD_CHUNK_TRIGRAMS`` trigrams so
+    only one chunk's (trigram, row) pairs are held at a time. Returns the
+    postings and the estimated peak bytes of the build.
+    """
+    value_len = pl.col("value").str.len_chars()
+    n_chars = df.select(pl.col(column).cast(pl.Utf8()).str.len_chars().sum()).item()
+    chunk_rows = max(df.height * BUILD_CHUNK_TRIGRAMS // max(n_chars or 0, 1), 1)
+    chunks = []
+    peak_bytes = 0
+    for offset in range(0, max(df.height, 1), chunk_rows):
+        pairs = (
+            df.lazy()
+            .slice(offset, chunk_rows)
+            .select(pl.col(column).cast(pl.Utf8()).alias("value"))
+            .with_row_index("row", offset=offset)
+            .filter(value_len >= 3)
+            .with_columns(pl.int_ranges(0, value_len - 2, dtype=pl.UInt32).alias("start"))
+            .explode("start")
+            .select(
+                pl.col("value").str.slice(pl.col("start"), 3).alias("trigram"),
+                pl.col("row"),
+            )
+            .collect()
+        )
+        chunks.append(pairs.group_by("trigram").agg(pl.col("row").unique().sort()))
+        peak_bytes = max(
+            peak_bytes,
+            pairs.estimated_size() + sum(c.estimated_size() for c in chunks),
+        )
+
+    # Chunks cover ascending rows, so concatenating keeps row lists sorted
+    postings = (
+        pl.concat(chunks)
+        .group_by("trigram", maintain_order=True)
+        .agg(pl.col("row").flatten().alias("rows"))
+    )
+    chunk_bytes = sum(c.estimated_size() for c in chunks)
+    return postings, max(peak_bytes, chunk_bytes + postings.estimated_size())
+
+
+class SearchIndex:
+    """
+    Trigram inverted index over the string representation of a DataFrame.
+
+    Built once with ``df.polars_utils.build_search_index()`` and reused by
+    ``regex_search(..., index=...)``. Each indexed column maps trigrams to the
+    rows containing them; a query intersects the posting lists of the
+    pattern's required trigrams and only runs the exact regex on the
+    surviving candidate rows. Patterns without extractable trigrams fall back
+    to a full scan, so results are always identical to an unindexed search.
+
+    Every distinct trigram of a value costs one 4-byte row entry, so the
+    index (``nbytes``) is typically several times the size of the string
+    data it covers. Building it holds one chunk of (trigram, row)
+    pairs on top of that; ``build_peak_bytes`` estimates the peak.
+
+    The index assumes the frame is not modified after it is built.
+    """
+
+    def __init__(
+        self,
+        df: pl.DataFrame,
+        postings: Dict[str, pl.DataFrame],
+        build_seconds: float,
+        build_peak_bytes: Optional[int] = None,
+    ):
+        self._df = df
+        self.postings = postings
+        self.build_seconds = build_seconds
+        self.build_peak_bytes = build_peak_bytes
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory footprint of the posting lists in bytes."""
+        return sum(p.estimated_size() for p in self.postings.values())
+
+    @property
+    def indexed_columns(self) -> List[str]:
+        return list(self.postings)
+
+    def is_valid_for(self, df: pl.DataFrame) -> bool:
+        """Whether this index was built for the given DataFrame."""
+        return df is self._df
+
+    def summary(self) -> pl.DataFrame:
+        """Per-column trigram counts, posting entries and memory footprint."""
+        return pl.DataFrame(
+            {
+                "column_name": self.indexed_columns,
+                "trigrams": [p.height for p in self.postings.values()],
+                "postings": [
+                    p["rows"].list.len().sum() for p in self.postings.values()
+                ],
+                "bytes": [p.estimated_size() for p in self.postings.values()],
+            },
+            schema={
+                "column_name": pl.Utf8(),
+                "trigrams": pl.UInt32(),
+                "postings": pl.UInt64(),
+                "bytes": pl.UInt64(),
+            },
+        )
+
+    def candidate_rows(self, column: str, pattern: str) -> Optional[pl.Series]:
+        """
+        Rows of a column that may match the pattern.
+
+        Returns None if the column is not indexed or the pattern has no
+        required trigrams, meaning every row is a candidate.
+        """
+        trigrams = pattern_trigrams(pattern)
+        if trigrams is None or column not in self.postings:
+            return None
+
+        hits = self.postings[column].filter(pl.col("trigram").is_in(list(trigrams)))
+        if hits.height < len(trigrams):
+            # At least one required trigram never occurs in this column
+            return pl.Series("row", [], dtype=pl.UInt32())
+
+        return (
+            hits.select(pl.col("rows").explode().alias("row"))
+            .group_by("row")
+            .len()
+            .filter(pl.col("len") == len(trigrams))
+            .sort("row")
+            .get_column("row")
+        )
+
+    def regex_search(self, pattern: str, matches_only: bool = False) -> pl.DataFrame:
+        """
+        Search all columns for values matching a regex pattern using the index.
+
+        Returns the same result as ``df.polars_utils.regex_search``.
+        """
+        dfs = []
+        row_count = self._df.shape[0]
+
+        for col, dtype in self._df.schema.items():
+            if dtype.is_nested():
+                # Nested columns aren't indexed and are searched leaf by leaf
+                leaves = search_nested_column(self._df, col, pattern)
+            else:
+                series = self._df.get_column(col)
+                rows = self.candidate_rows(col, pattern)
+                if rows is not None:
+                    series = series.gather(rows)
+                matches = search_column(series, pattern)
+                leaves = [(col, matches, len(matches))]
+
+            for path, matches, rows_matched in leaves:
+                if len(matches) == 0:
+                    if matches_only:
+                        continue
+                    matches = None
+
+                dfs.append(
+                    search_result_frame(
+                        path, matches, row_count, rows_matched=rows_matched
+                    )
+                )
+
+        return concat_search_results(dfs)
+
+    def __repr__(self) -> str:
+        return (
+            f"SearchIndex(columns={len(self.postings)}, "
+            f"size={self.nbytes / 1024**2:.2f} MiB, "
+            f"build_peak={(self.build_peak_bytes or 0) / 1024**2:.2f} MiB, "
+            f"build_time={self.build_seconds:.3f}s)"
+        )
+
+
+def build_search_index(
+    df: pl.DataFrame, columns: Optional[List[str]] = None
+) -> SearchIndex:
+    """
+    Build a trigram search index for a DataFrame.
+
+    Parameters
+    ----------
+    df : pl.DataFrame
+        The DataFrame to index. It must not be modified afterwards.
+    columns : List[str], optional
+        Columns to index. Defaults to all non-nested columns.
+
+    Returns
+    -------
+    SearchIndex
+        Index reporting its build time (``build_seconds``), memory
+        footprint (``nbytes``) and estimated peak memory while it was
+        built (``build_peak_bytes``)
+    """
+    start = time.perf_counter()
+    columns = columns or [
+        col for col, dtype in df.schema.items() if not dtype.is_nested()
+    ]
+    postings = {}
+    peak_bytes = 0
+    for col in columns:
+        postings[col], column_peak = _column_postings(df, col)
+        # Postings of the columns built so far are held while building this one
+        retained = sum(p.estimated_size() for p in postings.values())
+        peak_bytes = max(peak_bytes, retained - postings[col].estimated_size() + column_peak)
+    return SearchIndex(df, postings, time.perf_counter() - start, peak_bytes)
@@ -0,0 +1,249 @@
+import math
+import polars as pl
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .histogram import DEFAULT_CHARS, bin_index, validate_bin_range
+
+
+def _merge_extreme(a, b, pick):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return pick(a, b)
+
+
+@dataclass
+class HistogramSketch:
+    """
+    Mergeable histogram with fixed bin edges.
+
+    Sketches with the same edges can be built independently per batch and
+    merged, and render the same sparkline as
+    ``create_histogram(bin_range=(lower, upper))`` over all merged values.
+    Values outside the edges are clamped into the first or last bin.
+    """
+
+    lower: float
+    upper: float
+    n_bins: int = 20
+    counts: List[int] = field(default_factory=list)
+    count: int = 0
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+
+    def __post_init__(self):
+        validate_bin_range((self.lower, self.upper))
+        if not self.counts:
+            self.counts = [0] * self.n_bins
+        if len(self.counts) != self.n_bins:
+            raise ValueError("counts must have one entry per bin")
+
+    @classmethod
+    def from_series(
+        cls,
+        values: pl.Series,
+        bin_range: Tuple[float, float],
+        n_bins: int = 20,
+    ) -> "HistogramSketch":
+        """Build a sketch from a batch of values."""
+        sketch = cls(bin_range[0], bin_range[1], n_bins)
+        sketch.update(values)
+        return sketch
+
+    @classmethod
+    def from_groups(
+        cls,
+        df: pl.DataFrame,
+        column: str,
+        by: str,
+        bin_range: Tuple[float, float],
+        n_bins: int = 20,
+    ) -> Dict[Any, "HistogramSketch"]:
+        """
+        Build one sketch per group of a batch in a single ``group_by``.
+
+        Returns
+        -------
+        Dict[Any, HistogramSketch]
+            Sketches keyed by group value
+        """
+        lower, upper = bin_range
+        values = df.filter(pl.col(column).is_not_null())
+        counts = (
+            values.group_by(
+                by, bin_index(pl.col(column), lower, upper, n_bins).alias("bin")
+            )
+            .len()
+            .drop_nulls("bin")
+        )
+        extremes = values.group_by(by).agg(
+            pl.col(column).min().alias("min"), pl.col(column).max().alias("max")
+        )
+
+        sketches = {
+            key: cls(lower, upper, n_bins, min_value=min_value, max_value=max_value)
+            for key, min_value, max_value in extremes.iter_rows()
+        }
+        for key, bin_, n in counts.iter_rows():
+            sketches[key].counts[bin_] += n
+            sketches[key].count += n
+        return sketches
+
+    def update(self, values: pl.Series) -> "HistogramSketch":
+        """Add a batch of values to the sketch in one vectorized pass."""
+        values = values.drop_nulls()
+        if len(values) == 0:
+            return self
+
+        bins = values.to_frame("value").select(
+            bin_index(pl.col("value"), self.lower, self.upper, self.n_bins)
+        )
+        for bin_, n in bins.to_series().drop_nulls().value_counts().iter_rows():
+            self.counts[bin_] += n
+            self.count += n
+        self.min_value = _merge_extreme(self.min_value, values.min(), min)
+        self.max_value = _merge_extreme(self.max_value, values.max(), max)
+        return self
+
+    def merge(self, other: "HistogramSketch") -> "HistogramSketch":
+        """Return a new sketch combining this sketch with another."""
+        if (self.lower, self.upper, self.n_bins) != (other.lower, other.upper, other.n_bins):
+            raise ValueError("Only sketches with the same bin edges can be merged")
+        return HistogramSketch(
+            self.lower,
+            self.upper,
+            self.n_bins,
+            [a + b for a, b in zip(self.counts, other.counts)],
+            self.count + other.count,
+            _merge_extreme(self.min_value, other.min_value, min),
+            _merge_extreme(self.max_value, other.max_value, max),
+        )
+
+    def render(self, chars: str = DEFAULT_CHARS, show_stats: bool = True) -> str:
+        """Render the merged state as a single-line histogram."""
+        if self.count == 0:
+            return ""
+
+        max_count = max(self.counts)
+        hist = "".join(chars[c * (len(chars) - 1) // max_count] for c in self.counts)
+        if show_stats:
+            return f"{hist}  [{self.min_value:.2f}, {self.max_value:.2f}]"
+        return hist
+
+
+@dataclass
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative error guarantees (DDSketch-style).
+
+    Values are counted in logarithmically sized buckets, so any quantile is
+    estimated within ``relative_accuracy`` of the true value. Sketches with
+    the same accuracy can be merged by adding bucket counts.
+    """
+
+    relative_accuracy: float = 0.01
+    positive: Dict[int, int] = field(default_factory=dict)
+    negative: Dict[int, int] = field(default_factory=dict)
+    zero_count: int = 0
+    count: int = 0
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+
+    def __post_init__(self):
+        if not 0 < self.relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+
+    @property
+    def gamma(self) -> float:
+        return (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+
+    @classmethod
+    def from_series(
+        cls, values: pl.Series, relative_accuracy: float = 0.01
+    ) -> "QuantileSketch":
+        """Build a sketch from a batch of values."""
+        sketch = cls(relative_accuracy)
+        sketch.update(values)
+        return sketch
+
+    def update(self, values: pl.Series) -> "QuantileSketch":
+        """Add a batch of values to the sketch in one vectorized pass."""
+        values = values.drop_nulls().cast(pl.Float64)
+        if len(values) == 0:
+            return self
+
+        log_gamma = math.log(self.gamma)
+        buckets = (
+            values.to_frame("value")
+            .filter(pl.col("value") != 0)
+            .group_by(
+                (pl.col("value") > 0).alias("positive"),
+                (pl.col("value").abs().log() / log_gamma).ceil().cast(pl.Int64).alias("index"),
+            )
+            .len()
+        )
+        for positive, index, n in buckets.iter_rows():
+            store = self.positive if positive else self.negative
+            store[index] = store.get(index, 0) + n
+
+        self.zero_count += len(values) - buckets["len"].sum()
+        self.count += len(values)
+        self.min_value = _merge_extreme(self.min_value, values.min(), min)
+        self.max_value = _merge_extreme(self.max_value, values.max(), max)
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Return a new sketch combining this sketch with another."""
+        if self.relative_accuracy != other.relative_accuracy:
+            raise ValueError("Only sketches with the same accuracy can be merged")
+
+        def merge_store(a: Dict[int, int], b: Dict[int, int]) -> Dict[int, int]:
+            merged = dict(a)
+            for index, n in b.items():
+                merged[index] = merged.get(index, 0) + n
+            return merged
+
+        return QuantileSketch(
+            self.relative_accuracy,
+            merge_store(self.positive, other.positive),
+            merge_store(self.negative, other.negative),
+            self.zero_count + other.zero_count,
+            self.count + other.count,
+            _merge_extreme(self.min_value, other.min_value, min),
+            _merge_extreme(self.max_value, other.max_value, max),
+        )
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-th quantile, or None if the sketch is empty."""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        # Most negative values live in the largest negative buckets
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return self._clamp(-self._bucket_value(index))
+
+        seen += self.zero_count
+        if seen > rank:
+            return self._clamp(0.0)
+
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return self._clamp(self._bucket_value(index))
+
+        return self.max_value
+
+    def _bucket_value(self, index: int) -> float:
+        return 2 * self.gamma**index / (self.gamma + 1)
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min_value), self.max_value)
@@ -0,0 +1,214 @@
+import math
+import polars as pl
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+
+@dataclass
+class ColumnStats:
+    """
+    Per-column numbers used by profiling and join analysis.
+
+    ``min_value`` and ``max_value`` are None when the column has no orderable
+    values or its range is unknown. ``from_metadata`` tells whether the
+    numbers were read from Parquet statistics instead of scanning the data.
+    """
+
+    dtype: pl.DataType
+    total_rows: int
+    null_count: int
+    min_value: Any = None
+    max_value: Any = None
+    from_metadata: bool = False
+
+    @property
+    def has_range(self) -> bool:
+        return self.min_value is not None and self.max_value is not None
+
+    def ranges_overlap(self, other: "ColumnStats") -> bool:
+        """
+        Whether the value ranges of two columns may share a value.
+
+        Returns True whenever either range is unknown or the ranges can't
+        be compared, so only provably disjoint columns are rejected.
+        """
+        if not self.has_range or not other.has_range:
+            return True
+        try:
+            return not (
+                self.max_value < other.min_value or other.max_value < self.min_value
+            )
+        except TypeError:
+            return True
+
+
+def _has_orderable_range(dtype: pl.DataType) -> bool:
+    return dtype.is_numeric() or dtype.is_temporal() or dtype in (pl.Utf8, pl.Boolean)
+
+
+def frame_column_stats(
+    frame: Union[pl.DataFrame, pl.LazyFrame],
+) -> Dict[str, ColumnStats]:
+    """
+    Compute null counts and value ranges of every column in one fused scan.
+
+    Returns
+    -------
+    Dict[str, ColumnStats]
+        Statistics keyed by column name
+    """
+    lf = frame.lazy()
+    schema = lf.collect_schema()
+
+    exprs = [pl.len().alias("len")]
+    for i, (name, dtype) in enumerate(schema.items()):
+        exprs.append(pl.col(name).null_count().alias(f"{i}:null_count"))
+        if _has_orderable_range(dtype):
+            exprs.append(pl.col(name).min().alias(f"{i}:min"))
+            exprs.append(pl.col(name).max().alias(f"{i}:max"))
+    row = lf.select(exprs).collect().row(0, named=True)
+
+    return {
+        name: ColumnStats(
+            dtype=dtype,
+            total_rows=row["len"],
+            null_count=row[f"{i}:null_count"],
+            min_value=row.get(f"{i}:min"),
+            max_value=row.get(f"{i}:max"),
+        )
+        for i, (name, dtype) in enumerate(schema.items())
+    }
+
+
+def _is_valid_bound(value: Any) -> bool:
+    # Some writers store NaN as float min/max, which orders nothing
+    return not (isinstance(value, float) and math.isnan(value))
+
+
+def _statistics_summary(metadata, index: int) -> Optional[Dict[str, Any]]:
+    """Combine the row group statistics of one column, or None if incomplete."""
+    null_count = 0
+    min_value = max_value = None
+
+    for rg in range(metadata.num_row_groups):
+        row_group = metadata.row_group(rg)
+        statistics = row_group.column(index).statistics
+        if statistics is None or not statistics.has_null_count:
+            return None
+        null_count += statistics.null_count
+
+        if statistics.null_count == row_group.num_rows:
+            continue
+        if not statistics.has_min_max:
+            return None
+        if not (_is_valid_bound(statistics.min) and _is_valid_bound(statistics.max)):
+            return None
+        min_value = statistics.min if min_value is None else min(min_value, statistics.min)
+        max_value = statistics.max if max_value is None else max(max_value, statistics.max)
+
+    return {"null_count": null_count, "min_value": min_value, "max_value": max_value}
+
+
+def _as_column_value(value: Any, dtype: pl.DataType) -> Any:
+    # pyarrow returns some bounds (e.g. Durations) as their raw integers
+    return None if value is None else pl.Series([value]).cast(dtype).item()
+
+
+def parquet_column_stats(path: Union[str, Path]) -> Dict[str, ColumnStats]:
+    """
+    Read per-column statistics from a Parquet footer without scanning data.
+
+    Row counts, null counts and min/max values are taken from row group
+    statistics. Columns with missing or unusable statistics (nested columns,
+    files written without statistics, NaN float bounds) are computed with a
+    single scan of only those columns. Without pyarrow every column is
+    scanned.
+
+    Returns
+    -------
+    Dict[str, ColumnStats]
+        Statistics keyed by column name, in file column order
+    """
+    lf = pl.scan_parquet(path)
+    schema = lf.collect_schema()
+
+    try:
+        import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return frame_column_stats(lf)
+
+    metadata = pq.ParquetFile(path).metadata
+    leaf_indexes = {
+        metadata.schema.column(i).path: i for i in range(metadata.num_columns)
+    }
+
+    stats: Dict[str, ColumnStats] = {}
+    missing: List[str] = []
+    for name, dtype in schema.items():
+        # Only top-level leaf columns map directly to a DataFrame column
+        summary = None
+        if name in leaf_indexes and _has_orderable_range(dtype):
+            summary = _statistics_summary(metadata, leaf_indexes[name])
+        if summary is not None:
+            try:
+                for bound in ("min_value", "max_value"):
+                    summary[bound] = _as_column_value(summary[bound], dtype)
+            except (pl.exceptions.PolarsError, TypeError, OverflowError):
+                summary = None
+        if summary is None:
+            missing.append(name)
+            continue
+        stats[name] = ColumnStats(
+            dtype=dtype, total_rows=metadata.num_rows, from_metadata=True, **summary
+        )
+
+    if missing:
+        stats.update(frame_column_stats(lf.select(missing)))
+    return {name: stats[name] for name in schema.names()}
+
+
+def profile_parquet(path: Union[str, Path]) -> pl.DataFrame:
+    """
+    Profile a Parquet file from its footer statistics.
+
+    Only columns whose statistics are missing are scanned, so profiling
+    thousands of files reads little more than their footers.
+
+    Returns
+    -------
+    pl.DataFrame
+        One row per column with its dtype, row and null counts, range and
+        whether the numbers came from file metadata
+    """
+    rows = []
+    for name, stats in parquet_column_stats(path).items():
+        rows.append(
+            {
+                "column": name,
+                "dtype": str(stats.dtype),
+                "total_rows": stats.total_rows,
+                "null_count": stats.null_count,
+                "null_fraction": stats.null_count / stats.total_rows
+                if stats.total_rows
+                else 0.0,
+                "min": None if stats.min_value is None else str(stats.min_value),
+                "max": None if stats.max_value is None else str(stats.max_value),
+                "from_metadata": stats.from_metadata,
+            }
+        )
+
+    return pl.DataFrame(
+        rows,
+        schema={
+            "column": pl.Utf8(),
+            "dtype": pl.Utf8(),
+            "total_rows": pl.UInt64(),
+            "null_count": pl.UInt64(),
+            "null_fraction": pl.Float64(),
+            "min": pl.Utf8(),
+            "max": pl.Utf8(),
+            "from_metadata": pl.Boolean(),
+        },
+        orient="row",
+    )
@@ -0,0 +1,117 @@
+import asyncio
+import time
+import polars as pl
+import pytest
+from polars_utils import TimeBudgetExceeded, extensions, register_extensions
+
+
+@pytest.fixture
+def wide_dfs():
+    """Create two frames with one obvious key pair among many columns."""
+    left = pl.DataFrame(
+        {"id": list(range(100)), **{f"x{i}": list(range(i, i + 100)) for i in range(8)}}
+    )
+    right = pl.DataFrame(
+        {"ID": list(range(50, 150)), **{f"y{i}": [str(i)] * 100 for i in range(8)}}
+    )
+    return left, right
+
+
+def _pairs(results):
+    return {(r.left_column, r.right_column): r.matched_rows for r in results}
+
+
+def test_parallel_matches_sequential(wide_dfs):
+    """Analyzing pairs in a thread pool gives the same results."""
+    left, right = wide_dfs
+    register_extensions()
+
+    sequential = left.polars_utils.analyze_joins(right)
+    parallel = left.polars_utils.analyze_joins(right, max_workers=4)
+
+    assert _pairs(parallel) == _pairs(sequential)
+    assert not parallel.partial
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_time_budget_returns_partial_results(wide_dfs, max_workers):
+    """An exhausted time budget flags the results and lists skipped pairs."""
+    left, right = wide_dfs
+    register_extensions()
+
+    complete = left.polars_utils.analyze_joins(right, time_budget_s=60)
+    expired = left.polars_utils.analyze_joins(
+        right, time_budget_s=0, max_workers=max_workers
+    )
+
+    assert not complete.partial and len(complete) == 81
+    assert expired.partial
+    assert len(expired) + len(expired.pending_pairs) == 81
+    if max_workers is None:
+        # Sequential evaluation checks the deadline before the first pair
+        assert expired.pending_pairs[0] == ("id", "ID")
+
+
+def test_time_budget_includes_setup_scans(wide_dfs, monkeypatch):
+    """The time budget starts at the call, before column statistics are scanned."""
+    left, right = wide_dfs
+    register_extensions()
+    scan = extensions.frame_column_stats
+
+    def slow_scan(frame):
+        time.sleep(0.1)
+        return scan(frame)
+
+    monkeypatch.setattr(extensions, "frame_column_stats", slow_scan)
+    results = left.polars_utils.analyze_joins(right, time_budget_s=0.1)
+
+    assert len(results) == 0 and len(results.pending_pairs) == 81
+
+
+def test_analyze_joins_async_yields_results(wide_dfs):
+    """Results stream from the executor, most promising pairs first."""
+    left, right = wide_dfs
+    register_extensions()
+
+    async def collect():
+        stream = left.polars_utils.analyze_joins_async(right, max_workers=1)
+        return [r async for r in stream]
+
+    results = asyncio.run(collect())
+
+    assert len(results) == 81
+    assert (results[0].left_column, results[0].right_column) == ("id", "ID")
+    assert results[0].matched_rows == 50
+
+
+def test_analyze_joins_async_cancellation(wide_dfs):
+    """Closing the stream early cancels the remaining pairs."""
+    left, right = wide_dfs
+    register_extensions()
+
+    async def first_two():
+        stream = left.polars_utils.analyze_joins_async(right, max_workers=1)
+        results = [await anext(stream), await anext(stream)]
+        await stream.aclose()
+        return results
+
+    assert len(asyncio.run(first_two())) == 2
+
+
+def test_analyze_joins_async_time_budget(wide_dfs):
+    """An exhausted time budget is raised with the pairs left unevaluated."""
+    left, right = wide_dfs
+    register_extensions()
+
+    async def expired():
+        results = []
+        stream = left.polars_utils.analyze_joins_async(right, time_budget_s=0)
+        with pytest.raises(TimeBudgetExceeded) as raised:
+            async for result in stream:
+                results.append(result)
+        return results, raised.value.pending_pairs
+
+    results, pending = asyncio.run(expired())
+
+    assert pending and len(results) + len(pending) == 81
+    assert not {(r.left_column, r.right_column) for r in results} & set(pending)
@@ -0,0 +1,75 @@
+import polars as pl
+import pytest
+from polars_utils import BloomFilter, register_extensions
+from polars_utils.bloom import BLOOM_MIN_ROWS
+
+
+@pytest.fixture
+def dimension_dfs():
+    """Create a large dimension frame and a fact frame half matching it."""
+    n = 2 * BLOOM_MIN_ROWS
+    dimension = pl.DataFrame({"user_id": pl.int_range(0, n, eager=True)})
+    facts = pl.DataFrame(
+        {"user_id": pl.int_range(0, 2_000, eager=True) * 200 - n // 2}
+    )
+    return dimension, facts
+
+
+def test_filter_has_no_false_negatives():
+    """Every inserted value is found and absent values stay near the bound."""
+    values = pl.Series(range(50_000)).cast(pl.Utf8)
+    bloom = BloomFilter.from_series(values, n_keys=50_000)
+
+    assert bloom.contains(values).all()
+    absent = pl.Series(range(50_000, 150_000)).cast(pl.Utf8)
+    observed = bloom.count_matches(absent) / len(absent)
+    assert 0 < bloom.false_positive_rate < 0.05
+    assert observed == pytest.approx(bloom.false_positive_rate, abs=0.01)
+    assert bloom.nbytes < 50_000 * 2
+
+
+def test_approximate_joins_match_exact_counts(dimension_dfs):
+    """Approximate matching of a large column stays within the reported bound."""
+    dimension, facts = dimension_dfs
+    register_extensions()
+
+    exact = facts.polars_utils.analyze_joins(dimension)[0]
+    approx = facts.polars_utils.analyze_joins(dimension, approximate=True)[0]
+
+    assert exact.strategy == "exact" and exact.false_positive_rate is None
+    assert approx.strategy == "bloom"
+    assert 0 < approx.false_positive_rate < 0.05
+    # The dimension side is matched exactly against the facts' values
+    assert approx.right_matched_rows == exact.right_matched_rows == 1_000
+    # The facts side is probed against the filter and may over-count
+    unmatched = facts.height - exact.left_matched_rows
+    assert exact.left_matched_rows <= approx.left_matched_rows
+    assert approx.left_matched_rows - exact.left_matched_rows <= max(
+        unmatched * approx.false_positive_rate * 3, 5
+    )
+
+
+def test_small_pairs_stay_exact_in_approximate_mode():
+    """Columns below the size threshold are still compared exactly."""
+    register_extensions()
+    df = pl.DataFrame({"id": [1, 2, 3]})
+
+    result = df.polars_utils.analyze_joins(df, approximate=True)[0]
+
+    assert result.strategy == "exact"
+    assert result.matched_rows == 3
+
+
+def test_mismatched_dtypes_share_hashes(dimension_dfs):
+    """Float and integer keys are cast to one dtype before hashing."""
+    dimension, facts = dimension_dfs
+    register_extensions()
+    facts = facts.with_columns(pl.col("user_id").cast(pl.Float64))
+
+    exact = facts.polars_utils.analyze_joins(dimension)[0]
+    approx = facts.polars_utils.analyze_joins(dimension, approximate=True)[0]
+
+    assert approx.strategy == "bloom"
+    assert exact.left_matched_rows == 1_000
+    assert approx.right_matched_rows == exact.right_matched_rows == 1_000
+    assert exact.left_matched_rows <= approx.left_matched_rows
@@ -0,0 +1,130 @@
+import dataclasses
+import polars as pl
+import pytest
+from polars_utils import register_extensions, ResultCache
+from polars_utils.cache import frame_fingerprint
+from polars_utils.stats import frame_column_stats
+
+
+@pytest.fixture
+def sample_df():
+    """Create a sample DataFrame for cache tests."""
+    return pl.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "email": ["alice@test.com", "bob@test.com", "carol@example.org"],
+        }
+    )
+
+
+def test_frame_fingerprint(sample_df):
+    """Fingerprints depend on schema, contents and row order."""
+    assert frame_fingerprint(sample_df) == frame_fingerprint(sample_df.clone())
+    assert frame_fingerprint(sample_df) != frame_fingerprint(sample_df.reverse())
+    assert frame_fingerprint(sample_df) != frame_fingerprint(
+        sample_df.with_columns(pl.col("id").cast(pl.Int32))
+    )
+
+    nested = pl.DataFrame({"tags": [["a"], ["b", "c"], None], "s": [{"x": 1}, None, {"x": 2}]})
+    assert frame_fingerprint(nested) == frame_fingerprint(nested.clone())
+    assert frame_fingerprint(nested) != frame_fingerprint(
+        nested.with_columns(pl.Series("tags", [["a"], ["b"], ["c"]]))
+    )
+
+
+def test_regex_search_cache_hits(sample_df):
+    """Repeated searches on unchanged frames are served from the cache."""
+    register_extensions()
+    cache = ResultCache()
+
+    first = sample_df.polars_utils.regex_search("test", cache=cache)
+    second = sample_df.clone().polars_utils.regex_search("test", cache=cache)
+    other = sample_df.polars_utils.regex_search("example", cache=cache)
+
+    assert first.equals(second)
+    assert first.equals(sample_df.polars_utils.regex_search("test"))
+    assert not other.equals(first)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+
+def test_categorical_frames_with_different_values():
+    """Categorical columns are fingerprinted by value, not by physical code."""
+    register_extensions()
+    cache = ResultCache()
+    a = pl.DataFrame({"email": ["alice@test.com", "bob"]}, schema={"email": pl.Categorical})
+    b = pl.DataFrame({"email": ["carol@x.org", "dave"]}, schema={"email": pl.Categorical})
+
+    assert frame_fingerprint(a) != frame_fingerprint(b)
+    a.polars_utils.regex_search("test", cache=cache)
+    cached = b.polars_utils.regex_search("test", cache=cache)
+    assert cached.equals(b.polars_utils.regex_search("test"))
+    assert cached["matches"].to_list() == [[]]
+
+
+def test_analyze_joins_cache(sample_df):
+    """Cached join results are copies that callers can't corrupt."""
+    register_extensions()
+    cache = ResultCache()
+
+    first = sample_df.polars_utils.analyze_joins(sample_df, cache=cache)
+    first[0].matched_rows = -1
+    second = sample_df.polars_utils.analyze_joins(sample_df, cache=cache)
+
+    assert cache.hits == 1
+    assert second[0].matched_rows != -1
+
+
+def test_analyze_joins_cache_keys_on_column_stats(sample_df):
+    """Results computed from other column statistics aren't reused."""
+    register_extensions()
+    cache = ResultCache()
+    stats = frame_column_stats(sample_df)
+    wrong = {
+        name: dataclasses.replace(column, null_count=column.total_rows)
+        for name, column in stats.items()
+    }
+
+    scanned = sample_df.polars_utils.analyze_joins(sample_df, cache=cache)
+    supplied = sample_df.polars_utils.analyze_joins(
+        sample_df, cache=cache, column_stats=(wrong, wrong)
+    )
+    again = sample_df.polars_utils.analyze_joins(
+        sample_df, cache=cache, column_stats=(wrong, wrong)
+    )
+
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert scanned[0].left_null_count != supplied[0].left_null_count
+    assert again[0].left_null_count == supplied[0].left_null_count
+
+
+def test_lru_eviction_and_invalidation(sample_df):
+    """Test entry limits, LRU order and explicit invalidation."""
+    register_extensions()
+    other_df = sample_df.head(2)
+    cache = ResultCache(max_entries=2)
+
+    sample_df.polars_utils.regex_search("a", cache=cache)
+    sample_df.polars_utils.regex_search("b", cache=cache)
+    sample_df.polars_utils.regex_search("a", cache=cache)  # "a" is now most recent
+    sample_df.polars_utils.regex_search("c", cache=cache)  # evicts "b"
+
+    assert cache.evictions == 1
+    sample_df.polars_utils.regex_search("a", cache=cache)
+    assert cache.hits == 2
+
+    other_df.polars_utils.regex_search("a", cache=cache)
+    assert cache.invalidate(sample_df) == 1
+    assert len(cache) == 1
+    assert cache.invalidate() == 1
+    assert cache.nbytes == 0
+
+
+def test_max_bytes_limit(sample_df):
+    """Results larger than max_bytes are never cached."""
+    register_extensions()
+    cache = ResultCache(max_bytes=1)
+
+    sample_df.polars_utils.regex_search("test", cache=cache)
+
+    assert len(cache) == 0
+    assert cache.stats()["misses"] == 1
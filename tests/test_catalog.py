@@ -0,0 +1,95 @@
+import polars as pl
+import pytest
+from polars_utils import register_extensions, search_catalog
+from polars_utils.catalog import parquet_row_groups
+
+
+@pytest.fixture
+def catalog_sources(tmp_path):
+    """Create a catalog with in-memory, lazy and file-backed sources."""
+    customers = pl.DataFrame(
+        {
+            "customer_id": [1, 2, 3],
+            "email": ["alice@test.com", "bob@example.org", "carol@test.com"],
+        }
+    )
+    orders = pl.DataFrame({"order_id": [10, 11], "note": ["call bob@test.com", None]})
+    events = pl.DataFrame(
+        {
+            "event": ["apple", "apricot", "banana", "cherry", None, None],
+            "empty": pl.Series([None] * 6, dtype=pl.Utf8),
+        }
+    )
+
+    events_path = tmp_path / "events.parquet"
+    events.write_parquet(events_path, row_group_size=2)
+    orders_path = tmp_path / "orders.arrow"
+    orders.write_ipc(orders_path)
+
+    return {
+        "customers": customers,
+        "customers_lazy": customers.lazy(),
+        "orders": orders_path,
+        "events": str(events_path),
+    }
+
+
+def test_search_catalog_combines_sources(catalog_sources):
+    """Test that results from all sources are combined with a source column."""
+    results = search_catalog(r"@test\.com", catalog_sources, matches_only=True)
+
+    assert results.columns == ["source", "column_name", "matches", "n", "percent"]
+    assert results["source"].to_list() == ["customers", "customers_lazy", "orders"]
+    assert results["n"].to_list() == [2, 2, 1]
+
+
+def test_search_catalog_matches_regex_search(catalog_sources):
+    """Catalog results for a DataFrame equal regex_search on that DataFrame."""
+    register_extensions()
+    df = catalog_sources["customers"]
+
+    results = search_catalog("o", {"customers": df}, max_workers=1)
+    expected = df.polars_utils.regex_search("o")
+
+    assert results.drop("source").equals(expected)
+
+
+def test_parquet_row_group_pruning(catalog_sources):
+    """Test that Parquet statistics skip row groups that can't match."""
+    path = catalog_sources["events"]
+
+    groups = parquet_row_groups(path, "^ap")
+    assert groups["event"] == [0]
+    assert groups["empty"] == []
+
+    results = search_catalog("^ap", {"events": path})
+    event = results.filter(pl.col("column_name") == "event")
+    assert event["matches"].to_list() == [["apple", "apricot"]]
+    assert event["percent"][0] == pytest.approx(2 / 6)
+
+
+def test_search_catalog_rejects_unknown_sources(tmp_path):
+    """Test errors for unsupported sources."""
+    with pytest.raises(ValueError):
+        search_catalog("x", {"bad": tmp_path / "data.xlsx"})
+    with pytest.raises(TypeError):
+        search_catalog("x", {"bad": [1, 2, 3]})
+
+
+def test_search_catalog_nested_columns(tmp_path):
+    """Nested columns are searched by leaf in every kind of source."""
+    df = pl.DataFrame(
+        {"payload": [{"user": {"email": "a@test.com"}, "tags": ["b@test.com", "x"]}]}
+    )
+    path = tmp_path / "payloads.parquet"
+    df.write_parquet(path)
+
+    results = search_catalog(
+        r"@test\.com", {"df": df, "lazy": df.lazy(), "file": path}, matches_only=True
+    )
+
+    assert results["column_name"].to_list() == [
+        "payload.user.email",
+        "payload.tags[]",
+    ] * 3
+    assert results["matches"].to_list() == [["a@test.com"], ["b@test.com"]] * 3
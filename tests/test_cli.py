@@ -0,0 +1,76 @@
+import json
+import polars as pl
+import pytest
+from polars_utils.cli import main
+
+
+@pytest.fixture
+def data_files(tmp_path):
+    """Write the same kind of data as Parquet, Arrow IPC and CSV files."""
+    customers = pl.DataFrame(
+        {"id": [1, 2, 3, 4], "email": ["a@x.com", "b@y.org", None, "c@x.com"]}
+    )
+    orders = pl.DataFrame({"customer_id": [2, 3, 3, 9], "note": ["hi", "a@x.com", "x", "y"]})
+
+    paths = {
+        "customers": tmp_path / "customers.parquet",
+        "orders": tmp_path / "orders.arrow",
+        "orders_csv": tmp_path / "orders.csv",
+    }
+    customers.write_parquet(paths["customers"])
+    orders.write_ipc(paths["orders"])
+    orders.write_csv(paths["orders_csv"])
+    return paths
+
+
+def test_joins_command(data_files, capsys):
+    """The joins command prints the best column pairs as JSON."""
+    code = main(
+        ["joins", str(data_files["customers"]), str(data_files["orders"]), "--limit", "1"]
+    )
+    results = json.loads(capsys.readouterr().out)
+
+    assert code == 0
+    assert len(results) == 1
+    assert (results[0]["left_column"], results[0]["right_column"]) == ("id", "customer_id")
+    assert results[0]["right_matched_rows"] == 3
+
+
+def test_search_command(data_files, capsys):
+    """The search command combines matches from every file."""
+    sources = [str(data_files[name]) for name in ("customers", "orders", "orders_csv")]
+    main(["search", r"@x\.com", *sources, "--matches-only", "--workers", "2"])
+    results = pl.DataFrame(json.loads(capsys.readouterr().out))
+
+    assert results["source"].to_list() == sources
+    assert results["n"].to_list() == [2, 1, 1]
+
+    main(["search", r"@x\.com", sources[0], "--memory-budget", "1MB"])
+    budgeted = pl.DataFrame(json.loads(capsys.readouterr().out))
+    assert budgeted["strategy"].to_list() == ["exact", "exact"]
+
+
+def test_profile_command_parquet_output(data_files, tmp_path):
+    """The profile command writes Parquet output."""
+    output = tmp_path / "profile.parquet"
+    code = main(
+        [
+            "profile",
+            str(data_files["orders_csv"]),
+            "--output",
+            str(output),
+            "--format",
+            "parquet",
+        ]
+    )
+    profile = pl.read_parquet(output)
+
+    assert code == 0
+    assert profile["column"].to_list() == ["customer_id", "note"]
+    assert profile["null_count"].to_list() == [0, 0]
+
+
+def test_unsupported_file(tmp_path, capsys):
+    """Unsupported inputs fail with an error message instead of a traceback."""
+    assert main(["profile", str(tmp_path / "data.txt")]) == 1
+    assert "Unsupported file type" in capsys.readouterr().err
@@ -0,0 +1,64 @@
+import polars as pl
+import pytest
+from polars_utils import extensions, register_extensions
+
+
+@pytest.fixture
+def orders():
+    """Create orders whose customer IDs partly match a customer table."""
+    return pl.LazyFrame(
+        {
+            "day": [1, 1, 1, 2, 2],
+            "customer_id": [1, 2, 7, 3, None],
+        }
+    )
+
+
+def test_match_rate_against_series(orders):
+    """Rates and orphans count non-null rows on both sides."""
+    register_extensions()
+    customers = pl.Series([1, 2, 3, 3, 4, None])
+
+    result = (
+        orders.select(pl.col("customer_id").polars_utils.match_rate(customers))
+        .collect()
+        .item()
+    )
+
+    assert result == {
+        "left_rows": 4,
+        "left_matched": 3,
+        "left_match_rate": 0.75,
+        "left_orphans": 1,
+        "right_rows": 5,
+        "right_matched": 4,
+        "right_match_rate": 0.8,
+        "right_orphans": 1,
+    }
+
+
+def test_match_rate_per_group_against_lazyframe(orders):
+    """A LazyFrame column is matched per group of the query."""
+    register_extensions()
+    customers = pl.LazyFrame({"id": [1, 2, 3, 4]})
+
+    result = (
+        orders.group_by("day")
+        .agg(pl.col("customer_id").polars_utils.match_rate(customers, "id"))
+        .sort("day")
+        .unnest("customer_id")
+        .collect()
+    )
+
+    assert result["left_matched"].to_list() == [2, 1]
+    assert result["left_orphans"].to_list() == [1, 0]
+    assert result["right_orphans"].to_list() == [2, 3]
+    assert result["right_match_rate"].to_list() == [0.5, 0.25]
+
+    with pytest.raises(ValueError, match="column"):
+        pl.col("customer_id").polars_utils.match_rate(customers)
+
+
+def test_histogram_expr_alias():
+    """The former namespace class name still refers to the namespace."""
+    assert extensions.HistogramExpr is extensions.PolarsUtilsExpr
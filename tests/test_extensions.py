@@ -278,6 +278,47 @@ def test_regex_search():
     assert results_matches.shape[0] == 1  # Only email column has matches
 
 
+def test_regex_search_nested_columns():
+    """Struct fields and list elements are searched and reported by path."""
+    df = pl.DataFrame(
+        {
+            "payload": [
+                {"user": {"email": "alice@test.com", "age": 30}, "tags": ["a@test.com"]},
+                {"user": {"email": "bob", "age": 41}, "tags": []},
+                None,
+            ],
+            "events": [
+                [{"to": "carol@test.com"}, {"to": "dave@test.com"}],
+                [{"to": "x"}],
+                None,
+            ],
+        }
+    )
+
+    register_extensions()
+    results = df.polars_utils.regex_search(r"@test\.com")
+    budgeted = df.polars_utils.regex_search(
+        r"@test\.com", matches_only=True, memory_budget="1MB"
+    )
+
+    assert results["column_name"].to_list() == [
+        "payload.user.email",
+        "payload.user.age",
+        "payload.tags[]",
+        "events[].to",
+    ]
+    events = results.row(3, named=True)
+    assert events["matches"] == ["carol@test.com", "dave@test.com"]
+    assert events["n"] == 2
+    assert events["percent"] == pytest.approx(1 / 3)  # Share of rows with a match
+    assert budgeted["column_name"].to_list() == [
+        "payload.user.email",
+        "payload.tags[]",
+        "events[].to",
+    ]
+    assert budgeted["strategy"].to_list() == ["exact"] * 3
+
+
 def test_histogram_creation():
     """Test histogram creation extension."""
     df = pl.DataFrame(
@@ -304,3 +345,50 @@ def test_histogram_creation():
 
     assert len(result) == len(df)
     assert all(isinstance(h, str) for h in result["histogram"])
+
+
+def test_histogram_includes_max_value():
+    """Test that the max value is counted in the last bin."""
+    df = pl.DataFrame({"values": [1, 2, 3, 4]})
+
+    register_extensions()
+
+    result = df.select(
+        pl.col("values").polars_utils.create_histogram(max_width=3, show_stats=False)
+    )
+
+    # Bins are [1, 2), [2, 3) and [3, 4], so the last bin holds 3 and 4
+    assert result.item() == "▄▄█"
+
+
+def test_join_analysis_filter_and_pages(sample_dfs, capsys):
+    """Test filtering and paged rendering of join analysis results."""
+    df1, df2 = sample_dfs
+    register_extensions()
+
+    df1.polars_utils.join_analysis(df2, min_match_pct=50, page_size=3)
+    captured = capsys.readouterr()
+
+    assert "(1/2)" in captured.out
+    assert "(2/2)" in captured.out
+    assert "value" not in captured.out
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".csv", ".json"])
+def test_join_analysis_export(sample_dfs, tmp_path, capsys, suffix):
+    """Test exporting join analysis results without rendering them."""
+    df1, df2 = sample_dfs
+    register_extensions()
+    path = tmp_path / f"joins{suffix}"
+
+    df1.polars_utils.join_analysis(df2, limit=3, export=path)
+    exported = {
+        ".parquet": pl.read_parquet,
+        ".csv": pl.read_csv,
+        ".json": pl.read_json,
+    }[suffix](path)
+
+    assert "Join Analysis Results" not in capsys.readouterr().out
+    assert exported.height == 3
+    assert exported.row(0, named=True)["left_column"] == "mixed"
+    assert exported["left_match_pct"][0] == 100.0
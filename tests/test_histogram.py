@@ -0,0 +1,127 @@
+import datetime
+import polars as pl
+import pytest
+from polars_utils import register_extensions
+from polars_utils.histogram import format_fixed
+
+
+def test_format_fixed_matches_python():
+    """Test that fixed-point formatting matches Python's format spec."""
+    values = [0.125, 0.375, -0.001, 2.675, 1.005, -3.5, 0.0, 123456.789, 10.0]
+    values += [2e20, -(2.0**60), float("nan"), float("inf"), float("-inf")]
+    result = pl.DataFrame({"x": values}).select(format_fixed(pl.col("x")))
+
+    assert result["x"].to_list() == [f"{v:.2f}" for v in values]
+
+
+def test_histogram_lazy_and_over_agree():
+    """Test that the histogram works in lazy group_by and over windows."""
+    df = pl.DataFrame(
+        {
+            "group": ["A"] * 6 + ["B"] * 4,
+            "values": [1, 2, 2, 3, 3, 3, 10, 20, 20, 40],
+        }
+    )
+
+    register_extensions()
+    hist = pl.col("values").polars_utils.create_histogram(max_width=5)
+
+    grouped = df.lazy().group_by("group").agg(hist).sort("group").collect()
+    windowed = df.with_columns(hist.over("group").alias("histogram"))
+
+    assert grouped.columns == ["group", "values"]
+    assert grouped["values"].to_list() == [
+        "▃▁▅▁█  [1.00, 3.00]",
+        "▄█▁▁▄  [10.00, 40.00]",
+    ]
+    assert windowed.group_by("group").agg(pl.col("histogram").first()).sort(
+        "group"
+    )["histogram"].equals(grouped["values"].alias("histogram"))
+
+
+@pytest.mark.parametrize(
+    "values, dtype, expected",
+    [
+        (list(range(121)), pl.Int8, "█▇▇▇█▇▇▇█▇▇▇█  [0.00, 120.00]"),
+        (list(range(250)), pl.UInt8, "█▇▇▇▇▇█▇▇▇▇▇█  [0.00, 249.00]"),
+        ([0, 2**61, 2**62], pl.Int64, "█▁▁▁▁▁█▁▁▁▁▁█  [0.00, 4611686018427387904.00]"),
+        ([1.0, float("nan"), 3.0], pl.Float64, "█▁▁▁▁▁▁▁▁▁▁▁█  [1.00, 3.00]"),
+    ],
+)
+def test_histogram_integer_dtypes_do_not_overflow(values, dtype, expected):
+    """Test that bins and labels are computed without integer overflow."""
+    register_extensions()
+    df = pl.DataFrame({"v": values}, schema={"v": dtype})
+
+    result = df.select(pl.col("v").polars_utils.create_histogram(max_width=13))
+
+    assert result.item() == expected
+
+
+def test_histogram_edge_cases():
+    """Test constant, empty and list inputs."""
+    register_extensions()
+
+    def hist(values, dtype=pl.Float64):
+        df = pl.DataFrame({"v": values}, schema={"v": dtype})
+        return df.select(
+            pl.col("v").polars_utils.create_histogram(max_width=4)
+        ).item()
+
+    assert hist([5.0, 5.0]) == "████  [5.00, 5.00]"
+    assert hist([None, None]) == ""
+    assert hist([[1, 2], [3, 4]], pl.List(pl.Int64)) == "████  [1.00, 4.00]"
+
+
+def test_histogram_kinds():
+    """Temporal, length and categorical histograms share the compact format."""
+    register_extensions()
+    df = pl.DataFrame(
+        {
+            "group": [1, 1, 1, 1, 2, 2],
+            "day": [datetime.date(2024, 1, d) for d in (1, 2, 2, 5, 3, 3)],
+            "wait": [datetime.timedelta(minutes=m) for m in (0, 30, 60, 60, 5, 5)],
+            "text": ["a", "bb", "bb", "dddd", "ccc", "b"],
+        }
+    )
+
+    def hist(column, kind, width=4):
+        return pl.col(column).polars_utils.create_histogram(max_width=width, kind=kind)
+
+    result = (
+        df.lazy()
+        .group_by("group")
+        .agg(
+            hist("day", "temporal"),
+            hist("wait", "temporal"),
+            hist("text", "length").alias("length"),
+            hist("text", "categorical", width=2),
+        )
+        .sort("group")
+        .collect()
+    )
+
+    assert result.row(0, named=True) == {
+        "group": 1,
+        "day": "▄█▁▄  [2024-01-01, 2024-01-05]",
+        "wait": "▄▁▄█  [PT0S, PT1H]",
+        "length": "▄█▁▄  [1, 4]",
+        "text": "█▄  [bb, a]",
+    }
+    # Ties between equally frequent values are ordered by value
+    assert result["text"][1] == "██  [b, ccc]"
+    # Fewer distinct values than bars are padded to the full width
+    assert df.select(hist("text", "categorical", width=6)).item() == "█▄▄▄▄   [bb, dddd]"
+
+    # Nanosecond timestamps spanning decades are binned without overflow
+    decades = pl.Series(
+        [datetime.datetime(year, 1, 1) for year in (1990, 2005, 2020)]
+    ).cast(pl.Datetime("ns"))
+    assert decades.to_frame("t").select(hist("t", "temporal", width=5)).item() == (
+        "█▁█▁█  [1990-01-01 00:00:00.000000000, 2020-01-01 00:00:00.000000000]"
+    )
+
+    with pytest.raises(ValueError, match="kind"):
+        hist("text", "words")
+    with pytest.raises(ValueError, match="bin_range"):
+        pl.col("day").polars_utils.create_histogram(bin_range=(0, 1), kind="temporal")
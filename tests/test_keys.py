@@ -0,0 +1,113 @@
+import polars as pl
+import pytest
+from polars_utils import key_scores, register_extensions
+from polars_utils import keys
+from polars_utils.keys import name_similarity
+from polars_utils.stats import frame_column_stats
+
+
+@pytest.fixture
+def key_dfs():
+    """Create frames with an ID column next to measures, text and flags."""
+    left = pl.DataFrame(
+        {
+            "customer_id": [1, 2, 3, 4, 5, 6],
+            "value": [10, 20, 30, 40, 50, 60],
+            "amount": [1.5, 2.5, 3.5, 4.5, 5.5, 6.5],
+            "comment": [
+                "ok",
+                "a long free text comment about the delivery being late again",
+                None,
+                "fine",
+                "the package arrived damaged and support never answered",
+                "ok",
+            ],
+            "active": [True, False, True, True, False, True],
+        }
+    )
+    right = pl.DataFrame(
+        {
+            "CustomerID": [3, 4, 5, 6, 7, 8],
+            "score": [30, 40, 50, 60, 70, 80],
+        }
+    )
+    return left, right
+
+
+def test_key_scores_rank_ids_above_measures(key_dfs):
+    """ID columns outscore measures, free text and flags, eagerly or lazily."""
+    left, _ = key_dfs
+    scores = dict(key_scores(left).select("column", "key_score").iter_rows())
+
+    assert scores["customer_id"] == max(scores.values())
+    assert scores["customer_id"] > 0.9
+    assert all(scores[c] < 0.5 for c in ["value", "amount", "comment", "active"])
+    assert key_scores(left.lazy()).equals(key_scores(left))
+
+
+def test_lazy_key_scores_scan_once(key_dfs, monkeypatch):
+    """A LazyFrame is collected once, choosing its distinct counts afterwards."""
+    left, _ = key_dfs
+    collects = []
+    collect = pl.LazyFrame.collect
+    monkeypatch.setattr(
+        pl.LazyFrame, "collect", lambda lf, **kw: collects.append(1) or collect(lf, **kw)
+    )
+
+    exact = key_scores(left.lazy())
+    monkeypatch.setattr(keys, "APPROX_DISTINCT_MIN_ROWS", 6)
+    approx = key_scores(left.lazy())
+
+    assert len(collects) == 2
+    assert approx.equals(exact)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_key_scores_skip_decimal_and_null_columns(key_dfs, lazy):
+    """Decimal and Null columns score 0 instead of failing the scan."""
+    left, right = key_dfs
+    register_extensions()
+    left = left.with_columns(
+        pl.col("amount").cast(pl.Decimal(10, 2)).alias("price_id"),
+        pl.lit(None).alias("empty_id"),
+    )
+
+    frame = left.lazy() if lazy else left
+    scores = dict(key_scores(frame).select("column", "key_score").iter_rows())
+    pruned = left.polars_utils.analyze_joins(right, min_key_score=0.5)
+
+    assert scores["price_id"] == scores["empty_id"] == 0.0
+    assert scores["customer_id"] > 0.9
+    assert [(r.left_column, r.right_column) for r in pruned] == [
+        ("customer_id", "CustomerID")
+    ]
+
+
+def test_name_similarity_ignores_case_and_separators():
+    """Names differing only in case and separators are identical."""
+    assert name_similarity("customer_id", "CustomerID") == 1.0
+    assert name_similarity("customer_id", "score") < 0.5
+
+
+def test_min_key_score_prunes_non_key_columns(key_dfs):
+    """With min_key_score only key-like columns are paired, best pair first."""
+    left, right = key_dfs
+    register_extensions()
+
+    all_pairs = left.polars_utils.analyze_joins(right)
+    pruned = left.polars_utils.analyze_joins(right, min_key_score=0.5)
+
+    assert len(all_pairs) == 10
+    assert [(r.left_column, r.right_column) for r in pruned] == [
+        ("customer_id", "CustomerID")
+    ]
+    assert pruned[0].matched_rows == 4
+
+    ordered = left.polars_utils._join_pairs(
+        right,
+        [],
+        frame_column_stats(left),
+        frame_column_stats(right),
+        promising_first=True,
+    )
+    assert ordered[0] == ("customer_id", "CustomerID")
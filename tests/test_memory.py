@@ -0,0 +1,123 @@
+import polars as pl
+import pytest
+from polars_utils import extensions, register_extensions
+from polars_utils.memory import MemoryTracker, parse_memory_budget
+
+
+@pytest.fixture
+def keys_df():
+    """Create a DataFrame with integer and string keys."""
+    n = 20_000
+    return pl.DataFrame(
+        {"key": list(range(n)), "email": [f"user{i}@test.com" for i in range(n)]}
+    )
+
+
+def test_parse_memory_budget():
+    """Test parsing budgets given as bytes or sizes with units."""
+    assert parse_memory_budget(1024) == 1024
+    assert parse_memory_budget("512MiB") == 512 * 1024**2
+    assert parse_memory_budget("1.5 GB") == 1_500_000_000
+    with pytest.raises(ValueError):
+        parse_memory_budget("lots")
+    with pytest.raises(ValueError):
+        parse_memory_budget(0)
+
+
+def test_analyze_joins_degrades_under_budget(keys_df):
+    """Exact matching falls back to sampling, then counting, as the budget shrinks."""
+    register_extensions()
+
+    exact = keys_df.polars_utils.analyze_joins(keys_df, memory_budget="64MiB")
+    sampled = keys_df.polars_utils.analyze_joins(keys_df, memory_budget="2MiB")
+    counted = keys_df.polars_utils.analyze_joins(keys_df, memory_budget=10_000)
+
+    assert {r.strategy for r in exact} == {"exact"}
+    assert {r.strategy for r in sampled} == {"sample"}
+    assert {r.strategy for r in counted} == {"count_only"}
+
+    key_pair = next(r for r in sampled if r.left_column == r.right_column == "key")
+    assert key_pair.left_matched_rows == 20_000
+    assert key_pair.left_unique_values == pytest.approx(20_000, rel=0.05)
+    assert all(r.matched_rows == 0 for r in counted)
+    assert all(r.left_null_count == 0 for r in counted)
+
+    assert 0 < exact.peak_memory_bytes < 64 * 1024**2
+    assert exact.memory_budget_bytes == 64 * 1024**2
+    assert keys_df.polars_utils.analyze_joins(keys_df).peak_memory_bytes is None
+
+
+def test_memory_tracker_counts_held_bytes():
+    """Peak usage is the most bytes held at once, against the budget headroom."""
+    tracker = MemoryTracker(1000)
+    tracker.retain(300)
+    tracker.retain(200)
+    tracker.release(300)
+    tracker.retain(100)
+
+    assert (tracker.used_bytes, tracker.peak_bytes) == (300, 500)
+    assert tracker.fits(500) and not tracker.fits(501)
+
+
+def test_failed_pairs_have_their_own_strategy(keys_df, monkeypatch):
+    """Pairs whose analysis raised aren't reported as exact results."""
+    register_extensions()
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(extensions, "join_strategy", fail)
+    results = keys_df.polars_utils.analyze_joins(keys_df, memory_budget="64MiB")
+
+    assert {r.strategy for r in results} == {"failed"}
+    assert {r.error for r in results} == {"boom"}
+    assert results.peak_memory_bytes == 0
+
+
+def test_regex_search_under_budget(keys_df):
+    """Match lists are truncated or dropped while counts stay exact."""
+    register_extensions()
+
+    full = keys_df.polars_utils.regex_search(r"user1\d*@", matches_only=True)
+    truncated = keys_df.polars_utils.regex_search(
+        r"user1\d*@", matches_only=True, memory_budget="100KB"
+    )
+    counted = keys_df.polars_utils.regex_search(
+        r"user1\d*@", matches_only=True, memory_budget=100
+    )
+
+    assert "strategy" not in full.columns
+    assert truncated["strategy"].to_list() == ["truncated"]
+    assert counted["strategy"].to_list() == ["count_only"]
+    assert truncated["n"].to_list() == counted["n"].to_list() == full["n"].to_list()
+    assert 0 < truncated["matches"].list.len().item() < full["n"].item()
+    assert counted["matches"].list.len().item() == 0
+    assert truncated["peak_memory_bytes"].item() > 0
+
+
+def test_nested_regex_search_under_budget(keys_df):
+    """Matches of nested leaves are truncated while counts stay exact."""
+    register_extensions()
+    nested = keys_df.select(pl.struct("email").alias("payload"))
+
+    full = nested.polars_utils.regex_search(r"user1\d*@", matches_only=True)
+    truncated = nested.polars_utils.regex_search(
+        r"user1\d*@", matches_only=True, memory_budget="100KB"
+    )
+
+    assert truncated["column_name"].to_list() == ["payload.email"]
+    assert truncated["strategy"].to_list() == ["truncated"]
+    assert truncated["n"].to_list() == full["n"].to_list()
+    assert 0 < truncated["matches"].list.len().item() < full["n"].item()
+    assert truncated["matches"].item().to_list() == (
+        full["matches"].item().head(truncated["matches"].list.len().item()).to_list()
+    )
+
+
+def test_regex_search_budget_rejects_index(keys_df):
+    """A memory budget can't be combined with a search index."""
+    register_extensions()
+    index = keys_df.polars_utils.build_search_index()
+
+    with pytest.raises(ValueError, match="memory_budget"):
+        keys_df.polars_utils.regex_search("user", index=index, memory_budget="1GB")
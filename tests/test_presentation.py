@@ -0,0 +1,46 @@
+import subprocess
+import sys
+import polars as pl
+import pytest
+from polars_utils import extensions, presentation, register_extensions
+
+# Seconds `import polars_utils` may add on top of an already imported polars
+IMPORT_TIME_BUDGET = 0.25
+
+IMPORT_CHECK = """
+import sys, time
+import polars
+start = time.perf_counter()
+import polars_utils
+elapsed = time.perf_counter() - start
+print(elapsed, any(m == "rich" or m.startswith("rich.") for m in sys.modules))
+"""
+
+
+def test_import_is_headless_and_within_budget():
+    """Importing polars_utils doesn't load rich and stays within the time budget."""
+    out = subprocess.run(
+        [sys.executable, "-c", IMPORT_CHECK], capture_output=True, text=True, check=True
+    ).stdout.split()
+
+    assert out[1] == "False"
+    assert float(out[0]) < IMPORT_TIME_BUDGET
+
+
+def test_analysis_without_rich(monkeypatch, capsys):
+    """Analysis runs without progress output when rich is unavailable."""
+    register_extensions()
+    monkeypatch.setattr(presentation, "rich_available", lambda: False)
+    df = pl.DataFrame({"id": [1, 2, 3]})
+
+    results = df.polars_utils.analyze_joins(df)
+
+    assert results[0].matched_rows == 3
+    assert capsys.readouterr().out == ""
+    with pytest.raises(ImportError, match="rich"):
+        df.polars_utils.join_analysis(df)
+
+
+def test_display_results_still_importable_from_extensions():
+    """The old import location of display_results keeps working."""
+    assert extensions.display_results is presentation.display_results
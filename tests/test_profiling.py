@@ -0,0 +1,108 @@
+import datetime
+from decimal import Decimal
+import polars as pl
+import pytest
+from polars_utils import profiling, register_extensions
+
+
+@pytest.fixture
+def quality_df():
+    """Create a DataFrame with mixed dtypes and missing values."""
+    return pl.DataFrame(
+        {
+            "id": [1, 2, 3, None],
+            "code": ["AB-12", "CD-34", None, "EF-5"],
+            "amount": ["10", "2.5", "n/a", None],
+            "day": [datetime.date(2024, 1, d) for d in range(1, 5)],
+            "wait": [datetime.timedelta(hours=h) if h else None for h in (1, 2, 0, 36)],
+            "tags": [["a"], ["b"], None, ["a"]],
+        }
+    )
+
+
+def test_profile_statistics(quality_df):
+    """Test per-column profile statistics."""
+    register_extensions()
+
+    profile = quality_df.polars_utils.profile()
+    rows = {row["column"]: row for row in profile.iter_rows(named=True)}
+
+    assert profile["column"].to_list() == quality_df.columns
+    assert rows["id"]["null_count"] == 1
+    assert rows["id"]["null_fraction"] == 0.25
+    assert rows["id"]["mean"] == 2.0
+    assert (rows["id"]["min"], rows["id"]["max"]) == ("1", "3")
+    assert rows["code"]["top_pattern"] == "AA-99"
+    assert (rows["code"]["min_length"], rows["code"]["max_length"]) == (4, 5)
+    assert rows["amount"]["numeric_like_fraction"] == pytest.approx(2 / 3)
+    assert rows["day"]["max"] == "2024-01-04"
+    assert (rows["wait"]["min"], rows["wait"]["max"]) == ("PT1H", "P1DT12H")
+    assert rows["tags"]["n_unique"] == 2
+    assert rows["tags"]["min"] is None
+    assert not profile["n_unique_approx"].any()
+
+
+def test_lazy_profile_matches_eager(quality_df):
+    """The LazyFrame profile matches the DataFrame profile."""
+    register_extensions()
+
+    assert quality_df.lazy().polars_utils.profile().equals(
+        quality_df.polars_utils.profile()
+    )
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize(
+    "values, dtype, n_unique",
+    [
+        ([Decimal("1.50"), Decimal("1.50"), Decimal("2.25")], pl.Decimal(10, 2), 2),
+        ([[1, 2], [1, 2], [3, 4]], pl.Array(pl.Int64, 2), 2),
+        ([None, None, None], pl.Null, 0),
+    ],
+)
+def test_profile_counts_distinct_values_of_any_dtype(values, dtype, n_unique, lazy):
+    """Distinct counts work for Decimal, Array and Null columns."""
+    register_extensions()
+    df = pl.DataFrame({"x": values}, schema={"x": dtype})
+    frame = df.lazy() if lazy else df
+
+    for approx_distinct in [None, True, False]:
+        profile = frame.polars_utils.profile(approx_distinct=approx_distinct)
+        assert profile["n_unique"].item() == n_unique
+
+
+def test_lazy_profile_scans_once(quality_df, monkeypatch):
+    """A LazyFrame is collected once and picks its distinct counts afterwards."""
+    register_extensions()
+    collects = []
+    collect = pl.LazyFrame.collect
+    monkeypatch.setattr(
+        pl.LazyFrame, "collect", lambda lf, **kw: collects.append(1) or collect(lf, **kw)
+    )
+
+    exact = quality_df.lazy().polars_utils.profile()
+    monkeypatch.setattr(profiling, "APPROX_DISTINCT_MIN_ROWS", 4)
+    approx = quality_df.lazy().polars_utils.profile()
+
+    assert len(collects) == 2
+    assert not exact["n_unique_approx"].any()
+    assert approx["n_unique_approx"].to_list() == [True] * 5 + [False]
+    assert approx["n_unique"].equals(exact["n_unique"])
+
+
+def test_profile_histogram_and_approx(quality_df):
+    """Test the optional histogram column and approximate distinct counts."""
+    register_extensions()
+
+    profile = quality_df.polars_utils.profile(histogram=True, approx_distinct=True)
+    histograms = dict(zip(profile["column"], profile["histogram"]))
+
+    assert histograms["id"].endswith("[1.00, 3.00]")
+    assert histograms["day"].endswith("[2024-01-01, 2024-01-04]")
+    assert histograms["code"] is None
+
+    with_nan = pl.DataFrame({"ratio": [0.5, float("nan"), 1.5]})
+    histogram = with_nan.polars_utils.profile(histogram=True)["histogram"].item()
+    assert histogram.endswith("[0.50, 1.50]")
+    assert profile.filter(pl.col("column") == "id")["n_unique_approx"].item()
+    assert not profile.filter(pl.col("column") == "tags")["n_unique_approx"].item()
@@ -0,0 +1,115 @@
+import warnings
+import polars as pl
+import pytest
+from polars_utils import register_extensions, search_index
+from polars_utils.search_index import required_literals, pattern_trigrams
+
+
+@pytest.fixture
+def people_df():
+    """Create a sample DataFrame for search tests."""
+    return pl.DataFrame(
+        {
+            "id": [1, 2, 3, 4, None],
+            "name": ["Alice", "Bob", "Charlie", "David", None],
+            "email": [
+                "alice@test.com",
+                "bob@example.org",
+                "charlie@test.com",
+                "david@test.net",
+                "eve@test.com",
+            ],
+        }
+    )
+
+
+def test_required_literals():
+    """Test extraction of literal runs every match must contain."""
+    assert required_literals(r"test\.com") == ["test.com"]
+    assert required_literals("test.com") == ["test", "com"]
+    assert required_literals("^ab(cd)+e?fgh") == ["ab", "cd", "fgh"]
+    assert required_literals("(?i)alice") is None
+    assert pattern_trigrams("foo|barbaz") is None
+    assert pattern_trigrams("ab") is None
+
+
+def test_required_literals_follow_rust_syntax():
+    """Rust-only constructs parse without warnings; unsupported ones don't narrow."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert required_literals("[[:alpha:]]abc") == ["abc"]
+        assert required_literals("a[[a-z]--[aeiou]]bcd") == ["a", "bcd"]
+        assert required_literals(r"\x41\x{42}C\pL") == ["ABC"]
+        assert required_literals("(?<name>ab)c") == ["abc"]
+        assert required_literals("(?=abc)") is None
+        assert required_literals("a(?i)bc") is None
+
+
+def test_indexed_search_matches_full_scan(people_df):
+    """Indexed searches return exactly the same results as full scans."""
+    register_extensions()
+    index = people_df.polars_utils.build_search_index()
+
+    patterns = [r"test\.com", "test.com", "^a", "li", "[0-9]", "nomatch", "3"]
+    for pattern in patterns + ["[[:alpha:]]abc", "[[:alpha:]]ice"]:
+        for matches_only in [False, True]:
+            expected = people_df.polars_utils.regex_search(pattern, matches_only)
+            actual = people_df.polars_utils.regex_search(
+                pattern, matches_only, index=index
+            )
+            assert actual.equals(expected), pattern
+
+
+def test_indexed_search_matches_full_scan_on_nested_columns(people_df):
+    """Struct and List columns are searched by field path with an index too."""
+    register_extensions()
+    df = people_df.select(
+        "id",
+        pl.struct("name", "email").alias("person"),
+        pl.concat_list("name", "email").alias("aliases"),
+    )
+    index = df.polars_utils.build_search_index()
+
+    for pattern in [r"test\.com", "li", "nomatch"]:
+        for matches_only in [False, True]:
+            expected = df.polars_utils.regex_search(pattern, matches_only)
+            actual = df.polars_utils.regex_search(pattern, matches_only, index=index)
+            assert actual.equals(expected), pattern
+
+    found = df.polars_utils.regex_search("li", matches_only=True, index=index)
+    assert found["column_name"].to_list() == ["person.name", "person.email", "aliases[]"]
+
+
+def test_index_narrows_candidates(people_df):
+    """Test that the index only keeps rows containing all required trigrams."""
+    register_extensions()
+    index = people_df.polars_utils.build_search_index()
+
+    assert index.candidate_rows("email", r"test\.com").to_list() == [0, 2, 4]
+    assert index.candidate_rows("email", "zzz").to_list() == []
+    assert index.candidate_rows("email", "[a-z]") is None
+    assert index.nbytes > 0
+    assert index.build_seconds >= 0
+    assert index.build_peak_bytes >= index.nbytes
+    assert set(index.summary()["column_name"]) == {"id", "name", "email"}
+
+
+def test_index_built_in_chunks_matches_single_chunk(people_df, monkeypatch):
+    """Chunked builds keep global, sorted row numbers in every posting list."""
+    register_extensions()
+    whole = people_df.polars_utils.build_search_index()
+    monkeypatch.setattr(search_index, "BUILD_CHUNK_TRIGRAMS", 20)
+    chunked = people_df.polars_utils.build_search_index()
+
+    for column, postings in whole.postings.items():
+        assert chunked.postings[column].sort("trigram").equals(postings.sort("trigram"))
+    assert chunked.candidate_rows("email", r"test\.com").to_list() == [0, 2, 4]
+
+
+def test_index_rejects_other_frame(people_df):
+    """Test that an index can't be used with a different DataFrame."""
+    register_extensions()
+    index = people_df.polars_utils.build_search_index()
+
+    with pytest.raises(ValueError):
+        people_df.head(2).polars_utils.regex_search("test", index=index)
@@ -0,0 +1,108 @@
+import random
+import polars as pl
+import pytest
+from polars_utils import register_extensions
+from polars_utils.sketches import HistogramSketch, QuantileSketch
+
+
+@pytest.fixture
+def batches():
+    """Create reproducible batches of grouped values."""
+    rng = random.Random(42)
+    return [
+        pl.DataFrame(
+            {
+                "group": [rng.choice("AB") for _ in range(200)],
+                "values": [rng.gauss(0, 1) for _ in range(200)],
+            }
+        )
+        for _ in range(3)
+    ]
+
+
+def test_merged_histogram_matches_create_histogram(batches):
+    """Merging per-batch sketches renders the same string as one histogram."""
+    register_extensions()
+    bin_range = (-4.0, 4.0)
+
+    merged = HistogramSketch(*bin_range)
+    for batch in batches:
+        merged = merged.merge(HistogramSketch.from_series(batch["values"], bin_range))
+
+    expected = pl.concat(batches).select(
+        pl.col("values").polars_utils.create_histogram(bin_range=bin_range)
+    )
+    assert merged.render() == expected.item()
+    assert merged.count == 600
+
+
+def test_grouped_sketches_share_edges(batches):
+    """Per-group sketches merge across batches on shared bin edges."""
+    register_extensions()
+    bin_range = (-4, 4)
+
+    merged = {}
+    for batch in batches:
+        for key, sketch in HistogramSketch.from_groups(
+            batch, "values", "group", bin_range, n_bins=10
+        ).items():
+            merged[key] = merged[key].merge(sketch) if key in merged else sketch
+
+    expected = (
+        pl.concat(batches)
+        .group_by("group")
+        .agg(
+            pl.col("values").polars_utils.create_histogram(
+                max_width=10, bin_range=bin_range
+            )
+        )
+    )
+    for key, hist in expected.iter_rows():
+        assert merged[key].render() == hist
+
+
+def test_unsigned_columns_below_fixed_edges():
+    """Unsigned values below an integer lower edge land in the first bin."""
+    register_extensions()
+    df = pl.DataFrame(
+        {"group": ["A", "A", "A"], "values": [5, 12, 18]},
+        schema={"group": pl.Utf8, "values": pl.UInt32},
+    )
+
+    hist = df.select(
+        pl.col("values").polars_utils.create_histogram(
+            max_width=4, bin_range=(10, 20), show_stats=False
+        )
+    )
+    sketch = HistogramSketch.from_groups(df, "values", "group", (10, 20), n_bins=4)
+
+    assert hist.item() == "█▁▁▄"
+    assert sketch["A"].counts == [2, 0, 0, 1]
+
+
+def test_histogram_sketch_validation():
+    """Test invalid edges and merging sketches with different edges."""
+    with pytest.raises(ValueError):
+        HistogramSketch(1.0, 1.0)
+    with pytest.raises(ValueError):
+        HistogramSketch(0, 1).merge(HistogramSketch(0, 2))
+    assert HistogramSketch(0, 1).render() == ""
+
+
+def test_quantile_sketch_accuracy_and_merge():
+    """Merged quantile estimates stay within the relative accuracy."""
+    rng = random.Random(0)
+    values = [rng.lognormvariate(0, 1) * rng.choice([-1, 1]) for _ in range(3000)] + [0.0] * 10
+    sketches = [
+        QuantileSketch.from_series(pl.Series(values[i::3]), relative_accuracy=0.01)
+        for i in range(3)
+    ]
+    merged = sketches[0].merge(sketches[1]).merge(sketches[2])
+
+    ordered = sorted(values)
+    for q in [0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0]:
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert merged.quantile(q) == pytest.approx(exact, rel=0.011, abs=1e-12)
+
+    assert merged.count == len(values)
+    assert QuantileSketch().quantile(0.5) is None
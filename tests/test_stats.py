@@ -0,0 +1,97 @@
+import datetime
+import polars as pl
+import pytest
+from polars_utils import (
+    ColumnStats,
+    parquet_column_stats,
+    profile_parquet,
+    register_extensions,
+)
+from polars_utils.stats import frame_column_stats
+
+
+@pytest.fixture
+def stats_df():
+    """Create a DataFrame covering metadata-friendly and nested columns."""
+    return pl.DataFrame(
+        {
+            "id": [5, 1, None, 9, 3, 7],
+            "name": ["b", None, "a", "d", "c", None],
+            "day": [datetime.date(2024, 1, d) for d in range(1, 7)],
+            "wait": [datetime.timedelta(minutes=m) for m in (5, 90, 1, 30, 45, 60)],
+            "score": [1.5, float("nan"), 2.0, None, 0.5, 3.0],
+            "tags": [["x"], None, ["y"], [], None, ["z"]],
+        }
+    )
+
+
+def test_parquet_stats_match_scan(stats_df, tmp_path):
+    """Footer statistics agree with a scan, falling back where they are unusable."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "data.parquet"
+    stats_df.write_parquet(path, row_group_size=2)
+
+    stats = parquet_column_stats(path)
+    scanned = frame_column_stats(stats_df)
+
+    assert list(stats) == stats_df.columns
+    for name in stats_df.columns:
+        assert stats[name].total_rows == scanned[name].total_rows == 6
+        assert stats[name].null_count == scanned[name].null_count
+        assert (stats[name].min_value, stats[name].max_value) == (
+            scanned[name].min_value,
+            scanned[name].max_value,
+        )
+    assert all(stats[name].from_metadata for name in ("id", "day", "wait"))
+    assert stats["wait"].max_value == datetime.timedelta(minutes=90)
+    # NaN float bounds and nested columns are scanned
+    assert not stats["score"].from_metadata
+    assert not stats["tags"].from_metadata
+
+
+def test_parquet_stats_without_statistics(stats_df, tmp_path):
+    """Files written without statistics are profiled by scanning."""
+    path = tmp_path / "nostats.parquet"
+    stats_df.write_parquet(path, statistics=False)
+
+    profile = profile_parquet(path)
+
+    assert not profile["from_metadata"].any()
+    assert profile.filter(pl.col("column") == "name").row(0, named=True) == {
+        "column": "name",
+        "dtype": "String",
+        "total_rows": 6,
+        "null_count": 2,
+        "null_fraction": pytest.approx(1 / 3),
+        "min": "a",
+        "max": "d",
+        "from_metadata": False,
+    }
+
+
+def test_ranges_overlap():
+    """Only provably disjoint ranges are rejected."""
+    low = ColumnStats(pl.Int64(), 3, 0, 1, 3)
+    high = ColumnStats(pl.Int64(), 3, 0, 4, 6)
+    unknown = ColumnStats(pl.Int64(), 3, 3)
+
+    assert not low.ranges_overlap(high)
+    assert low.ranges_overlap(ColumnStats(pl.Int64(), 3, 0, 3, 4))
+    assert low.ranges_overlap(unknown)
+
+
+def test_analyze_joins_rejects_disjoint_ranges():
+    """Disjoint columns are reported as non-matching with correct counts."""
+    register_extensions()
+    left = pl.DataFrame({"id": [1, 2, 3, None]})
+    right = pl.DataFrame({"id": [10, 11, 11], "ref": [2, 3, 4]})
+
+    results = {
+        r.right_column: r for r in left.polars_utils.analyze_joins(right)
+    }
+
+    assert results["id"].matched_rows == 0
+    assert results["id"].left_unique_values == 3
+    assert results["id"].right_unique_values == 2
+    assert results["id"].left_null_count == 1
+    assert results["ref"].left_matched_rows == 2